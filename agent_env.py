@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Environnement pour agents (API de style Gym) au-dessus de GameService
+reset(seed) / step(action) sans pygame ni événements, observations NumPy
+"""
+
+import argparse
+import contextlib
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import config
+import rng
+from entities import BossRoom, CombatRoom, EnemyRoom, HealingRoom, PowerUpRoom, UpgradeRoom
+from services import GameService, HeadlessGameFactory
+
+# Actions: avancer attaque en combat et quitte une salle spéciale
+ACTION_AVANCER = 0
+ACTION_QUITTER = 1
+NOMBRE_ACTIONS = 2
+
+# Codes des types de salles dans l'observation (ordre de PROBABILITES_SALLES)
+CODES_SALLES = {EnemyRoom: 0, BossRoom: 1, HealingRoom: 2, UpgradeRoom: 3, PowerUpRoom: 4}
+
+# Indices de l'observation
+OBS_PV = 0
+OBS_PV_MAX = 1
+OBS_ATTAQUE = 2
+OBS_PV_ENNEMI = 3
+OBS_ATTAQUE_ENNEMI = 4
+OBS_TYPE_SALLE = 5
+OBS_COMBO = 6
+OBS_SALLE = 7
+TAILLE_OBSERVATION = 8
+
+Transition = Tuple[np.ndarray, int, bool, bool, Dict[str, Any]]
+
+class RoguelikeEnv:
+    """Partie de Roguelike pilotée pas à pas par un agent
+
+    Un pas de combat est un tour (le joueur frappe, l'ennemi riposte s'il
+    survit); un pas en salle spéciale passe à la salle suivante, l'effet
+    de la salle étant appliqué à l'arrivée. La récompense est le gain de
+    score du pas. Le combo compte les frappes consécutives du combat en
+    cours: il est observé mais, comme dans la simulation, sans effet sur
+    les dégâts. Les tirages passent par le service rng partagé: reset(seed)
+    reproduit la partie.
+    """
+
+    def __init__(self, difficulty: int = 1):
+        if difficulty not in config.DIFFICULTES:
+            raise ValueError(f"Difficulté inconnue: {difficulty}")
+        self.difficulty = difficulty
+        self._game_service = GameService(HeadlessGameFactory())
+        self._player = None
+        self._room = None
+        # Salle courante pré-classée à l'entrée: pas d'isinstance à chaque pas
+        self._enemy = None
+        self._boss = False
+        self._code_salle = 0
+        self._combo = 0
+        self._termine = True
+
+    @property
+    def game_service(self) -> GameService:
+        return self._game_service
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Démarre une nouvelle partie et retourne (observation, info)"""
+        if seed is not None:
+            rng.seed(seed)
+        self._game_service.start_game(self.difficulty)
+        self._player = self._game_service.get_player()
+        self._termine = False
+        self._entrer_salle_suivante()
+        return self.observation(), {}
+
+    def step(self, action: int) -> Transition:
+        """Joue une action, retourne (observation, récompense, terminé, tronqué, info)"""
+        if self._termine:
+            raise RuntimeError("Partie terminée: appelez reset()")
+
+        player = self._player
+        score = player.score
+
+        if action == ACTION_QUITTER:
+            self._termine = True
+            return self.observation(), 0, True, True, {'victoire': False}
+        if action != ACTION_AVANCER:
+            raise ValueError(f"Action invalide: {action}")
+
+        enemy = self._enemy
+        if enemy is not None:
+            player.attaquer(enemy)
+            self._combo += 1
+            if enemy.est_vivant():
+                enemy.attaquer(player)
+                player.survivre_tour()
+            elif self._boss:
+                player.vaincre_boss()
+            else:
+                player.tuer_ennemi()
+            fini = not enemy.est_vivant()
+        else:
+            fini = True
+
+        if self._game_service.is_game_over():
+            self._termine = fini or not player.est_vivant()
+        if fini and not self._termine:
+            self._entrer_salle_suivante()
+
+        info = {'victoire': self._game_service.is_victory()} if self._termine else {}
+        return self.observation(), player.score - score, self._termine, False, info
+
+    def _entrer_salle_suivante(self) -> None:
+        """Génère la salle suivante et applique l'effet d'une salle spéciale"""
+        room = self._room = self._game_service.generate_next_room()
+        self._combo = 0
+        self._code_salle = CODES_SALLES[type(room)]
+        self._boss = isinstance(room, BossRoom)
+        if isinstance(room, CombatRoom):
+            self._enemy = room.ennemi
+        else:
+            self._enemy = None
+            # Les salles affichent leurs messages avec print: on les rend muettes
+            with contextlib.redirect_stdout(None):
+                room.entrer(self._player)
+
+    def observation(self) -> np.ndarray:
+        """Observation compacte (voir les indices OBS_*) en entiers 32 bits"""
+        player = self._player
+        enemy = self._enemy
+        if enemy is not None:
+            pv_ennemi, attaque_ennemi = enemy.pv_actuels, enemy.attaque
+        else:
+            pv_ennemi = attaque_ennemi = 0
+        return np.array((player.pv_actuels, player.pv_max, player.attaque, pv_ennemi, attaque_ennemi,
+                         self._code_salle, self._combo, self._game_service.get_salle_actuelle()),
+                        dtype=np.int32)
+
+def mesurer_debit(pas: int = 200000, difficulty: int = 1, seed: int = 0) -> Dict[str, float]:
+    """Joue des parties avec l'action avancer et mesure le nombre de pas par seconde"""
+    env = RoguelikeEnv(difficulty)
+    env.reset(seed)
+    parties = 0
+    victoires = 0
+    debut = time.perf_counter()
+    for _ in range(pas):
+        _, _, termine, _, info = env.step(ACTION_AVANCER)
+        if termine:
+            parties += 1
+            victoires += info['victoire']
+            env.reset()
+    duree = time.perf_counter() - debut
+    return {
+        'pas': pas,
+        'parties': parties,
+        'taux_victoire': victoires / parties if parties else 0.0,
+        'duree': duree,
+        'pas_par_seconde': pas / duree if duree > 0 else float('inf')
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Mesure le débit de l'environnement"""
+    parser = argparse.ArgumentParser(description="Débit de l'environnement pour agents")
+    parser.add_argument("-n", "--pas", type=int, default=200000, help="nombre de pas")
+    parser.add_argument("-d", "--difficulte", type=int, choices=sorted(config.DIFFICULTES), default=1)
+    parser.add_argument("--seed", type=int, default=0, help="graine")
+    args = parser.parse_args(argv)
+
+    resultat = mesurer_debit(args.pas, args.difficulte, args.seed)
+    print(f"{resultat['pas']} pas, {resultat['parties']} parties "
+          f"(victoires: {resultat['taux_victoire']:.1%}) en {resultat['duree']:.2f}s")
+    print(f"Débit: {resultat['pas_par_seconde']:.0f} pas/s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Balayage d'équilibrage multi-cœurs des paramètres de config.py
+Chaque cellule de la grille est jouée par lots graines sur tous les cœurs,
+les lots terminés sont ajoutés au fichier de résultats pour pouvoir reprendre
+"""
+
+import argparse
+import copy
+import hashlib
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import config
+from simulation import parametres_config, simuler_parties
+
+# Axe spécial: nombre de salles de la difficulté jouée (DIFFICULTES[d]["salles"])
+AXE_SALLES = "SALLES"
+AXE_DIFFICULTE = "difficulte"
+
+# Quantile de la loi normale pour des intervalles de confiance à 95%
+Z_95 = 1.959964
+
+def construire_grille(axes: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Produit cartésien des axes, une cellule par combinaison"""
+    axes = dict(axes)
+    axes.setdefault(AXE_DIFFICULTE, [1])
+    noms = sorted(axes)
+    return [dict(zip(noms, valeurs)) for valeurs in itertools.product(*(axes[n] for n in noms))]
+
+def cle_cellule(cellule: Dict[str, Any]) -> str:
+    """Clé canonique et stable d'une cellule (sert aussi à la reprise)"""
+    return json.dumps(cellule, sort_keys=True, ensure_ascii=False)
+
+def graine_lot(seed: int, cle: str, lot: int) -> int:
+    """Graine d'un lot, indépendante de l'ordre d'exécution et du nombre de cœurs"""
+    empreinte = hashlib.sha256(f"{seed}:{cle}:{lot}".encode()).digest()
+    return int.from_bytes(empreinte[:8], "little")
+
+def _surcharges(cellule: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """Traduit une cellule en difficulté + constantes de config à remplacer"""
+    surcharges = {k: v for k, v in cellule.items() if k not in (AXE_DIFFICULTE, AXE_SALLES)}
+    difficulty = cellule[AXE_DIFFICULTE]
+    if AXE_SALLES in cellule:
+        difficultes = copy.deepcopy(config.DIFFICULTES)
+        difficultes[difficulty]["salles"] = cellule[AXE_SALLES]
+        surcharges["DIFFICULTES"] = difficultes
+    return difficulty, surcharges
+
+def executer_lot(cellule: Dict[str, Any], lot: int, parties: int, seed: int,
+                 taille_lot: int) -> Dict[str, Any]:
+    """Joue un lot de parties pour une cellule (exécuté dans un processus)
+
+    La graine et la taille des lots du balayage sont enregistrées avec le
+    lot: un lot n'est repris que par un balayage identique.
+    """
+    cle = cle_cellule(cellule)
+    difficulty, surcharges = _surcharges(cellule)
+    with parametres_config(**surcharges):
+        resultats = simuler_parties(parties, difficulty, seed=graine_lot(seed, cle, lot))
+
+    scores = [r['score'] for r in resultats]
+    return {
+        'cellule': cellule,
+        'lot': lot,
+        'seed': seed,
+        'taille_lot': taille_lot,
+        'parties': parties,
+        'victoires': sum(1 for r in resultats if r['victoire']),
+        'somme_scores': sum(scores),
+        'somme_carres_scores': sum(s * s for s in scores),
+        'somme_salles': sum(r['salles'] for r in resultats)
+    }
+
+def charger_resultats(chemin: str) -> List[Dict[str, Any]]:
+    """Charge les lots déjà terminés (une ligne JSON par lot)"""
+    lignes = []
+    if not os.path.exists(chemin):
+        return lignes
+    with open(chemin, 'r', encoding='utf-8') as f:
+        for ligne in f:
+            try:
+                lignes.append(json.loads(ligne))
+            except json.JSONDecodeError:
+                # Dernière ligne tronquée par une interruption: le lot sera rejoué
+                continue
+    return lignes
+
+def intervalle_wilson(succes: int, n: int, z: float = Z_95) -> Tuple[float, float]:
+    """Intervalle de confiance de Wilson pour une proportion"""
+    if n == 0:
+        return 0.0, 1.0
+    p = succes / n
+    denominateur = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denominateur
+    marge = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominateur
+    return max(0.0, centre - marge), min(1.0, centre + marge)
+
+def agreger(lots: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fusionne les lots par cellule avec intervalles de confiance"""
+    cellules: Dict[str, Dict[str, Any]] = {}
+    for lot in lots:
+        cle = cle_cellule(lot['cellule'])
+        cumul = cellules.setdefault(cle, {
+            'cellule': lot['cellule'], 'lots': 0, 'parties': 0, 'victoires': 0,
+            'somme_scores': 0, 'somme_carres_scores': 0, 'somme_salles': 0
+        })
+        cumul['lots'] += 1
+        for champ in ('parties', 'victoires', 'somme_scores', 'somme_carres_scores', 'somme_salles'):
+            cumul[champ] += lot[champ]
+
+    table = []
+    for cumul in cellules.values():
+        n = cumul['parties']
+        moyenne = cumul['somme_scores'] / n
+        variance = max(0.0, cumul['somme_carres_scores'] / n - moyenne * moyenne)
+        marge = Z_95 * math.sqrt(variance / n)
+        table.append({
+            'cellule': cumul['cellule'],
+            'lots': cumul['lots'],
+            'parties': n,
+            'taux_victoire': cumul['victoires'] / n,
+            'ic_victoire': intervalle_wilson(cumul['victoires'], n),
+            'score_moyen': moyenne,
+            'ic_score': (moyenne - marge, moyenne + marge),
+            'salles_moyennes': cumul['somme_salles'] / n
+        })
+    return sorted(table, key=lambda ligne: cle_cellule(ligne['cellule']))
+
+def executer_balayage(axes: Dict[str, List[Any]], chemin: str, parties: int = 10000,
+                      taille_lot: int = 1000, seed: int = 0, workers: Optional[int] = None,
+                      progression: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+    """Exécute (ou reprend) un balayage et retourne la table agrégée
+
+    Les lots déjà présents dans le fichier ne sont pas rejoués; chaque lot
+    terminé y est ajouté immédiatement, dans l'ordre d'arrivée. Un lot du
+    fichier n'est repris que s'il a la graine, la taille de lot et le nombre
+    de parties attendus pour son indice: les lots d'un balayage différent
+    ne sont ni comptés ni fusionnés, et un lot présent deux fois ne compte
+    qu'une fois.
+    """
+    if parties <= 0 or taille_lot <= 0:
+        raise ValueError("Le nombre de parties et la taille des lots doivent être positifs")
+
+    grille = construire_grille(axes)
+    for cellule in grille:
+        # Valide les axes avant de lancer les processus
+        with parametres_config(**_surcharges(cellule)[1]):
+            pass
+
+    # (cellule, lot) -> nombre de parties attendu
+    attendus = {}
+    for cellule in grille:
+        cle = cle_cellule(cellule)
+        for lot, debut in enumerate(range(0, parties, taille_lot)):
+            attendus[(cle, lot)] = (cellule, min(taille_lot, parties - debut))
+
+    def lots_repris() -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """Lots du fichier qui appartiennent à ce balayage, un par (cellule, lot)"""
+        repris = {}
+        for ligne in charger_resultats(chemin):
+            cle = (cle_cellule(ligne['cellule']), ligne['lot'])
+            if (cle in attendus and ligne.get('seed') == seed and ligne.get('taille_lot') == taille_lot
+                    and ligne['parties'] == attendus[cle][1]):
+                repris.setdefault(cle, ligne)
+        return repris
+
+    faits = lots_repris()
+    taches = [(cellule, lot, n) for (cle, lot), (cellule, n) in attendus.items() if (cle, lot) not in faits]
+
+    if taches:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool, \
+                open(chemin, 'a', encoding='utf-8') as sortie:
+            futures = [pool.submit(executer_lot, cellule, lot, n, seed, taille_lot)
+                       for cellule, lot, n in taches]
+            for termines, future in enumerate(as_completed(futures), 1):
+                sortie.write(json.dumps(future.result(), ensure_ascii=False) + "\n")
+                sortie.flush()
+                if progression:
+                    progression(termines, len(taches))
+
+    return agreger(lots_repris().values())
+
+def _lire_axe(texte: str) -> Tuple[str, List[Any]]:
+    """Lit un axe 'NOM=v1,v2,...' (chaque valeur est du JSON)"""
+    nom, _, valeurs = texte.partition("=")
+    if not valeurs:
+        raise argparse.ArgumentTypeError(f"Axe invalide: {texte} (attendu NOM=v1,v2)")
+    return nom, [json.loads(v) for v in valeurs.split(",")]
+
+def afficher_table(table: List[Dict[str, Any]]) -> None:
+    """Affiche la table agrégée"""
+    print(f"\n{'Cellule':60s} {'Parties':>8s} {'Victoire [IC 95%]':>24s} {'Score [IC 95%]':>26s}")
+    print("=" * 122)
+    for ligne in table:
+        bas, haut = ligne['ic_victoire']
+        score_bas, score_haut = ligne['ic_score']
+        cellule = " ".join(f"{k}={json.dumps(v, ensure_ascii=False)}" for k, v in sorted(ligne['cellule'].items()))
+        print(f"{cellule[:60]:60s} {ligne['parties']:8d} "
+              f"{ligne['taux_victoire']:7.2%} [{bas:6.2%}, {haut:6.2%}] "
+              f"{ligne['score_moyen']:8.1f} [{score_bas:7.1f}, {score_haut:7.1f}]")
+
+def main() -> int:
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Balayage d'équilibrage multi-cœurs")
+    parser.add_argument("-p", "--axe", action="append", type=_lire_axe, default=[],
+                        help="axe NOM=v1,v2 (constante de config.py, SALLES ou difficulte)")
+    parser.add_argument("-g", "--grille", help="fichier JSON {NOM: [valeurs]} (ex. PROBABILITES_SALLES)")
+    parser.add_argument("-o", "--sortie", default="balayage.jsonl", help="fichier de résultats (reprise)")
+    parser.add_argument("-n", "--parties", type=int, default=10000, help="parties par cellule")
+    parser.add_argument("-l", "--lot", type=int, default=1000, help="parties par lot")
+    parser.add_argument("-w", "--workers", type=int, help="nombre de processus (tous les cœurs par défaut)")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="graine du balayage")
+    args = parser.parse_args()
+
+    axes: Dict[str, List[Any]] = {}
+    if args.grille:
+        with open(args.grille, 'r', encoding='utf-8') as f:
+            axes.update(json.load(f))
+    axes.update(dict(args.axe))
+
+    debut = time.perf_counter()
+
+    def progression(termines: int, total: int) -> None:
+        print(f"\r⏳ {termines}/{total} lots", end="", flush=True)
+
+    table = executer_balayage(axes, args.sortie, args.parties, args.lot, args.seed,
+                              args.workers, progression)
+    duree = time.perf_counter() - debut
+    afficher_table(table)
+    print(f"\nDurée: {duree:.1f}s - résultats dans {args.sortie}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Environnement vectorisé: N parties indépendantes avancées en même temps
+Mêmes règles que GameService et RoomGenerator, état en tableaux NumPy
+"""
+
+import argparse
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+import config
+from agent_env import (
+    ACTION_AVANCER, ACTION_QUITTER, TAILLE_OBSERVATION, OBS_PV, OBS_PV_MAX, OBS_ATTAQUE,
+    OBS_PV_ENNEMI, OBS_ATTAQUE_ENNEMI, OBS_TYPE_SALLE, OBS_COMBO, OBS_SALLE
+)
+from entities import Boss, Enemy
+from room_markov import POWERUP_ATTAQUE, POWERUP_SOIN, SCORE_POWERUP, TYPES_SALLES, lois_salles
+
+# Codes des types de salles (mêmes valeurs que agent_env.CODES_SALLES)
+SALLE_ENNEMI, SALLE_BOSS, SALLE_SOIN, SALLE_AMELIORATION, SALLE_POWERUP = range(len(TYPES_SALLES))
+
+TransitionLot = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict[str, np.ndarray]]
+
+class BatchRoguelikeEnv:
+    """N parties de Roguelike en structure de tableaux, avancées pas à pas ensemble
+
+    Chaque partie suit les règles de agent_env.RoguelikeEnv: un pas de combat
+    est un tour, un pas en salle spéciale passe à la salle suivante et l'effet
+    d'une salle spéciale s'applique à l'arrivée. Une partie terminée repart
+    aussitôt (réinitialisation automatique); son issue est donnée dans info.
+    Les tirages viennent d'un générateur NumPy propre au lot: les lois sont
+    celles du jeu, pas les séquences exactes du service rng.
+
+    L'état observé est une matrice (8, n) dont chaque ligne est un champ
+    contigu; les observations (n, 8) en sont une vue transposée, valable
+    jusqu'au pas suivant (la copier pour la garder).
+    """
+
+    def __init__(self, n: int, difficulty: int = 1, probabilites: Optional[Dict[str, float]] = None,
+                 seed: Optional[int] = None):
+        if n <= 0:
+            raise ValueError("Le nombre de parties doit être positif")
+        if difficulty not in config.DIFFICULTES:
+            raise ValueError(f"Difficulté inconnue: {difficulty}")
+        self.n = n
+        self.difficulty = difficulty
+        self.salles_max = config.DIFFICULTES[difficulty]["salles"]
+        self.pv_max = config.JOUEUR_PV_MAX
+        self._generateur = np.random.Generator(np.random.SFC64(seed))
+
+        # Lois cumulées de la salle suivante, mises bout à bout: un tirage u
+        # décalé en u + 1 tombe dans la loi d'après une salle spéciale. Le
+        # type est le nombre de seuils franchis (les seuils >= 2 ne le sont jamais)
+        probabilites = probabilites if probabilites is not None else config.PROBABILITES_SALLES
+        cumuls = np.cumsum(lois_salles(probabilites), axis=1)
+        cumuls[:, -1] = 1.0
+        seuils = np.concatenate((cumuls[0], cumuls[1] + 1.0))
+        self._seuils = [float(seuil) for seuil in seuils if seuil < 2.0]
+
+        # Tables indexées par type de salle
+        (pv_ennemi, attaque_ennemi), (pv_boss, attaque_boss) = Enemy.stats(difficulty), Boss.stats(difficulty)
+        self._pv_adversaire = np.array([pv_ennemi, pv_boss, 0, 0, 0], dtype=np.int32)
+        self._attaque_adversaire = np.array([attaque_ennemi, attaque_boss, 0, 0, 0], dtype=np.int32)
+        self._score_victoire = np.array([config.SCORE_ENNEMI, config.SCORE_BOSS, 0, 0, 0], dtype=np.int32)
+        # Multiplicateur du tirage enchaîné: 1 en salle spéciale pour ne pas l'annuler
+        self._multiplicateur_riposte = np.maximum(self._attaque_adversaire, 1)
+        self._soin_salle = int(self.pv_max * config.POURCENTAGE_SOIN)
+
+        # État: une ligne par champ, une colonne par partie
+        self._etat = np.zeros((TAILLE_OBSERVATION, n), dtype=np.int32)
+        self._etat[OBS_PV_MAX] = self.pv_max
+        self.pv = self._etat[OBS_PV]
+        self.attaque = self._etat[OBS_ATTAQUE]
+        self.pv_ennemi = self._etat[OBS_PV_ENNEMI]
+        self.attaque_ennemi = self._etat[OBS_ATTAQUE_ENNEMI]
+        self.type_salle = self._etat[OBS_TYPE_SALLE]
+        self.combo = self._etat[OBS_COMBO]
+        self.salle = self._etat[OBS_SALLE]
+        self.score = np.zeros(n, dtype=np.int32)
+        self.ennemis_tues = np.zeros(n, dtype=np.int32)
+        self.boss_vaincus = np.zeros(n, dtype=np.int32)
+        self._franchi = np.zeros(n, dtype=bool)
+
+    def reset(self, seed: Optional[int] = None) -> np.ndarray:
+        """Redémarre toutes les parties et retourne les observations (n, 8)"""
+        if seed is not None:
+            self._generateur = np.random.Generator(np.random.SFC64(seed))
+        self._reinitialiser(np.arange(self.n))
+        self._entrer_salles(np.ones(self.n, dtype=bool), self._generateur.random(self.n))
+        return self.observations()
+
+    def step(self, actions: Optional[np.ndarray] = None) -> TransitionLot:
+        """Avance chaque partie d'un pas (ACTION_AVANCER par défaut)
+
+        Retourne (observations, récompenses, terminés, tronqués, info). Si des
+        parties se terminent, info donne leurs indices et, avant leur
+        réinitialisation, leur victoire, score, salles, ennemis et boss.
+        """
+        pv, pv_ennemi, type_salle = self.pv, self.pv_ennemi, self.type_salle
+
+        combat = pv_ennemi > 0
+        if actions is None:
+            quitte = None
+        else:
+            actions = np.asarray(actions)
+            quitte = actions == ACTION_QUITTER
+            if not np.all(quitte | (actions == ACTION_AVANCER)):
+                raise ValueError("Actions invalides")
+            combat &= ~quitte
+
+        # Un seul tirage par partie et par pas: la partie entière de u x attaque
+        # donne la frappe, sa partie fractionnaire (uniforme et indépendante)
+        # sert de même à la riposte, puis au type de la salle suivante
+        tirages = self._generateur.random(self.n)
+        tirages *= self.attaque
+        degats = tirages.astype(np.int32)
+        tirages -= degats
+        degats += 1
+        degats *= combat
+        pv_ennemi -= degats
+        np.maximum(pv_ennemi, 0, out=pv_ennemi)
+
+        finie = pv_ennemi == 0
+        if quitte is not None:
+            finie &= ~quitte
+        tue = combat & finie
+        survit = combat ^ tue
+
+        tirages *= self._multiplicateur_riposte.take(type_salle)
+        riposte = tirages.astype(np.int32)
+        tirages -= riposte
+        riposte += 1
+        riposte *= survit
+        pv -= riposte
+        np.maximum(pv, 0, out=pv)
+
+        recompenses = self._score_victoire.take(type_salle)
+        recompenses *= tue
+        recompenses += survit * np.int32(config.SCORE_SURVIE)
+        self.score += recompenses
+        boss = tue & (type_salle == SALLE_BOSS)
+        self.boss_vaincus += boss
+        self.ennemis_tues += tue ^ boss
+        self.combo += combat
+
+        # Salle finie: adversaire vaincu ou salle spéciale quittée
+        derniere = finie & (self.salle >= self.salles_max)
+        mort = pv == 0
+        termines = mort | derniere
+        if quitte is not None:
+            termines |= quitte
+        else:
+            quitte = np.zeros(self.n, dtype=bool)
+
+        info = {}
+        indices = np.flatnonzero(termines)
+        if indices.size:
+            info = {
+                'indices': indices,
+                'victoire': derniere[indices] & ~mort[indices],
+                'score': self.score[indices],
+                'salles': self.salle[indices] - (mort[indices] | quitte[indices]),
+                'ennemis': self.ennemis_tues[indices],
+                'boss': self.boss_vaincus[indices]
+            }
+            self._reinitialiser(indices)
+
+        # Le score d'un power-up trouvé à la réinitialisation n'est pas une récompense
+        finie |= termines
+        self._entrer_salles(finie, tirages, recompenses, termines)
+        return self.observations(), recompenses, termines, quitte, info
+
+    def _reinitialiser(self, indices: np.ndarray) -> None:
+        """Remet des parties à leur état de départ (avant la première salle)"""
+        self.pv[indices] = self.pv_max
+        self.attaque[indices] = config.JOUEUR_ATTAQUE
+        self.score[indices] = 0
+        self.salle[indices] = 0
+        self.ennemis_tues[indices] = 0
+        self.boss_vaincus[indices] = 0
+        self.pv_ennemi[indices] = 0
+        # Aucune salle spéciale avant la première salle
+        self.type_salle[indices] = SALLE_ENNEMI
+
+    def _entrer_salles(self, entrees: np.ndarray, tirages: np.ndarray,
+                       recompenses: Optional[np.ndarray] = None,
+                       reinitialisees: Optional[np.ndarray] = None) -> None:
+        """Fait entrer les parties masquées dans leur salle suivante
+
+        tirages donne un uniforme par partie. Les opérations portent sur tout
+        le lot avec un masque: moins coûteux que des indexations par indices.
+        """
+        type_salle = self.type_salle
+        apres_speciale = type_salle >= SALLE_SOIN
+        tirages += apres_speciale
+        types = apres_speciale.view(np.int8) * np.int8(-len(TYPES_SALLES))
+        franchi = self._franchi
+        for seuil in self._seuils:
+            np.greater_equal(tirages, seuil, out=franchi)
+            types += franchi.view(np.int8)
+
+        # Mélange arithmétique: les écritures masquées coûtent plus cher
+        # quand le masque est imprévisible
+        types = types.astype(np.int32)
+        types -= type_salle
+        types *= entrees
+        type_salle += types
+        self.salle += entrees
+        self.combo *= ~entrees
+
+        # Stats de l'adversaire par arithmétique sur les types (take convertirait
+        # les indices): une salle finie n'a plus d'adversaire, ses PV valent 0
+        boss = type_salle == SALLE_BOSS
+        combat = type_salle < SALLE_SOIN
+        attaque = boss * np.int32(self._attaque_adversaire[SALLE_BOSS] - self._attaque_adversaire[SALLE_ENNEMI])
+        attaque += np.int32(self._attaque_adversaire[SALLE_ENNEMI])
+        attaque *= combat
+        self.attaque_ennemi[:] = attaque
+        combat &= entrees
+        pv_adversaire = boss * np.int32(self._pv_adversaire[SALLE_BOSS] - self._pv_adversaire[SALLE_ENNEMI])
+        pv_adversaire += np.int32(self._pv_adversaire[SALLE_ENNEMI])
+        pv_adversaire *= combat
+        self.pv_ennemi += pv_adversaire
+
+        indices = np.flatnonzero(entrees & (type_salle >= SALLE_SOIN))
+        if indices.size == 0:
+            return
+        types = type_salle[indices]
+        # Un tirage par salle spéciale: bonus d'amélioration, ou potion puis
+        # sa valeur (partie fractionnaire du tirage doublé)
+        tirages = self._generateur.random(indices.size)
+
+        soins = indices[types == SALLE_SOIN]
+        self.pv[soins] = np.minimum(self.pv_max, self.pv[soins] + self._soin_salle)
+
+        amelioration = types == SALLE_AMELIORATION
+        ecart = config.BONUS_ATTAQUE_MAX - config.BONUS_ATTAQUE_MIN + 1
+        bonus = (tirages[amelioration] * ecart).astype(np.int32)
+        bonus += np.int32(config.BONUS_ATTAQUE_MIN)
+        self.attaque[indices[amelioration]] += bonus
+
+        powerup = types == SALLE_POWERUP
+        powerups = indices[powerup]
+        if powerups.size:
+            tirages = tirages[powerup] * 2.0
+            force = tirages < 1.0
+            tirages -= ~force
+            bonus = (tirages * (POWERUP_ATTAQUE[1] - POWERUP_ATTAQUE[0] + 1)).astype(np.int32)
+            bonus += np.int32(POWERUP_ATTAQUE[0])
+            soin = (tirages * (POWERUP_SOIN[1] - POWERUP_SOIN[0] + 1)).astype(np.int32)
+            soin += np.int32(POWERUP_SOIN[0])
+            self.attaque[powerups] += bonus * force
+            self.pv[powerups] = np.where(force, self.pv[powerups],
+                                         np.minimum(self.pv_max, self.pv[powerups] + soin))
+            self.score[powerups] += SCORE_POWERUP
+            if recompenses is not None:
+                recompenses[powerups] += SCORE_POWERUP * ~reinitialisees[powerups]
+
+    def observations(self) -> np.ndarray:
+        """Observations (n, 8) avec les indices agent_env.OBS_* (vue sur l'état)"""
+        return self._etat.T
+
+def mesurer_debit(n: int = 4096, pas: int = 1000, difficulty: int = 1,
+                  seed: int = 0) -> Dict[str, Any]:
+    """Avance n parties pendant pas pas et mesure le coût d'un pas du lot
+
+    Le taux de victoire porte sur les parties finies pendant la mesure, qui
+    favorisent les parties courtes: pour des statistiques, préférer simulation.
+    """
+    env = BatchRoguelikeEnv(n, difficulty, seed=seed)
+    env.reset()
+    parties = 0
+    victoires = 0
+    debut = time.perf_counter()
+    for _ in range(pas):
+        info = env.step()[4]
+        if info:
+            parties += info['indices'].size
+            victoires += int(info['victoire'].sum())
+    duree = time.perf_counter() - debut
+    return {
+        'n': n,
+        'pas': pas,
+        'parties': parties,
+        'taux_victoire': victoires / parties if parties else 0.0,
+        'duree_pas': duree / pas,
+        'pas_par_seconde': n * pas / duree if duree > 0 else float('inf')
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Mesure le débit de l'environnement vectorisé"""
+    parser = argparse.ArgumentParser(description="Débit de l'environnement vectorisé")
+    parser.add_argument("-n", "--parties", type=int, default=4096, help="parties avancées ensemble")
+    parser.add_argument("-p", "--pas", type=int, default=1000, help="nombre de pas du lot")
+    parser.add_argument("-d", "--difficulte", type=int, choices=sorted(config.DIFFICULTES), default=1)
+    parser.add_argument("--seed", type=int, default=0, help="graine")
+    args = parser.parse_args(argv)
+
+    resultat = mesurer_debit(args.parties, args.pas, args.difficulte, args.seed)
+    print(f"{resultat['n']} parties x {resultat['pas']} pas: {resultat['parties']} parties finies "
+          f"(victoires: {resultat['taux_victoire']:.1%})")
+    print(f"Un pas du lot: {resultat['duree_pas'] * 1e6:.0f} µs "
+          f"({resultat['pas_par_seconde']:.0f} pas de partie/s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai du rendu de la version optimisée
+Temps de rendu par image et par état, avec et sans couches statiques
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List, Optional
+
+import pygame
+from config import *
+from entities import EnemyRoom, HealingRoom
+from renderer import OptimizedRenderer
+from roguelike_optimized import GameState, OptimizedRoguelike
+
+ETATS = [GameState.MENU, GameState.COMBAT, GameState.SPECIAL_ROOM, GameState.TRANSITION, GameState.GAME_OVER]
+
+# Modes mesurés: (nom, couches statiques, régions modifiées). "sans couches"
+# est le rendu actuel sans couche ni région, pas l'ancien chemin render_*
+MODES = [
+    ("sans couches", False, False),
+    ("couches", True, False),
+    ("couches + régions", True, True)
+]
+
+def preparer_etat(game: OptimizedRoguelike, state: str) -> None:
+    """Place le jeu dans un état donné, une partie étant démarrée"""
+    if state == GameState.MENU:
+        game.setup_menu()
+    elif state == GameState.COMBAT:
+        game.current_room = EnemyRoom(game.game_service.get_difficulty())
+        game.setup_combat()
+    elif state == GameState.SPECIAL_ROOM:
+        game.current_room = HealingRoom()
+        game.setup_special_room()
+    elif state == GameState.TRANSITION:
+        game.setup_transition(True)
+    else:
+        game.setup_game_over()
+    game.state = state
+
+def mesurer_etat(game: OptimizedRoguelike, state: str, images: int, use_layers: bool,
+                 regions: bool) -> float:
+    """Temps moyen de rendu d'une image en ms
+
+    En combat, les PV du joueur changent à chaque image pour mesurer le coût
+    des nombres et barres qui bougent; les autres écrans sont immobiles.
+    Sans régions modifiées, chaque image est entièrement redessinée comme
+    avant l'introduction du rendu différé.
+    """
+    game.renderer = OptimizedRenderer(game.screen, use_layers)
+    preparer_etat(game, state)
+    player = game.game_service.get_player()
+    pv = player._pv_actuels
+
+    duree = 0.0
+    for image in range(images + 1):
+        if state == GameState.COMBAT:
+            player._pv_actuels = pv - image % 2
+        if not regions:
+            game.renderer.invalidate()
+        debut = time.perf_counter()
+        game.renderer.begin_frame()
+        game.render_state()
+        game.renderer.end_frame()
+        # La première image construit les couches: elle n'est pas comptée
+        if image:
+            duree += time.perf_counter() - debut
+
+    player._pv_actuels = pv
+    return duree * 1000 / images
+
+def mesurer_rendu(images: int = 300, seed: int = 0,
+                  etats: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+    """Mesure le temps de rendu par image pour chaque état et chaque mode"""
+    game = OptimizedRoguelike(seed=seed)
+    game.enregistrement = None
+    renderer = game.renderer
+    game.game_service.start_game(1)
+
+    resultats = {}
+    for state in etats or ETATS:
+        resultats[state] = {nom: mesurer_etat(game, state, images, use_layers, regions)
+                            for nom, use_layers, regions in MODES}
+
+    game.renderer = renderer
+    return resultats
+
+def gain(avant: float, apres: float) -> str:
+    """Rapport des temps avant et après, affiché avec deux décimales"""
+    return f"x{avant / apres:.2f}" if apres > 0 else "-"
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Affiche le tableau des temps de rendu"""
+    parser = argparse.ArgumentParser(description="Temps de rendu par image de la version optimisée")
+    parser.add_argument("-n", "--images", type=int, default=300, help="images mesurées par état et par mode")
+    parser.add_argument("--seed", type=int, default=0, help="graine")
+    args = parser.parse_args(argv)
+
+    resultats = mesurer_rendu(args.images, args.seed)
+    noms = [nom for nom, _, _ in MODES]
+    # Chaque gain compare un mode au précédent: les couches seules, puis les régions
+    entetes = [noms[0], noms[1], "gain couches", noms[2], "gain régions"]
+    print(f"{'État':<14}" + "".join(f"{nom:>20}" for nom in entetes))
+    for state, temps in resultats.items():
+        sans, couches, regions = (temps[nom] for nom in noms)
+        colonnes = [f"{sans:.3f} ms", f"{couches:.3f} ms", gain(sans, couches),
+                    f"{regions:.3f} ms", gain(couches, regions)]
+        print(f"{state:<14}" + "".join(f"{colonne:>20}" for colonne in colonnes))
+
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
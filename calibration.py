@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Calibration automatique de la difficulté par simulation en lots
+Cherche par divisions successives (successive halving) les stats des ennemis,
+des boss et la probabilité de boss qui atteignent un taux de victoire visé
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import config
+from entities import Boss, Enemy
+from simulation import parametres_config, simuler_parties
+
+# Multiplicateur maximal des stats au premier tirage (log-uniforme entre 1/x et x),
+# réduit par racine carrée à chaque itération autour du meilleur candidat
+ETENDUE_INITIALE = 3.0
+# Bornes de la probabilité d'une salle de boss (le reste des combats: ennemis)
+PROBA_BOSS_MIN = 0.05
+PROBA_BOSS_MAX = 0.40
+
+# Poids de l'écart aux stats actuelles: à précision égale, le plus petit changement gagne
+POIDS_ECART = 0.005
+
+Candidat = Dict[str, Any]
+
+def stats_actuelles(difficulty: int) -> Candidat:
+    """Entrée de table correspondant au jeu actuel pour une difficulté"""
+    pv_ennemi, attaque_ennemi = Enemy.stats(difficulty)
+    pv_boss, attaque_boss = Boss.stats(difficulty)
+    return {
+        'ennemi': {'pv': pv_ennemi, 'attaque': attaque_ennemi},
+        'boss': {'pv': pv_boss, 'attaque': attaque_boss},
+        'probabilites': dict(config.PROBABILITES_SALLES)
+    }
+
+def tirer_candidat(centre: Candidat, etendue: float, aleatoire: random.Random) -> Candidat:
+    """Tire un candidat autour du centre, stats multipliées entre 1/etendue et etendue"""
+    def multiplier(valeur: int) -> int:
+        facteur = math.exp(aleatoire.uniform(-math.log(etendue), math.log(etendue)))
+        return max(1, round(valeur * facteur))
+
+    probabilites = dict(centre['probabilites'])
+    combats = probabilites.get('ennemi', 0.0) + probabilites.get('boss', 0.0)
+    largeur = (PROBA_BOSS_MAX - PROBA_BOSS_MIN) * math.log(etendue) / math.log(ETENDUE_INITIALE)
+    boss = probabilites.get('boss', 0.0)
+    probabilites['boss'] = round(aleatoire.uniform(max(PROBA_BOSS_MIN, boss - largeur / 2),
+                                                   min(PROBA_BOSS_MAX, combats, boss + largeur / 2)), 3)
+    probabilites['ennemi'] = round(combats - probabilites['boss'], 3)
+
+    return {
+        'ennemi': {cle: multiplier(v) for cle, v in centre['ennemi'].items()},
+        'boss': {cle: multiplier(v) for cle, v in centre['boss'].items()},
+        'probabilites': probabilites
+    }
+
+def ecart_reference(candidat: Candidat, reference: Candidat) -> float:
+    """Distance logarithmique entre les stats d'un candidat et la référence"""
+    return sum(abs(math.log(candidat[nom][cle] / reference[nom][cle]))
+               for nom in ('ennemi', 'boss') for cle in ('pv', 'attaque'))
+
+def jouer_candidat(candidat: Candidat, difficulty: int, parties: int, seed: int) -> int:
+    """Joue un lot de parties avec la table candidate, retourne le nombre de victoires"""
+    table = dict(config.STATS_CALIBREES)
+    table[difficulty] = candidat
+    with parametres_config(STATS_CALIBREES=table):
+        resultats = simuler_parties(parties, difficulty, seed=seed)
+    return sum(1 for r in resultats if r['victoire'])
+
+def divisions_successives(candidats: List[Candidat], jouer: Callable[[Candidat, int, int], int],
+                          cout: Callable[[Candidat, float], float], budget_initial: int,
+                          eta: int = 3, seed: int = 0) -> List[Dict[str, Any]]:
+    """Successive halving: garde le meilleur tiers et triple les parties à chaque tour
+
+    Les parties d'un tour s'ajoutent à celles des tours précédents. Tous les
+    candidats d'un même tour jouent avec la même graine (nombres aléatoires
+    communs), ce qui réduit le bruit des comparaisons.
+    Retourne l'historique des survivants du dernier tour, triés par coût.
+    """
+    if not candidats or budget_initial <= 0 or eta < 2:
+        raise ValueError("Il faut des candidats, un budget positif et eta >= 2")
+
+    suivis = [{'candidat': c, 'parties': 0, 'victoires': 0} for c in candidats]
+    budget = budget_initial
+    tour = 0
+    while True:
+        for suivi in suivis:
+            suivi['victoires'] += jouer(suivi['candidat'], budget, seed * 1000 + tour)
+            suivi['parties'] += budget
+            suivi['taux_victoire'] = suivi['victoires'] / suivi['parties']
+            suivi['cout'] = cout(suivi['candidat'], suivi['taux_victoire'])
+        suivis.sort(key=lambda s: s['cout'])
+        if len(suivis) == 1:
+            return suivis
+        suivis = suivis[:max(1, len(suivis) // eta)]
+        budget *= eta
+        tour += 1
+
+def calibrer(difficulty: int, cible: float, candidats: int = 27, budget_initial: int = 100,
+             eta: int = 3, iterations: int = 3, seed: int = 0) -> Dict[str, Any]:
+    """Calibre une difficulté et retourne le meilleur candidat avec sa mesure
+
+    Chaque itération lance des divisions successives sur des candidats tirés
+    autour du meilleur précédent, dans une étendue de plus en plus étroite.
+    """
+    if not 0.0 < cible < 1.0:
+        raise ValueError("Le taux de victoire visé doit être entre 0 et 1")
+
+    reference = stats_actuelles(difficulty)
+    aleatoire = random.Random(seed * 31 + difficulty)
+
+    def jouer(candidat: Candidat, parties: int, graine: int) -> int:
+        return jouer_candidat(candidat, difficulty, parties, graine)
+
+    def cout(candidat: Candidat, taux: float) -> float:
+        return abs(taux - cible) + POIDS_ECART * ecart_reference(candidat, reference)
+
+    # Le centre concourt aussi: la référence gagne si elle est déjà dans la cible
+    meilleur = {'candidat': reference}
+    etendue = ETENDUE_INITIALE
+    for iteration in range(iterations):
+        centre = meilleur['candidat']
+        pool = [centre] + [tirer_candidat(centre, etendue, aleatoire) for _ in range(candidats - 1)]
+        meilleur = divisions_successives(pool, jouer, cout, budget_initial, eta,
+                                         seed * iterations + iteration)[0]
+        etendue = math.sqrt(etendue)
+
+    return {
+        'stats': meilleur['candidat'],
+        'taux_victoire': meilleur['taux_victoire'],
+        'parties': meilleur['parties'],
+        'cible': cible
+    }
+
+def calibrer_difficultes(cibles: Optional[Dict[int, float]] = None, candidats: int = 27,
+                         budget_initial: int = 100, eta: int = 3, iterations: int = 3, seed: int = 0,
+                         progression: Optional[Callable[[int, Dict[str, Any]], None]] = None
+                         ) -> Dict[int, Dict[str, Any]]:
+    """Calibre chaque difficulté visée, en partant des stats par défaut"""
+    cibles = cibles if cibles is not None else config.CIBLES_VICTOIRE
+    resultats = {}
+    with parametres_config(STATS_CALIBREES={}):
+        for difficulty, cible in sorted(cibles.items()):
+            if difficulty not in config.DIFFICULTES:
+                raise ValueError(f"Difficulté inconnue: {difficulty}")
+            resultats[difficulty] = calibrer(difficulty, cible, candidats, budget_initial, eta,
+                                             iterations, seed)
+            if progression:
+                progression(difficulty, resultats[difficulty])
+    return resultats
+
+def sauvegarder_table(resultats: Dict[int, Dict[str, Any]], chemin: str) -> None:
+    """Écrit la table calibrée lue par entities.charger_stats_calibrees"""
+    table = {str(difficulty): resultat['stats'] for difficulty, resultat in resultats.items()}
+    with open(chemin, 'w', encoding='utf-8') as f:
+        json.dump(table, f, indent=2, ensure_ascii=False)
+
+def _lire_cibles(texte: str) -> Dict[int, float]:
+    """Lit des cibles '1=0.7,2=0.4,3=0.15'"""
+    cibles = {}
+    for morceau in texte.split(","):
+        difficulty, _, taux = morceau.partition("=")
+        if not taux:
+            raise argparse.ArgumentTypeError(f"Cible invalide: {morceau} (attendu difficulté=taux)")
+        cibles[int(difficulty)] = float(taux)
+    return cibles
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Calibration automatique de la difficulté")
+    parser.add_argument("-c", "--cibles", type=_lire_cibles,
+                        help="taux de victoire visés, ex. 1=0.7,2=0.4,3=0.15 (config par défaut)")
+    parser.add_argument("-n", "--candidats", type=int, default=27, help="candidats par itération")
+    parser.add_argument("-b", "--budget", type=int, default=100, help="parties par candidat au premier tour")
+    parser.add_argument("-e", "--eta", type=int, default=3, help="facteur de division")
+    parser.add_argument("-i", "--iterations", type=int, default=3, help="itérations de resserrement")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="graine de la recherche")
+    parser.add_argument("-o", "--sortie", default=config.FICHIER_STATS_CALIBREES, help="table calibrée")
+    args = parser.parse_args(argv)
+
+    def progression(difficulty: int, resultat: Dict[str, Any]) -> None:
+        stats = resultat['stats']
+        print(f"{config.DIFFICULTES[difficulty]['nom']}: {resultat['taux_victoire']:.1%} "
+              f"(cible {resultat['cible']:.0%}, {resultat['parties']} parties) - "
+              f"ennemi {stats['ennemi']['pv']}/{stats['ennemi']['attaque']}, "
+              f"boss {stats['boss']['pv']}/{stats['boss']['attaque']}, "
+              f"boss {stats['probabilites']['boss']:.0%} des salles")
+
+    debut = time.perf_counter()
+    resultats = calibrer_difficultes(args.cibles, args.candidats, args.budget, args.eta,
+                                     args.iterations, args.seed, progression)
+    sauvegarder_table(resultats, args.sortie)
+    print(f"Table écrite dans {args.sortie} ({time.perf_counter() - debut:.1f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Solveur exact des combats par programmation dynamique
+Calcule sans échantillonnage l'issue d'un duel à dégâts uniformes
+"""
+
+import sys
+from functools import lru_cache
+from typing import Dict, Optional
+
+import numpy as np
+
+from config import DIFFICULTES
+from entities import Boss, Enemy, ICharacter, Player
+
+# Indices des tables calculées pour chaque état (PV joueur, PV ennemi)
+VICTOIRE = 0
+TOURS = 1
+PV_RESTANTS = 2
+
+@lru_cache(maxsize=256)
+def _tables(attaque_joueur: int, attaque_ennemi: int,
+            pv_joueur_max: int, pv_ennemi_max: int) -> np.ndarray:
+    """Calcule les tables (victoire, tours, PV restants) pour tous les états
+
+    Retourne un tableau de forme (3, pv_joueur_max + 1, pv_ennemi_max + 1).
+    Le joueur frappe d'abord pour 1 à attaque_joueur dégâts; si l'ennemi
+    survit, il riposte pour 1 à attaque_ennemi dégâts. Les sommes sur les
+    états suivants sont obtenues par sommes cumulées, d'où un coût en
+    O(PV joueur x PV ennemi) par combinaison d'attaques.
+    """
+    a, b = attaque_joueur, attaque_ennemi
+    p = np.arange(pv_joueur_max + 1)
+    debut_riposte = np.maximum(1, p - b)
+
+    tables = np.zeros((3, pv_joueur_max + 1, pv_ennemi_max + 1))
+    # cumul[:, p, e] = somme sur e' <= e des valeurs après riposte depuis (p, e')
+    cumul = np.zeros_like(tables)
+
+    for e in range(1, pv_ennemi_max + 1):
+        # Coups qui laissent l'ennemi en vie: il reste e' = e - d PV
+        plus_bas = max(1, e - a)
+        colonne = (cumul[:, :, e - 1] - cumul[:, :, plus_bas - 1]) / a
+
+        # Coups fatals (d >= e): victoire immédiate avec p PV
+        fatal = max(0, a - e + 1) / a
+        colonne[VICTOIRE] += fatal
+        colonne[TOURS] += 1
+        colonne[PV_RESTANTS] += fatal * p
+        colonne[:, 0] = 0
+        tables[:, :, e] = colonne
+
+        # Riposte depuis (p, e): le joueur passe à p - D PV s'il survit
+        cumule = np.zeros((3, pv_joueur_max + 2))
+        np.cumsum(colonne, axis=1, out=cumule[:, 1:])
+        riposte = (cumule[:, p] - cumule[:, debut_riposte]) / b
+        cumul[:, :, e] = cumul[:, :, e - 1] + riposte
+
+    tables.setflags(write=False)
+    return tables
+
+@lru_cache(maxsize=256)
+def _pv_finaux(attaque_joueur: int, attaque_ennemi: int,
+               pv_joueur_max: int, pv_ennemi: int) -> np.ndarray:
+    """Distribution des PV du joueur à la fin d'un combat contre un ennemi neuf
+
+    Retourne une matrice (pv_joueur_max + 1) x (pv_joueur_max + 1): la ligne p
+    donne la loi des PV finaux en partant de p PV (colonne 0 = défaite).
+    Même récurrence que _tables, avec un vecteur de PV finaux par état.
+    """
+    a, b = attaque_joueur, attaque_ennemi
+    taille = pv_joueur_max + 1
+    p = np.arange(taille)
+    debut_riposte = np.maximum(1, p - b)
+    identite = np.eye(taille)
+
+    # Riposte fatale depuis p PV: b - p + 1 coups sur b
+    mort = np.zeros((taille, taille))
+    mort[1:, 0] = np.maximum(0, b - p[1:] + 1) / b
+
+    cumul = np.zeros((pv_ennemi + 1, taille, taille))
+    for e in range(1, pv_ennemi + 1):
+        plus_bas = max(1, e - a)
+        etat = (cumul[e - 1] - cumul[plus_bas - 1]) / a
+        etat += (max(0, a - e + 1) / a) * identite
+        etat[0] = 0
+        if e == pv_ennemi:
+            break
+
+        cumule = np.zeros((taille + 1, taille))
+        np.cumsum(etat, axis=0, out=cumule[1:])
+        riposte = (cumule[p] - cumule[debut_riposte]) / b + mort
+        riposte[0] = 0
+        cumul[e] = cumul[e - 1] + riposte
+
+    etat[0, 0] = 1.0
+    etat.setflags(write=False)
+    return etat
+
+def distribution_pv_finaux(attaque_joueur: int, attaque_ennemi: int,
+                           pv_joueur_max: int, pv_ennemi: int) -> np.ndarray:
+    """Matrice de transition des PV du joueur sur un combat complet (mémoïsée)"""
+    if min(attaque_joueur, attaque_ennemi, pv_joueur_max, pv_ennemi) < 1:
+        raise ValueError("Les attaques et les PV doivent être strictement positifs")
+    return _pv_finaux(attaque_joueur, attaque_ennemi, pv_joueur_max, pv_ennemi)
+
+def tables_combat(attaque_joueur: int, attaque_ennemi: int,
+                  pv_joueur_max: int, pv_ennemi_max: int) -> Dict[str, np.ndarray]:
+    """Retourne les tables exactes indexées par [PV joueur, PV ennemi] (mémoïsées)"""
+    if min(attaque_joueur, attaque_ennemi, pv_joueur_max, pv_ennemi_max) < 1:
+        raise ValueError("Les attaques et les PV doivent être strictement positifs")
+
+    tables = _tables(attaque_joueur, attaque_ennemi, pv_joueur_max, pv_ennemi_max)
+    return {
+        'probabilite_victoire': tables[VICTOIRE],
+        'tours_moyens': tables[TOURS],
+        'pv_restants_moyens': tables[PV_RESTANTS]
+    }
+
+def resoudre_combat(pv_joueur: int, attaque_joueur: int, pv_ennemi: int, attaque_ennemi: int,
+                    pv_joueur_max: Optional[int] = None,
+                    pv_ennemi_max: Optional[int] = None) -> Dict[str, float]:
+    """Issue exacte d'un combat depuis (pv_joueur, pv_ennemi)
+
+    Les bornes servent de clé de mémoïsation: en les fixant aux PV max,
+    toutes les requêtes d'un même matchup réutilisent les mêmes tables.
+    Les PV restants moyens valent 0 en cas de défaite.
+    """
+    pv_joueur_max = pv_joueur if pv_joueur_max is None else pv_joueur_max
+    pv_ennemi_max = pv_ennemi if pv_ennemi_max is None else pv_ennemi_max
+    if not (0 < pv_joueur <= pv_joueur_max and 0 < pv_ennemi <= pv_ennemi_max):
+        raise ValueError("Les PV doivent être positifs et inférieurs aux bornes")
+    if min(attaque_joueur, attaque_ennemi) < 1:
+        raise ValueError("Les attaques doivent être strictement positives")
+
+    tables = _tables(attaque_joueur, attaque_ennemi, pv_joueur_max, pv_ennemi_max)
+    return {
+        'probabilite_victoire': float(tables[VICTOIRE, pv_joueur, pv_ennemi]),
+        'tours_moyens': float(tables[TOURS, pv_joueur, pv_ennemi]),
+        'pv_restants_moyens': float(tables[PV_RESTANTS, pv_joueur, pv_ennemi])
+    }
+
+def resoudre_contre(joueur: ICharacter, ennemi: ICharacter) -> Dict[str, float]:
+    """Issue exacte d'un combat entre deux personnages dans leur état actuel"""
+    return resoudre_combat(joueur.pv_actuels, joueur.attaque, ennemi.pv_actuels, ennemi.attaque,
+                           joueur.pv_max, ennemi.pv_max)
+
+def analyser_difficultes() -> Dict[int, Dict[str, Dict[str, float]]]:
+    """Issue exacte d'un joueur neuf contre un ennemi et un boss par difficulté"""
+    joueur = Player()
+    resultats = {}
+    for difficulty in DIFFICULTES:
+        resultats[difficulty] = {}
+        for nom, classe in (('ennemi', Enemy), ('boss', Boss)):
+            pv, attaque = classe.stats(difficulty)
+            resultats[difficulty][nom] = resoudre_combat(joueur.pv_max, joueur.attaque, pv, attaque)
+    return resultats
+
+def main() -> int:
+    """Affiche l'analyse exacte des combats par difficulté"""
+    print("🎯 Analyse exacte des combats (joueur neuf)")
+    print("=" * 60)
+    for difficulty, resultats in analyser_difficultes().items():
+        print(DIFFICULTES[difficulty]['nom'])
+        for nom, issue in resultats.items():
+            print(f"  {nom:7s} victoire: {issue['probabilite_victoire']:.4%}  "
+                  f"tours: {issue['tours_moyens']:.2f}  "
+                  f"PV restants: {issue['pv_restants_moyens']:.2f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -61,3 +61,14 @@ DIFFICULTES = {
     2: {"salles": 7, "nom": "Difficile", "couleur": ORANGE},
     3: {"salles": 10, "nom": "Expert", "couleur": RED}
 }
+
+# Dossier des enregistrements de sessions (relecture avec replay.py)
+DOSSIER_REPLAYS = "replays"
+
+# Table de stats calibrées par difficulté (calibration.py), vide = facteurs par défaut
+# {difficulté: {"ennemi": {"pv", "attaque"}, "boss": {"pv", "attaque"}, "probabilites": {...}}}
+FICHIER_STATS_CALIBREES = "stats_calibrees.json"
+STATS_CALIBREES = {}
+
+# Taux de victoire visés par la calibration
+CIBLES_VICTOIRE = {1: 0.70, 2: 0.40, 3: 0.15}
@@ -6,6 +6,7 @@ Version de debug pour tester la version optimisée
 import pygame
 import sys
 from config import *
+import resources
 
 def test_basic_pygame():
     """Test basique de Pygame"""
@@ -16,12 +17,16 @@ def test_basic_pygame():
         screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Test Pygame")
         
-        font = pygame.font.Font(None, 36)
-        text = font.render("Test Pygame OK!", True, WHITE)
-        
-        screen.fill(BLACK)
-        screen.blit(text, (SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2))
-        pygame.display.flip()
+        font = resources.font(36)
+        try:
+            text = font.render("Test Pygame OK!", True, WHITE)
+            
+            screen.fill(BLACK)
+            screen.blit(text, (SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2))
+            pygame.display.flip()
+        finally:
+            # Police prise sans propriétaire: la rendre au registre
+            resources.release_font(36)
         
         print("✅ Pygame fonctionne correctement")
         return True
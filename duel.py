@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Simulateur de duels vectorisé avec NumPy
+Résout des millions de combats joueur contre ennemi en parallèle
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, Optional, Union
+
+import numpy as np
+
+from config import DIFFICULTES
+from entities import Boss, Character, Enemy, Player
+
+Valeur = Union[int, np.ndarray]
+
+# Duels simulés ensemble: les tableaux d'un bloc tiennent dans le cache
+TAILLE_BLOC = 65536
+
+def creer_generateur(seed: Optional[int] = None) -> np.random.Generator:
+    """Crée un générateur NumPy rapide (SFC64) pour les tirages en masse"""
+    return np.random.Generator(np.random.SFC64(seed))
+
+def simuler_duels(n: int, pv_joueur: Valeur, attaque_joueur: Valeur,
+                  pv_ennemi: Valeur, attaque_ennemi: Valeur,
+                  rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+    """Simule n duels indépendants et retourne les tableaux de résultats
+
+    Mêmes règles que CombatSystem: le joueur frappe en premier avec des
+    dégâts uniformes entre 1 et son attaque, l'ennemi riposte s'il survit,
+    et un duel s'arrête dès que l'un des deux tombe à 0 PV. Chaque paramètre
+    accepte un scalaire ou un tableau de taille n.
+    """
+    if rng is None:
+        rng = creer_generateur()
+
+    # PV et dégâts tiennent en 16 bits pour les stats du jeu: moins de mémoire à parcourir
+    borne = max(np.max(pv_joueur), np.max(pv_ennemi), np.max(attaque_joueur), np.max(attaque_ennemi))
+    dtype = np.int16 if borne < 2 ** 14 else np.int32 if borne < 2 ** 30 else np.int64
+
+    resultats = {
+        'victoire': np.zeros(n, dtype=bool),
+        'tours': np.zeros(n, dtype=np.int32),
+        'pv_joueur': np.zeros(n, dtype=dtype),
+        'pv_ennemi': np.zeros(n, dtype=dtype)
+    }
+    # Par blocs qui tiennent dans le cache du processeur
+    for debut in range(0, n, TAILLE_BLOC):
+        bloc = slice(debut, min(debut + TAILLE_BLOC, n))
+        _simuler_bloc(bloc, n, pv_joueur, attaque_joueur, pv_ennemi, attaque_ennemi, rng, dtype, resultats)
+    return resultats
+
+def _partie(valeur: Valeur, n: int, bloc: slice) -> Valeur:
+    """Scalaire tel quel, tranche du bloc pour un tableau de taille n"""
+    return valeur if np.ndim(valeur) == 0 else np.broadcast_to(valeur, n)[bloc]
+
+def _simuler_bloc(bloc: slice, n: int, pv_joueur: Valeur, attaque_joueur: Valeur,
+                  pv_ennemi: Valeur, attaque_ennemi: Valeur, rng: np.random.Generator,
+                  dtype: type, resultats: Dict[str, np.ndarray]) -> None:
+    """Simule les duels d'un bloc et écrit leurs résultats
+
+    Un duel terminé reçoit des PV sentinelles, très au-dessus de tout PV
+    réel: il ne peut plus se terminer une seconde fois, et les tours suivants
+    s'appliquent à tout le tableau sans masque. Les duels terminés sont
+    retirés dès que les trois quarts du tableau le sont, ou avant que les
+    sentinelles ne redescendent au niveau des PV réels.
+    """
+    victoire, tours = resultats['victoire'][bloc], resultats['tours'][bloc]
+    pv_j, pv_e = resultats['pv_joueur'][bloc], resultats['pv_ennemi'][bloc]
+    taille = len(victoire)
+
+    pj = np.array(np.broadcast_to(_partie(pv_joueur, n, bloc), taille), dtype=dtype)
+    pe = np.array(np.broadcast_to(_partie(pv_ennemi, n, bloc), taille), dtype=dtype)
+    # Attaques uniformes: un seul tirage borné par un scalaire, bien plus rapide
+    aj, ae = _partie(attaque_joueur, n, bloc), _partie(attaque_ennemi, n, bloc)
+
+    # Duel sans combattant vivant: aucun tour, les PV restent ceux du départ
+    morts = (pj <= 0) | (pe <= 0)
+    pv_j[morts], pv_e[morts] = pj[morts], pe[morts]
+    actifs = np.flatnonzero(~morts)
+    pj, pe = pj[actifs], pe[actifs]
+    if np.ndim(aj):
+        aj = aj[actifs]
+    if np.ndim(ae):
+        ae = ae[actifs]
+
+    limite = int(max(np.max(pj, initial=0), np.max(pe, initial=0))) + 1
+    sentinelle = np.iinfo(dtype).max
+    attaque_max = int(max(np.max(aj, initial=1), np.max(ae, initial=1)))
+    marge = (sentinelle - limite) // attaque_max
+    restants = actifs.size
+    tour = dernier = 0
+
+    while restants:
+        tour += 1
+
+        # Le joueur frappe
+        pe -= rng.integers(1, aj, size=actifs.size, dtype=dtype, endpoint=True)
+        fini = np.flatnonzero(pe <= 0)
+        if fini.size:
+            termine = actifs[fini]
+            victoire[termine] = True
+            tours[termine] = tour
+            pv_j[termine] = pj[fini]
+            pe[fini] = pj[fini] = sentinelle
+            restants -= fini.size
+
+        # L'ennemi survivant riposte
+        pj -= rng.integers(1, ae, size=actifs.size, dtype=dtype, endpoint=True)
+        fini = np.flatnonzero(pj <= 0)
+        if fini.size:
+            termine = actifs[fini]
+            tours[termine] = tour
+            pv_e[termine] = pe[fini]
+            pe[fini] = pj[fini] = sentinelle
+            restants -= fini.size
+
+        if restants * 4 < actifs.size or tour - dernier >= marge:
+            garde = pj < limite
+            actifs, pj, pe = actifs[garde], pj[garde], pe[garde]
+            if np.ndim(aj):
+                aj = aj[garde]
+            if np.ndim(ae):
+                ae = ae[garde]
+            dernier = tour
+
+def simuler_duels_objets(n: int, pv_joueur: int, attaque_joueur: int,
+                         pv_ennemi: int, attaque_ennemi: int) -> int:
+    """Version de référence en boucle sur des Character, retourne les victoires"""
+    victoires = 0
+    for _ in range(n):
+        joueur = Character("Joueur", pv_joueur, attaque_joueur)
+        ennemi = Character("Ennemi", pv_ennemi, attaque_ennemi)
+        while joueur.est_vivant() and ennemi.est_vivant():
+            joueur.attaquer(ennemi)
+            ennemi.attaquer(joueur)
+        if joueur.est_vivant():
+            victoires += 1
+    return victoires
+
+def taux_victoire_difficultes(n: int = 1_000_000,
+                              rng: Optional[np.random.Generator] = None) -> Dict[int, Dict[str, float]]:
+    """Taux de victoire d'un joueur neuf contre un ennemi et un boss par difficulté"""
+    if rng is None:
+        rng = creer_generateur()
+
+    joueur = Player()
+    resultats = {}
+    for difficulty in DIFFICULTES:
+        resultats[difficulty] = {}
+        for nom, classe in (('ennemi', Enemy), ('boss', Boss)):
+            pv, attaque = classe.stats(difficulty)
+            duels = simuler_duels(n, joueur.pv_max, joueur.attaque, pv, attaque, rng)
+            resultats[difficulty][nom] = float(duels['victoire'].mean())
+    return resultats
+
+def comparer_vitesse(n: int = 20000, difficulty: int = 1) -> Dict[str, float]:
+    """Compare la boucle sur des Character au moteur vectorisé (duels par seconde)"""
+    joueur = Player()
+    pv, attaque = Boss.stats(difficulty)
+
+    debut = time.perf_counter()
+    simuler_duels_objets(n, joueur.pv_max, joueur.attaque, pv, attaque)
+    duree_objets = time.perf_counter() - debut
+
+    n_vectorise = n * 100
+    debut = time.perf_counter()
+    simuler_duels(n_vectorise, joueur.pv_max, joueur.attaque, pv, attaque)
+    duree_vectorisee = time.perf_counter() - debut
+
+    objets = n / duree_objets
+    vectorise = n_vectorise / duree_vectorisee
+    return {
+        'duels_par_seconde_objets': objets,
+        'duels_par_seconde_vectorise': vectorise,
+        'acceleration': vectorise / objets
+    }
+
+def main() -> int:
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Duels vectorisés joueur contre ennemis")
+    parser.add_argument("-n", "--duels", type=int, default=1_000_000,
+                        help="nombre de duels par matchup")
+    parser.add_argument("-s", "--seed", type=int, help="graine aléatoire")
+    parser.add_argument("--bench", action="store_true",
+                        help="compare avec la boucle sur des Character")
+    args = parser.parse_args()
+
+    rng = creer_generateur(args.seed)
+    debut = time.perf_counter()
+    taux = taux_victoire_difficultes(args.duels, rng)
+    duree = time.perf_counter() - debut
+
+    print(f"⚔️ Taux de victoire d'un joueur neuf ({args.duels} duels par matchup)")
+    print("=" * 50)
+    for difficulty, resultats in taux.items():
+        nom = DIFFICULTES[difficulty]['nom']
+        print(f"{nom:10s} ennemi: {resultats['ennemi']:.2%}  boss: {resultats['boss']:.2%}")
+    print(f"Durée: {duree:.2f}s")
+
+    if args.bench:
+        vitesse = comparer_vitesse()
+        print(f"\nObjets: {vitesse['duels_par_seconde_objets']:.0f} duels/s")
+        print(f"Vectorisé: {vitesse['duels_par_seconde_vectorise']:.0f} duels/s")
+        print(f"Accélération: x{vitesse['acceleration']:.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
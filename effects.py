@@ -4,200 +4,421 @@ Module d'effets visuels et d'animations pour rendre le jeu plus fun
 """
 
 import pygame
-import random
 import math
-from typing import List, Tuple, Optional
+from typing import Any, List, Sequence, Tuple, Optional
+import numpy as np
 from config import *
+from particles import ParticlePool, stamp
+import rng
 
-class Particle:
-    """Particule pour les effets visuels"""
-    
-    def __init__(self, x: float, y: float, color: Tuple[int, int, int], 
-                 velocity: Tuple[float, float], life: int = 60, size: int = 3):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx, self.vy = velocity
-        self.life = life
-        self.max_life = life
+class PostProcess:
+    """Passe de post-traitement plein écran: teinte, vignette, fondu au noir et flash
+    
+    Chaque effet garde une surface au format de l'écran, créée à sa première
+    utilisation puis réutilisée; elle n'est remplie à nouveau que si la
+    couleur change. Les effets sont animés par le temps (ms): à chaque image
+    leur opacité est recalculée puis appliquée par set_alpha, et chaque effet
+    actif coûte un seul blit, sans allocation.
+    """
+    
+    # Ordre de composition, du fond vers le premier plan
+    ORDRE = ("tint", "vignette", "fade", "flash")
+    
+    # Le flash reste opaque puis s'estompe pendant ses dix dernières images
+    DECLIN_FLASH = 10 * 1000 / FPS
+    
+    def __init__(self, size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT)):
         self.size = size
-        self.gravity = 0.1
-        self.fade = True
-    
-    def update(self) -> bool:
-        """Met à jour la particule"""
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        self.life -= 1
-        
-        # Friction
-        self.vx *= 0.98
-        self.vy *= 0.98
+        # nom -> [couleur, durée (None: jusqu'à clear), temps restant, opacité maximale]
+        self.actifs = {}
+        self._surfaces = {}
+        # Un fondu au noir terminé laisse l'écran noir jusqu'au fondu suivant
+        self._vers_noir = False
+    
+    def start(self, name: str, color: Tuple[int, int, int], duration: Optional[float], alpha: int = 255) -> None:
+        """Démarre (ou relance) un effet pour duration ms"""
+        self.actifs[name] = [color, duration, duration, alpha]
+    
+    def flash(self, color: Tuple[int, int, int], duration: float) -> None:
+        """Flash de couleur qui s'estompe"""
+        self.start("flash", color, duration)
+    
+    def fade_out(self, duration: float) -> None:
+        """Fondu vers le noir; l'écran reste noir à la fin"""
+        self._vers_noir = True
+        self.start("fade", BLACK, duration)
+    
+    def fade_in(self, duration: float) -> None:
+        """Fondu depuis le noir"""
+        self._vers_noir = False
+        self.start("fade", BLACK, duration)
+    
+    def vignette(self, color: Tuple[int, int, int] = RED, duration: float = 400, alpha: int = 200) -> None:
+        """Bords de l'écran colorés qui s'estompent (dégâts)"""
+        self.start("vignette", color, duration, alpha)
+    
+    def tint(self, color: Tuple[int, int, int], alpha: int = 60, duration: Optional[float] = None) -> None:
+        """Teinte de tout l'écran, constante sans durée, décroissante sinon"""
+        self.start("tint", color, duration, alpha)
+    
+    def clear(self, name: Optional[str] = None) -> None:
+        """Arrête un effet, ou tous"""
+        if name is None:
+            self.actifs.clear()
+        else:
+            self.actifs.pop(name, None)
+    
+    def remaining(self, name: str) -> float:
+        """Temps restant d'un effet en ms (0 s'il est inactif ou sans durée)"""
+        effet = self.actifs.get(name)
+        return effet[2] if effet is not None and effet[1] is not None else 0
+    
+    def active(self) -> bool:
+        """Indique si un effet est affiché"""
+        return bool(self.actifs)
+    
+    def animating(self) -> bool:
+        """Indique si un effet change encore (teinte sans durée et noir maintenu exclus)"""
+        return any(effet[1] is not None and effet[2] > 0 for effet in self.actifs.values())
+    
+    def update(self, dt: float) -> None:
+        """Avance les effets de dt ms"""
+        for name, effet in list(self.actifs.items()):
+            if effet[1] is None:
+                continue
+            effet[2] -= dt
+            # Tolérance: les durées en images ne tombent pas juste en ms
+            if effet[2] <= 1e-6:
+                if name == "fade" and self._vers_noir:
+                    effet[2] = 0
+                else:
+                    del self.actifs[name]
+    
+    def alpha(self, name: str) -> int:
+        """Opacité courante d'un effet actif"""
+        _, duration, remaining, alpha = self.actifs[name]
+        if duration is None:
+            return alpha
+        if name == "flash":
+            return int(alpha * min(1.0, remaining / self.DECLIN_FLASH))
+        fraction = remaining / duration if duration > 0 else 0.0
+        if name == "fade" and self._vers_noir:
+            fraction = 1.0 - fraction
+        return int(alpha * fraction)
+    
+    def draw(self, screen: pygame.Surface) -> None:
+        """Compose les effets actifs sur l'écran"""
+        for name in self.ORDRE:
+            effet = self.actifs.get(name)
+            if effet is None:
+                continue
+            alpha = self.alpha(name)
+            if alpha <= 0:
+                continue
+            surface = self._surface(name, effet[0])
+            # Voile opaque: copie simple, bien plus rapide qu'un mélange à 255
+            # (la vignette garde son alpha par pixel)
+            opaque = alpha >= 255 and not surface.get_flags() & pygame.SRCALPHA
+            surface.set_alpha(None if opaque else alpha)
+            screen.blit(surface, (0, 0))
+    
+    def _surface(self, name: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Surface persistante d'un effet, remplie seulement au changement de couleur"""
+        entree = self._surfaces.get(name)
+        if entree is not None and entree[1] == color:
+            return entree[0]
+        if name == "vignette":
+            surface = self._vignette(color)
+        else:
+            surface = entree[0] if entree is not None else pygame.Surface(self.size)
+            if entree is None and pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            surface.fill(color)
+        self._surfaces[name] = (surface, color)
+        return surface
+    
+    def _vignette(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Vignette: transparente au centre, de plus en plus opaque vers les bords"""
+        width, height = self.size
+        surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        surface.fill((*color, 255))
+        xs = (np.arange(width) - width / 2) / (width / 2)
+        ys = (np.arange(height) - height / 2) / (height / 2)
+        distance = np.sqrt(xs[:, None] ** 2 + ys[None, :] ** 2) / math.sqrt(2)
+        opacite = np.clip((distance - 0.45) / 0.55, 0.0, 1.0) ** 2
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[:] = (255 * opacite).astype(np.uint8)
+        del alpha
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+# Couleur des éclairs d'orage
+ECLAIR = (220, 225, 255)
+
+class Weather:
+    """Pluie, neige et orage en colonnes NumPy (x, y, vitesse de chute, phase)
+    
+    Chute, balancement et renvoi en haut de l'écran sont vectorisés; toutes
+    les gouttes d'une météo partagent une empreinte (traînée ou flocon),
+    relevée sur le tracé pygame puis tamponnée d'un coup dans les pixels de
+    l'écran.
+    """
+    
+    # Météo -> (nombre, vitesse de chute min et max en px/image, vent en px par px de chute, couleur)
+    TYPES = {
+        "rain": (100, 2.0, 5.0, 0.0, BLUE),
+        "snow": (50, 0.5, 2.0, 0.0, WHITE),
+        "storm": (5000, 9.0, 16.0, 0.25, (150, 160, 220)),
+    }
+    
+    # Hauteur de la bande au-dessus de l'écran d'où repartent les gouttes
+    MARGE = 100
+    
+    def __init__(self, uniformes: Any, size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self._uniformes = uniformes
+        self.size = size
+        self.kind = "clear"
+        self.x = self.y = self.speed = self.phase = np.zeros(0, np.float32)
+        self._empreintes = {}
+    
+    def __len__(self) -> int:
+        return len(self.x)
+    
+    def set(self, kind: str) -> None:
+        """Remplit l'écran des gouttes d'une météo (aucune pour clear)"""
+        self.kind = kind
+        if kind not in self.TYPES:
+            self.x = self.y = self.speed = self.phase = np.zeros(0, np.float32)
+            return
+        count = self.TYPES[kind][0]
+        width, height = self.size
+        x, y, speed, phase = self._tirages(4 * count).reshape(4, count)
+        self.x = (x * width).astype(np.float32)
+        self.y = (y * (height + self.MARGE) - self.MARGE).astype(np.float32)
+        self.speed = self._vitesses(speed)
+        self.phase = (phase * 2 * math.pi).astype(np.float32)
+    
+    def _tirages(self, n: int) -> np.ndarray:
+        """n tirages uniformes dans [0, 1)"""
+        return np.asarray(self._uniformes(n), np.float32)
+    
+    def _vitesses(self, tirages: np.ndarray) -> np.ndarray:
+        """Vitesses de chute de la météo courante, à partir de tirages uniformes"""
+        _, lente, rapide, _, _ = self.TYPES[self.kind]
+        return (lente + (rapide - lente) * tirages).astype(np.float32)
+    
+    def update(self, steps: float = 1.0) -> None:
+        """Avance de steps images: chute, vent ou balancement, renvoi en haut"""
+        if len(self.x) == 0:
+            return
+        width, height = self.size
+        self.y += self.speed * steps
+        vent = self.TYPES[self.kind][3]
+        if vent:
+            self.x += self.speed * (vent * steps)
+        if self.kind == "snow":
+            self.x += np.sin(self.y * 0.01 + self.phase) * (0.5 * steps)
+        np.mod(self.x, width, out=self.x)
         
-        return self.life > 0
+        tombees = np.flatnonzero(self.y > height)
+        if len(tombees):
+            x, y, speed = self._tirages(3 * len(tombees)).reshape(3, -1)
+            self.x[tombees] = x * width
+            self.y[tombees] = -self.MARGE * y
+            self.speed[tombees] = self._vitesses(speed)
     
-    def draw(self, screen: pygame.Surface):
-        """Dessine la particule"""
-        if self.life > 0:
-            alpha = int(255 * (self.life / self.max_life)) if self.fade else 255
-            color = (*self.color[:3], alpha)
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.size)
+    def _empreinte(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Décalages des pixels d'une goutte depuis son sommet"""
+        empreinte = self._empreintes.get(self.kind)
+        if empreinte is None:
+            gabarit = pygame.Surface((24, 24))
+            if self.kind == "snow":
+                pygame.draw.circle(gabarit, WHITE, (12, 12), 2)
+            else:
+                # Traînée de 10 pixels, inclinée par le vent
+                vent = self.TYPES[self.kind][3]
+                pygame.draw.line(gabarit, WHITE, (12, 12), (12 + round(10 * vent), 22), 1)
+            dx, dy = np.nonzero(pygame.surfarray.array2d(gabarit))
+            empreinte = self._empreintes[self.kind] = (dx - 12, dy - 12)
+        return empreinte
+    
+    def draw(self, screen: pygame.Surface) -> None:
+        """Dessine toutes les gouttes"""
+        if len(self.x) == 0:
+            return
+        couleur = self.TYPES[self.kind][4]
+        xs, ys = self.x.astype(np.int32), self.y.astype(np.int32)
+        if screen.get_bytesize() not in (1, 2, 4):
+            dxs, dys = self._empreinte()
+            for x, y in zip(xs.tolist(), ys.tolist()):
+                for dx, dy in zip(dxs.tolist(), dys.tolist()):
+                    screen.set_at((x + dx, y + dy), couleur)
+            return
+        stamp(screen, [(xs, ys, screen.map_rgb(couleur), *self._empreinte())])
 
 class EffectManager:
     """Gestionnaire d'effets visuels"""
     
-    def __init__(self):
-        self.particles: List[Particle] = []
+    def __init__(self, aleatoire: Optional[Any] = None):
+        # Tirages cosmétiques pré-générés: sans effet sur le déroulement du jeu
+        self._aleatoire = aleatoire if aleatoire is not None else rng.reserve(rng.FLUX_EFFETS)
+        # Particules soumises à la gravité et à la friction
+        self.particles = ParticlePool(gravity=0.1, friction=0.98)
         self.screen_shake = 0
-        self.flash_effect = 0
-        self.rain_particles = []
-        self.snow_particles = []
+        # Flash, fondus, vignette et teinte: voiles persistants animés par le temps
+        self.post = PostProcess()
         self.weather = "clear"  # clear, rain, snow, storm
+        self.precipitation = Weather(self._uniformes)
+        # Temps avant le prochain éclair d'orage (ms)
+        self._eclair = 0.0
+    
+    def _uniformes(self, n: int) -> np.ndarray:
+        """n tirages uniformes dans [0, 1) du flux des effets"""
+        if hasattr(self._aleatoire, 'uniformes'):
+            return self._aleatoire.uniformes(n)
+        return np.array([self._aleatoire.random() for _ in range(n)])
+    
+    def _burst(self, x: int, y: int, count: int, speed: Tuple[float, float], life: Tuple[int, int],
+               size: Tuple[int, int], colors: Sequence[Tuple[int, int, int]], rise: float = 0.0) -> None:
+        """Émet d'un coup count particules dans des directions aléatoires
+        
+        Vitesse, vie et taille sont tirées uniformément dans leurs intervalles
+        (bornes entières incluses pour la vie et la taille).
+        """
+        angle, vitesse, vie, taille, couleur = self._uniformes(5 * count).reshape(5, count)
+        angle *= 2 * math.pi
+        vitesse = speed[0] + (speed[1] - speed[0]) * vitesse
+        indices = np.array([self.particles.color_index(color) for color in colors])
+        self.particles.emit(x, y, np.cos(angle) * vitesse, np.sin(angle) * vitesse - rise,
+                            life[0] + np.floor((life[1] - life[0] + 1) * vie),
+                            size[0] + np.floor((size[1] - size[0] + 1) * taille),
+                            colors=indices[(len(indices) * couleur).astype(np.intp)])
     
     def add_explosion(self, x: int, y: int, color: Tuple[int, int, int] = RED, count: int = 20):
         """Ajoute un effet d'explosion"""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            particle = Particle(x, y, color, (vx, vy), random.randint(30, 60), random.randint(2, 5))
-            self.particles.append(particle)
+        self._burst(x, y, count, (2, 8), (30, 60), (2, 5), [color])
     
     def add_heal_effect(self, x: int, y: int):
         """Ajoute un effet de soin"""
-        for _ in range(15):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 4)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed - 2  # Remonte
-            particle = Particle(x, y, GREEN, (vx, vy), random.randint(40, 80), 2)
-            self.particles.append(particle)
+        # Les particules remontent
+        self._burst(x, y, 15, (1, 4), (40, 80), (2, 2), [GREEN], rise=2)
     
     def add_damage_effect(self, x: int, y: int):
         """Ajoute un effet de dégâts"""
-        for _ in range(10):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            particle = Particle(x, y, RED, (vx, vy), random.randint(20, 40), 2)
-            self.particles.append(particle)
+        self._burst(x, y, 10, (1, 3), (20, 40), (2, 2), [RED])
     
     def add_magic_effect(self, x: int, y: int):
         """Ajoute un effet magique"""
-        for _ in range(25):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(0.5, 3)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            color = random.choice([PURPLE, BLUE, YELLOW])
-            particle = Particle(x, y, color, (vx, vy), random.randint(50, 100), 3)
-            self.particles.append(particle)
+        self._burst(x, y, 25, (0.5, 3), (50, 100), (3, 3), [PURPLE, BLUE, YELLOW])
     
     def add_screen_shake(self, intensity: int = 10):
         """Ajoute un effet de tremblement d'écran"""
         self.screen_shake = intensity
     
     def add_flash(self, color: Tuple[int, int, int] = WHITE, duration: int = 10):
-        """Ajoute un effet de flash"""
-        self.flash_effect = duration
-        self.flash_color = color
+        """Ajoute un effet de flash de duration images"""
+        self.post.flash(color, duration * 1000 / FPS)
+    
+    @property
+    def flash_effect(self) -> float:
+        """Images restantes du flash"""
+        return round(self.post.remaining("flash") * FPS / 1000, 6)
+    
+    def add_fade_out(self, duration: float = 400):
+        """Fondu au noir en duration ms"""
+        self.post.fade_out(duration)
+    
+    def add_fade_in(self, duration: float = 400):
+        """Apparition depuis le noir en duration ms"""
+        self.post.fade_in(duration)
+    
+    def add_damage_vignette(self, color: Tuple[int, int, int] = RED, duration: float = 400):
+        """Assombrit les bords de l'écran après des dégâts"""
+        self.post.vignette(color, duration)
+    
+    def add_tint(self, color: Tuple[int, int, int], alpha: int = 60, duration: Optional[float] = None):
+        """Teinte l'écran (jusqu'à clear_tint sans durée)"""
+        self.post.tint(color, alpha, duration)
+    
+    def clear_tint(self):
+        """Retire la teinte"""
+        self.post.clear("tint")
     
     def set_weather(self, weather_type: str):
         """Définit le type de météo"""
         self.weather = weather_type
-        if weather_type == "rain":
-            self._init_rain()
-        elif weather_type == "snow":
-            self._init_snow()
-    
-    def _init_rain(self):
-        """Initialise la pluie"""
-        self.rain_particles = []
-        for _ in range(100):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(-100, 0)
-            self.rain_particles.append([x, y, random.uniform(2, 5)])
-    
-    def _init_snow(self):
-        """Initialise la neige"""
-        self.snow_particles = []
-        for _ in range(50):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(-50, 0)
-            self.snow_particles.append([x, y, random.uniform(0.5, 2), random.uniform(0.1, 0.3)])
-    
-    def update(self):
-        """Met à jour tous les effets"""
+        self.precipitation.set(weather_type)
+        if weather_type == "storm":
+            self._eclair = self._prochain_eclair()
+    
+    def _prochain_eclair(self) -> float:
+        """Délai avant l'éclair suivant: parfois un second éclair suit de près"""
+        if self._aleatoire.random() < 0.3:
+            return self._aleatoire.uniform(80, 200)
+        return self._aleatoire.uniform(2000, 6000)
+    
+    def update(self, dt: Optional[float] = None):
+        """Met à jour tous les effets, dt en ms (une image par défaut)"""
         # Particules
-        self.particles = [p for p in self.particles if p.update()]
+        self.particles.update()
         
         # Tremblement d'écran
         if self.screen_shake > 0:
             self.screen_shake -= 1
         
-        # Flash
-        if self.flash_effect > 0:
-            self.flash_effect -= 1
+        # Post-traitement animé par le temps
+        dt = 1000 / FPS if dt is None else dt
+        self.post.update(dt)
         
         # Météo
-        if self.weather == "rain":
-            self._update_rain()
-        elif self.weather == "snow":
-            self._update_snow()
-    
-    def _update_rain(self):
-        """Met à jour la pluie"""
-        for drop in self.rain_particles:
-            drop[1] += drop[2]  # Vitesse de chute
-            if drop[1] > SCREEN_HEIGHT:
-                drop[1] = random.randint(-100, 0)
-                drop[0] = random.randint(0, SCREEN_WIDTH)
-    
-    def _update_snow(self):
-        """Met à jour la neige"""
-        for flake in self.snow_particles:
-            flake[1] += flake[2]  # Vitesse de chute
-            flake[0] += math.sin(flake[1] * 0.01) * 0.5  # Mouvement latéral
-            if flake[1] > SCREEN_HEIGHT:
-                flake[1] = random.randint(-50, 0)
-                flake[0] = random.randint(0, SCREEN_WIDTH)
+        self.precipitation.update(dt * FPS / 1000)
+        if self.weather == "storm":
+            self._eclair -= dt
+            if self._eclair <= 0:
+                self.post.flash(ECLAIR, 150)
+                self._eclair = self._prochain_eclair()
     
     def draw(self, screen: pygame.Surface):
         """Dessine tous les effets"""
         # Météo
-        if self.weather == "rain":
-            for drop in self.rain_particles:
-                pygame.draw.line(screen, BLUE, (drop[0], drop[1]), (drop[0], drop[1] + 10), 1)
-        elif self.weather == "snow":
-            for flake in self.snow_particles:
-                pygame.draw.circle(screen, WHITE, (int(flake[0]), int(flake[1])), 2)
+        self.precipitation.draw(screen)
         
-        # Particules
-        for particle in self.particles:
-            particle.draw(screen)
+        # Particules, en fondu selon leur vie restante
+        self.particles.draw(screen, fade=True)
         
-        # Flash
-        if self.flash_effect > 0:
-            alpha = int(255 * (self.flash_effect / 10))
-            flash_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            flash_surface.set_alpha(alpha)
-            flash_surface.fill(self.flash_color)
-            screen.blit(flash_surface, (0, 0))
+        # Flash, fondu, vignette et teinte
+        self.post.draw(screen)
+    
+    def get_particles_rect(self) -> Optional[pygame.Rect]:
+        """Rectangle englobant les particules, None s'il n'y en a pas"""
+        return self.particles.bounds()
+    
+    def needs_full_redraw(self) -> bool:
+        """Indique si un effet plein écran (post-traitement, météo) est actif
+        
+        Le tremblement n'en fait pas partie: il décale la présentation du
+        tampon arrière, pas le rendu de la scène.
+        """
+        return self.post.active() or self.weather != "clear"
+    
+    def is_animating(self) -> bool:
+        """Indique si l'écran change d'une image à l'autre sans événement"""
+        return (len(self.particles) > 0 or self.screen_shake > 0 or self.weather != "clear"
+                or self.post.animating())
     
     def get_screen_offset(self) -> Tuple[int, int]:
         """Retourne l'offset pour le tremblement d'écran"""
         if self.screen_shake > 0:
-            return (random.randint(-self.screen_shake, self.screen_shake),
-                    random.randint(-self.screen_shake, self.screen_shake))
+            return (self._aleatoire.randint(-self.screen_shake, self.screen_shake),
+                    self._aleatoire.randint(-self.screen_shake, self.screen_shake))
         return (0, 0)
 
 class ComboSystem:
     """Système de combos et critiques"""
     
-    def __init__(self):
+    def __init__(self, aleatoire: Optional[Any] = None):
+        self._aleatoire = aleatoire if aleatoire is not None else rng.flux(rng.FLUX_COMBO)
         self.combo_count = 0
         self.last_hit_time = 0
         self.combo_timeout = 2000  # 2 secondes
@@ -223,7 +444,7 @@ class ComboSystem:
         }
         
         # Vérifier si c'est un critique
-        if random.random() < self.critical_chance + (self.combo_count * 0.05):
+        if self._aleatoire.random() < self.critical_chance + (self.combo_count * 0.05):
             result['is_critical'] = True
             result['damage_multiplier'] = 2.0 + (self.combo_count * 0.2)
         
@@ -344,5 +565,5 @@ class MiniGame:
         # Instructions
         renderer.draw_text("Cliquez quand la barre atteint la zone jaune!", 
                           SCREEN_WIDTH // 2, y - 50, 'medium', WHITE, center=True)
-        renderer.draw_text(f"Temps: {self.timer}ms", 
-                          SCREEN_WIDTH // 2, y + bar_height + 20, 'small', WHITE, center=True)
+        renderer.draw_glyph_text(f"Temps: {self.timer}ms", 
+                                SCREEN_WIDTH // 2, y + bar_height + 20, 'small', WHITE, center=True)
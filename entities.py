@@ -4,13 +4,37 @@ Entités du jeu Roguelike - Implémentations concrètes
 Respect des principes SOLID
 """
 
-import random
-from typing import List, Optional
+import json
+import os
+from typing import Any, List, Optional, Tuple
+import config
+import rng
 from interfaces import (
     ICharacter, IPlayer, IRoom, ICombatRoom, ISpecialRoom, 
     IPowerUp, Drawable, Updatable
 )
 
+# Flux aléatoires des entités (réinitialisés sur place par rng.seed)
+_rng_combat = rng.flux(rng.FLUX_COMBAT)
+_rng_butin = rng.flux(rng.FLUX_BUTIN)
+_rng_noms = rng.flux(rng.FLUX_NOMS)
+
+def charger_stats_calibrees(chemin: str = config.FICHIER_STATS_CALIBREES) -> bool:
+    """Charge une table de stats calibrées dans config.STATS_CALIBREES
+
+    Retourne False si le fichier est absent: les facteurs par défaut restent.
+    """
+    if not os.path.exists(chemin):
+        return False
+    with open(chemin, 'r', encoding='utf-8') as f:
+        table = json.load(f)
+    config.STATS_CALIBREES = {int(difficulty): stats for difficulty, stats in table.items()}
+    return True
+
+def stats_calibrees(difficulty: int, cle: str) -> Optional[Any]:
+    """Entrée de la table calibrée pour une difficulté (None si absente)"""
+    return config.STATS_CALIBREES.get(difficulty, {}).get(cle)
+
 # =============================================================================
 # SINGLE RESPONSIBILITY PRINCIPLE (SRP)
 # =============================================================================
@@ -48,7 +72,7 @@ class Character(ICharacter):
         if not self.est_vivant() or not cible.est_vivant():
             return 0
         
-        degats = random.randint(1, self._attaque)
+        degats = _rng_combat.randint(1, self._attaque)
         cible._pv_actuels = max(0, cible._pv_actuels - degats)
         return degats
     
@@ -63,7 +87,7 @@ class Player(Character, IPlayer):
     """Joueur - SRP: Gère uniquement les stats du joueur"""
     
     def __init__(self, nom: str = "Héros"):
-        super().__init__(nom, 100, 20)  # Valeurs par défaut
+        super().__init__(nom, config.JOUEUR_PV_MAX, config.JOUEUR_ATTAQUE)
         self._ennemis_tues = 0
         self._boss_vaincus = 0
         self._score = 0
@@ -89,21 +113,21 @@ class Player(Character, IPlayer):
     def tuer_ennemi(self) -> None:
         """Marque un ennemi comme tué et ajoute le score"""
         self._ennemis_tues += 1
-        self.ajouter_score(100)  # Score pour ennemi
+        self.ajouter_score(config.SCORE_ENNEMI)
     
     def vaincre_boss(self) -> None:
         """Marque un boss comme vaincu et ajoute le score"""
         self._boss_vaincus += 1
-        self.ajouter_score(500)  # Score pour boss
+        self.ajouter_score(config.SCORE_BOSS)
     
     def survivre_tour(self) -> None:
         """Ajoute des points de survie"""
         self._tours_survies += 1
-        self.ajouter_score(10)  # Score de survie
+        self.ajouter_score(config.SCORE_SURVIE)
     
     def traverser_salle(self) -> None:
         """Ajoute des points pour traverser une salle"""
-        self.ajouter_score(50)  # Score pour salle
+        self.ajouter_score(config.SCORE_SALLE)
     
     def augmenter_attaque(self, bonus: int) -> None:
         """Augmente l'attaque du joueur"""
@@ -120,11 +144,19 @@ class Enemy(Character):
     NOMS = ["Gobelin", "Orc", "Squelette", "Loup", "Araignée"]
     
     def __init__(self, difficulty: int = 1):
-        nom = random.choice(self.NOMS)
-        # Ajuster les stats selon la difficulté
-        pv = int(30 * (1 + (difficulty - 1) * 0.5))
-        attaque = int(15 * (1 + (difficulty - 1) * 0.3))
+        nom = _rng_noms.choice(self.NOMS)
+        pv, attaque = self.stats(difficulty)
         super().__init__(nom, pv, attaque)
+    
+    @staticmethod
+    def stats(difficulty: int = 1) -> Tuple[int, int]:
+        """Retourne (pv, attaque) ajustés selon la difficulté (table calibrée prioritaire)"""
+        calibre = stats_calibrees(difficulty, 'ennemi')
+        if calibre:
+            return calibre['pv'], calibre['attaque']
+        pv = int(config.ENNEMI_PV_MAX * (1 + (difficulty - 1) * 0.5))
+        attaque = int(config.ENNEMI_ATTAQUE * (1 + (difficulty - 1) * 0.3))
+        return pv, attaque
 
 class Boss(Character):
     """Boss - SRP: Gère uniquement les stats d'un boss"""
@@ -132,11 +164,19 @@ class Boss(Character):
     NOMS = ["Dragon", "Liche", "Démon", "Géant", "Hydre"]
     
     def __init__(self, difficulty: int = 1):
-        nom = random.choice(self.NOMS)
-        # Ajuster les stats selon la difficulté
-        pv = int(80 * (1 + (difficulty - 1) * 0.7))
-        attaque = int(25 * (1 + (difficulty - 1) * 0.5))
+        nom = _rng_noms.choice(self.NOMS)
+        pv, attaque = self.stats(difficulty)
         super().__init__(nom, pv, attaque)
+    
+    @staticmethod
+    def stats(difficulty: int = 1) -> Tuple[int, int]:
+        """Retourne (pv, attaque) ajustés selon la difficulté (table calibrée prioritaire)"""
+        calibre = stats_calibrees(difficulty, 'boss')
+        if calibre:
+            return calibre['pv'], calibre['attaque']
+        pv = int(config.BOSS_PV_MAX * (1 + (difficulty - 1) * 0.7))
+        attaque = int(config.BOSS_ATTAQUE * (1 + (difficulty - 1) * 0.5))
+        return pv, attaque
 
 # =============================================================================
 # POWER-UPS - SRP
@@ -258,7 +298,7 @@ class HealingRoom(SpecialRoom):
     
     def appliquer_effet(self, joueur: IPlayer) -> None:
         """Soigne le joueur"""
-        soin = int(joueur.pv_max * 0.15)  # 15% des PV max
+        soin = int(joueur.pv_max * config.POURCENTAGE_SOIN)
         joueur.soigner(soin)
         print(f"Vous récupérez {soin} PV!")
 
@@ -270,7 +310,7 @@ class UpgradeRoom(SpecialRoom):
     
     def appliquer_effet(self, joueur: IPlayer) -> None:
         """Améliore l'attaque du joueur"""
-        bonus = random.randint(3, 8)
+        bonus = _rng_butin.randint(config.BONUS_ATTAQUE_MIN, config.BONUS_ATTAQUE_MAX)
         joueur.augmenter_attaque(bonus)
         print(f"Votre attaque augmente de {bonus}!")
 
@@ -284,10 +324,10 @@ class PowerUpRoom(SpecialRoom):
     def _generer_power_up(self) -> IPowerUp:
         """Génère un power-up aléatoire"""
         power_ups = [
-            PowerUp("Potion de Force", "attaque", 0, random.randint(5, 15)),
-            PowerUp("Potion de Soin", "regeneration", 0, random.randint(20, 40)),
+            PowerUp("Potion de Force", "attaque", 0, _rng_butin.randint(5, 15)),
+            PowerUp("Potion de Soin", "regeneration", 0, _rng_butin.randint(20, 40)),
         ]
-        return random.choice(power_ups)
+        return _rng_butin.choice(power_ups)
     
     def appliquer_effet(self, joueur: IPlayer) -> None:
         """Applique le power-up au joueur"""
@@ -3,10 +3,10 @@
 Module d'événements aléatoires et d'easter eggs pour rendre le jeu plus fun
 """
 
-import random
 import pygame
-from typing import List, Dict, Optional, Callable
+from typing import Any, List, Dict, Optional, Callable
 from config import *
+import rng
 
 class RandomEvent:
     """Événement aléatoire"""
@@ -23,10 +23,13 @@ class RandomEvent:
 class EventManager:
     """Gestionnaire d'événements aléatoires"""
     
-    def __init__(self):
+    def __init__(self, aleatoire: Optional[Any] = None):
+        self._aleatoire = aleatoire if aleatoire is not None else rng.flux(rng.FLUX_EVENEMENTS)
         self.events: List[RandomEvent] = []
         self.active_events: List[RandomEvent] = []
         self.event_history: List[str] = []
+        # Météo annoncée par le dernier changement de temps, affichée par le jeu
+        self.weather = "clear"
         self._init_events()
     
     def _init_events(self):
@@ -101,7 +104,7 @@ class EventManager:
     
     def _treasure_effect(self, player, game_service) -> str:
         """Effet du trésor caché"""
-        gold = random.randint(50, 200)
+        gold = self._aleatoire.randint(50, 200)
         player.ajouter_score(gold)
         return f"Vous trouvez {gold} pièces d'or!"
     
@@ -113,14 +116,14 @@ class EventManager:
     
     def _merchant_effect(self, player, game_service) -> str:
         """Effet du marchand itinérant"""
-        if random.random() < 0.5:
+        if self._aleatoire.random() < 0.5:
             # Potion de soin
-            heal = random.randint(20, 40)
+            heal = self._aleatoire.randint(20, 40)
             player.soigner(heal)
             return f"Le marchand vous vend une potion de soin (+{heal} PV)!"
         else:
             # Amélioration d'attaque
-            bonus = random.randint(2, 5)
+            bonus = self._aleatoire.randint(2, 5)
             player.augmenter_attaque(bonus)
             return f"Le marchand vous vend une épée améliorée (+{bonus} attaque)!"
     
@@ -128,15 +131,15 @@ class EventManager:
         """Effet de la source magique"""
         # Restaure tous les PV et donne un bonus temporaire
         player.soigner(player.pv_max)
-        bonus = random.randint(3, 8)
+        bonus = self._aleatoire.randint(3, 8)
         player.augmenter_attaque(bonus)
         return f"La source magique vous restaure et vous donne +{bonus} attaque!"
     
     def _weather_change_effect(self, player, game_service) -> str:
         """Effet du changement de météo"""
         weathers = ["rain", "snow", "storm", "clear"]
-        new_weather = random.choice(weathers)
-        # Ici on pourrait changer la météo dans le jeu
+        new_weather = self._aleatoire.choice(weathers)
+        self.weather = new_weather
         return f"Le temps change: {new_weather}!"
     
     def _mysterious_echo_effect(self, player, game_service) -> str:
@@ -147,25 +150,25 @@ class EventManager:
             "Une voix chuchote: 'Attention aux pièges...'",
             "Les ombres semblent bouger..."
         ]
-        return random.choice(messages)
+        return self._aleatoire.choice(messages)
     
     def _trap_effect(self, player, game_service) -> str:
         """Effet du piège"""
-        damage = random.randint(5, 15)
+        damage = self._aleatoire.randint(5, 15)
         player._pv_actuels = max(1, player._pv_actuels - damage)
         return f"Piège activé! Vous perdez {damage} PV!"
     
     def _curse_effect(self, player, game_service) -> str:
         """Effet de la malédiction"""
         # Réduit temporairement l'attaque
-        penalty = random.randint(2, 5)
+        penalty = self._aleatoire.randint(2, 5)
         player.augmenter_attaque(-penalty)
         return f"Malédiction! Votre attaque diminue de {penalty}!"
     
     def check_random_event(self, player, game_service) -> Optional[str]:
         """Vérifie s'il y a un événement aléatoire"""
         for event in self.events:
-            if not event.used and random.random() < event.probability:
+            if not event.used and self._aleatoire.random() < event.probability:
                 event.used = True
                 self.active_events.append(event)
                 result = event.effect(player, game_service)
@@ -178,6 +181,7 @@ class EventManager:
         for event in self.events:
             event.used = False
         self.active_events.clear()
+        self.weather = "clear"
 
 class EasterEggManager:
     """Gestionnaire d'easter eggs et secrets"""
@@ -299,7 +303,8 @@ class DynamicDifficulty:
 class FunFeatures:
     """Collection de fonctionnalités amusantes"""
     
-    def __init__(self):
+    def __init__(self, aleatoire: Optional[Any] = None):
+        self._aleatoire = aleatoire if aleatoire is not None else rng.flux(rng.FLUX_MESSAGES)
         self.silly_messages = [
             "Votre épée brille d'un éclat suspect...",
             "L'ennemi semble surpris de vous voir!",
@@ -341,15 +346,15 @@ class FunFeatures:
     
     def get_silly_message(self) -> str:
         """Retourne un message amusant aléatoire"""
-        return random.choice(self.silly_messages)
+        return self._aleatoire.choice(self.silly_messages)
     
     def get_victory_quote(self) -> str:
         """Retourne une citation de victoire aléatoire"""
-        return random.choice(self.victory_quotes)
+        return self._aleatoire.choice(self.victory_quotes)
     
     def get_defeat_quote(self) -> str:
         """Retourne une citation de défaite aléatoire"""
-        return random.choice(self.defeat_quotes)
+        return self._aleatoire.choice(self.defeat_quotes)
     
     def get_encouragement(self) -> str:
         """Retourne un message d'encouragement"""
@@ -365,4 +370,4 @@ class FunFeatures:
             "Ne vous arrêtez pas!",
             "Vous êtes le meilleur!"
         ]
-        return random.choice(encouragements)
+        return self._aleatoire.choice(encouragements)
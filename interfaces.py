@@ -366,6 +366,12 @@ class ICombatSystem(ABC):
     def is_combat_over(self, player: IPlayer, enemy: ICharacter) -> bool:
         """Vérifie si le combat est terminé"""
         pass
+    
+    @abstractmethod
+    def resoudre_combat(self, player: IPlayer, enemy: ICharacter,
+                        tours_max: Optional[int] = None) -> List[tuple]:
+        """Résout plusieurs tours du combat en un appel"""
+        pass
 
 class IGameRenderer(ABC):
     """Interface pour le rendu du jeu"""
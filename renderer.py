@@ -5,58 +5,426 @@ Module de rendu optimisé pour le jeu Roguelike
 
 import pygame
 import math
-from typing import List, Tuple, Optional
+from collections import OrderedDict
+from typing import Any, Callable, List, Tuple, Optional, Sequence
 from config import *
+import resources
+from particles import ParticlePool
+
+# Commande de la liste d'affichage: (clé, rectangle couvert, fonction, arguments)
+Commande = Tuple[Any, pygame.Rect, Callable[..., Any], tuple]
+
+def render_button_sprite(size: Tuple[int, int], color: Tuple[int, int, int], 
+                         text_surface: pygame.Surface) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Pré-rend un bouton (fond, bordure blanche, libellé centré)
+    
+    Retourne le sprite et sa position relative au coin du bouton: un libellé
+    plus large que le bouton déborde comme s'il était dessiné directement.
+    """
+    rect = pygame.Rect((0, 0), size)
+    text_rect = text_surface.get_rect(center=rect.center)
+    bounds = rect.union(text_rect)
+    if bounds == rect:
+        sprite = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+    else:
+        sprite = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        rect.move_ip(-bounds.x, -bounds.y)
+        text_rect.move_ip(-bounds.x, -bounds.y)
+    
+    pygame.draw.rect(sprite, color, rect)
+    pygame.draw.rect(sprite, WHITE, rect, 2)
+    sprite.blit(text_surface, text_rect)
+    return sprite, bounds.topleft
+
+class TextCache:
+    """Cache LRU des surfaces de texte, borné en octets
+    
+    Les clés sont des tuples (texte, police, couleur). Quand la taille totale
+    des surfaces dépasse le budget, les moins récemment utilisées sont
+    évincées: les valeurs qui changent sans cesse (score, PV, temps) ne
+    s'accumulent plus. Les libellés épinglés ne sont jamais évincés.
+    """
+    
+    def __init__(self, budget: int = 4 * 1024 * 1024):
+        self.budget = budget
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces: 'OrderedDict[tuple, pygame.Surface]' = OrderedDict()
+        self._pinned = {}
+    
+    @staticmethod
+    def surface_bytes(surface: pygame.Surface) -> int:
+        """Mémoire occupée par les pixels d'une surface"""
+        return surface.get_pitch() * surface.get_height()
+    
+    def get(self, key: tuple, render: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Retourne la surface de la clé, rendue par render en cas d'absence"""
+        surface = self._pinned.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        surface = self._surfaces[key] = render()
+        self.bytes += self.surface_bytes(surface)
+        self._evict()
+        return surface
+    
+    def pin(self, key: tuple, render: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Épingle un libellé: rendu au besoin, il n'est plus jamais évincé"""
+        if key in self._pinned:
+            return self._pinned[key]
+        surface = self._surfaces.pop(key, None)
+        if surface is None:
+            surface = render()
+            self.bytes += self.surface_bytes(surface)
+        self._pinned[key] = surface
+        self._evict()
+        return surface
+    
+    def unpin(self, key: tuple) -> None:
+        """Rend un libellé épinglé de nouveau évinçable"""
+        surface = self._pinned.pop(key, None)
+        if surface is not None:
+            self._surfaces[key] = surface
+            self._evict()
+    
+    def _evict(self) -> None:
+        """Évince les surfaces les moins récemment utilisées au-delà du budget"""
+        while self.bytes > self.budget and self._surfaces:
+            _, surface = self._surfaces.popitem(last=False)
+            self.bytes -= self.surface_bytes(surface)
+            self.evictions += 1
+    
+    def clear(self) -> None:
+        """Vide le cache, libellés épinglés exceptés"""
+        for surface in self._surfaces.values():
+            self.bytes -= self.surface_bytes(surface)
+        self._surfaces.clear()
+    
+    def stats(self) -> dict:
+        """Compteurs et occupation mémoire du cache"""
+        return {
+            'entries': len(self._surfaces) + len(self._pinned),
+            'pinned': len(self._pinned),
+            'bytes': self.bytes,
+            'budget': self.budget,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+    
+    def __len__(self) -> int:
+        return len(self._surfaces) + len(self._pinned)
+    
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._pinned or key in self._surfaces
+
+class GlyphCache:
+    """Glyphes pré-rendus par (police, couleur)
+    
+    Les textes qui changent presque à chaque image (score, PV, compteurs)
+    sont composés glyphe par glyphe avec les largeurs d'avance en cache:
+    un nouveau nombre ne coûte plus aucun rendu de police, seulement des
+    blits. Les chiffres et caractères courants sont rendus dès la première
+    utilisation d'une police, les autres caractères à leur première
+    apparition.
+    """
+    
+    COMMON_CHARS = "0123456789/:+-x%.!() "
+    
+    def __init__(self):
+        # (police, couleur) -> {caractère: (surface, avance)}
+        self._tables = {}
+        self.renders = 0
+    
+    def _table(self, font: pygame.font.Font, color: Tuple[int, int, int]) -> dict:
+        """Table des glyphes d'une police et d'une couleur"""
+        key = (font, color)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables[key] = {}
+            for char in self.COMMON_CHARS:
+                self._render(table, font, color, char)
+        return table
+    
+    def _render(self, table: dict, font: pygame.font.Font, color: Tuple[int, int, int], char: str):
+        """Rend un glyphe et retient son avance"""
+        self.renders += 1
+        surface = font.render(char, True, color)
+        metrics = font.metrics(char)
+        advance = metrics[0][4] if metrics and metrics[0] else surface.get_width()
+        glyph = table[char] = (surface, advance)
+        return glyph
+    
+    def layout(self, font: pygame.font.Font, color: Tuple[int, int, int], text: str, 
+               x: int, y: int) -> Tuple[list, pygame.Rect]:
+        """Place les glyphes du texte en (x, y): (liste pour Surface.blits, rectangle couvert)"""
+        table = self._tables.get((font, color)) or self._table(font, color)
+        blits = []
+        pen = x
+        for char in text:
+            glyph, advance = table.get(char) or self._render(table, font, color, char)
+            blits.append((glyph, (pen, y)))
+            pen += advance
+        return blits, pygame.Rect(x, y, pen - x, font.get_height())
+    
+    def size(self, font: pygame.font.Font, color: Tuple[int, int, int], text: str) -> Tuple[int, int]:
+        """Taille du texte composé"""
+        return self.layout(font, color, text, 0, 0)[1].size
+    
+    def draw(self, surface: pygame.Surface, font: pygame.font.Font, color: Tuple[int, int, int], 
+             text: str, x: int, y: int) -> pygame.Rect:
+        """Compose le texte en (x, y) et retourne le rectangle couvert"""
+        blits, rect = self.layout(font, color, text, x, y)
+        surface.blits(blits, False)
+        return rect
+    
+    def clear(self) -> None:
+        """Oublie tous les glyphes"""
+        self._tables.clear()
+
+class IconAtlas:
+    """Atlas d'icônes pré-rendues avec transparence
+    
+    Chaque combinaison (type, taille, couleur) est dessinée une seule fois,
+    à la première utilisation, par la fonction de géométrie fournie, puis
+    rangée par étagères dans des pages de l'atlas; afficher une icône devient
+    un blit d'un sous-rectangle. Avec supersample > 1, la géométrie est tracée
+    à plus grande échelle puis réduite avec lissage (anticrénelage).
+    """
+    
+    def __init__(self, draw_geometry: Callable[[pygame.Surface, str, int, int, int, Tuple[int, int, int]], None],
+                 supersample: int = 1, page_size: int = 512):
+        self.draw_geometry = draw_geometry
+        self.supersample = supersample
+        self.page_size = page_size
+        self.pages: List[pygame.Surface] = []
+        # (type, taille, couleur) -> (page, rectangle dans la page, décalage depuis l'origine) ou None
+        self.entries = {}
+        self._x = self._y = self._shelf_height = 0
+    
+    def draw(self, surface: pygame.Surface, icon_type: str, x: int, y: int, size: int, 
+             color: Tuple[int, int, int]) -> None:
+        """Dessine une icône dont l'origine de la géométrie est en (x, y)"""
+        key = (icon_type, size, color)
+        entry = self.entries[key] if key in self.entries else self._bake(key)
+        if entry is not None:
+            page, area, (dx, dy) = entry
+            surface.blit(page, (x + dx, y + dy), area)
+    
+    def prewarm(self, combinations) -> None:
+        """Pré-rend des combinaisons (type, taille, couleur) avant la première image"""
+        for key in combinations:
+            if tuple(key) not in self.entries:
+                self._bake(tuple(key))
+    
+    def _bake(self, key: tuple):
+        """Rend une icône sur un canevas, la recadre et la range dans l'atlas"""
+        icon_type, size, color = key
+        k = self.supersample
+        # Canevas large: les géométries centrées et leurs ombres débordent de size
+        origin = size + 4
+        canvas = pygame.Surface(((2 * origin + size) * k, (2 * origin + size) * k), pygame.SRCALPHA)
+        self.draw_geometry(canvas, icon_type, origin * k, origin * k, size * k, color)
+        if k > 1:
+            canvas = pygame.transform.smoothscale(canvas, (canvas.get_width() // k, canvas.get_height() // k))
+        
+        bounds = canvas.get_bounding_rect()
+        if bounds.width == 0 or bounds.height == 0:
+            # Type inconnu: rien à dessiner
+            self.entries[key] = None
+            return None
+        
+        page, area = self._allocate(bounds.width, bounds.height)
+        # Les pixels semi-transparents sont copiés tels quels, sans mélange
+        page.blit(canvas, area, bounds, special_flags=pygame.BLEND_RGBA_MAX)
+        entry = self.entries[key] = (page, area, (bounds.x - origin, bounds.y - origin))
+        return entry
+    
+    def _allocate(self, width: int, height: int) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Réserve un rectangle dans la page courante (rangement par étagères)"""
+        page_size = max(self.page_size, width, height)
+        if self._x + width > page_size:
+            self._x, self._y = 0, self._y + self._shelf_height
+            self._shelf_height = 0
+        if not self.pages or self._y + height > self.pages[-1].get_height() \
+                or width > self.pages[-1].get_width():
+            page = pygame.Surface((page_size, page_size), pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                page = page.convert_alpha()
+            page.fill((0, 0, 0, 0))
+            self.pages.append(page)
+            self._x = self._y = self._shelf_height = 0
+        
+        area = pygame.Rect(self._x, self._y, width, height)
+        self._x += width
+        self._shelf_height = max(self._shelf_height, height)
+        return self.pages[-1], area
+    
+    def clear(self) -> None:
+        """Libère toutes les pages"""
+        self.pages.clear()
+        self.entries.clear()
+        self._x = self._y = self._shelf_height = 0
+
+class BackBuffer:
+    """Tampon arrière persistant dans lequel la scène est dessinée
+
+    Le rendu (quel qu'il soit) dessine dans surface; present() recopie sur
+    l'affichage les seules régions modifiées. Pendant un tremblement, tout le
+    tampon est recopié décalé et les bords découverts sont remplis: la scène
+    n'est pas redessinée aux coordonnées décalées. Le premier affichage non
+    décalé qui suit recopie de nouveau tout le tampon.
+    """
+
+    def __init__(self, display: pygame.Surface, border: Tuple[int, int, int] = BLACK):
+        self.display = display
+        self.surface = display.copy()
+        self.border = border
+        self.offset = (0, 0)
+
+    def present(self, regions: Sequence[pygame.Rect], full: bool = False,
+                offset: Tuple[int, int] = (0, 0)) -> List[pygame.Rect]:
+        """Recopie le tampon sur l'affichage
+
+        regions sont les zones modifiées du tampon (full: tout le tampon).
+        Retourne les rectangles de l'affichage à passer à pygame.display.update.
+        """
+        ecran = self.display.get_rect()
+        dx, dy = offset
+        if offset == (0, 0) and self.offset == (0, 0) and not full:
+            for region in regions:
+                self.display.blit(self.surface, region, region)
+            return list(regions)
+
+        self.offset = (dx, dy)
+        for bord in self._bords(dx, dy):
+            self.display.fill(self.border, bord)
+        self.display.blit(self.surface, (dx, dy))
+        return [ecran]
+
+    def _bords(self, dx: int, dy: int) -> List[pygame.Rect]:
+        """Bandes de l'affichage découvertes par un décalage"""
+        width, height = self.display.get_size()
+        bords = []
+        if dx > 0:
+            bords.append(pygame.Rect(0, 0, dx, height))
+        elif dx < 0:
+            bords.append(pygame.Rect(width + dx, 0, -dx, height))
+        if dy > 0:
+            bords.append(pygame.Rect(0, 0, width, dy))
+        elif dy < 0:
+            bords.append(pygame.Rect(0, height + dy, width, -dy))
+        return bords
 
 class OptimizedRenderer:
     """Rendu optimisé avec cache et réutilisation d'objets"""
     
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: pygame.Surface, use_layers: bool = True, 
+                 text_budget: int = 4 * 1024 * 1024):
         self.screen = screen
         self.fonts = self._create_fonts()
-        self.cache = {}
-        self.particles = []
+        self.cache = TextCache(text_budget)
+        self.glyphs = GlyphCache()
+        self.particles = ParticlePool()
+        
+        # Icônes pré-rendues une fois par (type, taille, couleur)
+        self.icons = IconAtlas(self.draw_icon_geometry)
+        
+        # Boutons pré-rendus: (largeur, hauteur, texte, couleur) -> (sprite, décalage)
+        self.button_sprites = {}
+        
+        # Couches statiques pré-rendues, une par état: nom -> (clé, surface)
+        self.use_layers = use_layers
+        self.layers = {}
+        
+        # Rendu différé: pendant une image, les appels draw_* sont enregistrés
+        # puis seules les régions modifiées depuis l'image précédente sont repeintes
+        self._commandes: Optional[List[Commande]] = None
+        self._commandes_precedentes: List[Commande] = []
+        self._dommages_precedents: List[pygame.Rect] = []
+        self._tout_redessiner = True
+        self.full_frame = False
     
     def _create_fonts(self) -> dict:
-        """Crée les polices une seule fois"""
+        """Acquiert les polices une seule fois dans le registre partagé"""
         return {
-            'large': pygame.font.Font(None, 48),
-            'medium': pygame.font.Font(None, 32),
-            'small': pygame.font.Font(None, 24)
+            'large': resources.font(48, owner=self),
+            'medium': resources.font(32, owner=self),
+            'small': resources.font(24, owner=self)
         }
     
     def draw_text(self, text: str, x: int, y: int, font_size: str = 'medium', 
                   color: Tuple[int, int, int] = WHITE, center: bool = False) -> None:
         """Dessine du texte avec cache"""
-        cache_key = f"{text}_{font_size}_{color}"
-        if cache_key not in self.cache:
-            font = self.fonts[font_size]
-            self.cache[cache_key] = font.render(text, True, color)
-        
-        surface = self.cache[cache_key]
+        cache_key = (text, font_size, color)
+        surface = self.cache.get(cache_key, lambda: self.fonts[font_size].render(text, True, color))
         if center:
             x -= surface.get_width() // 2
             y -= surface.get_height() // 2
         
-        self.screen.blit(surface, (x, y))
+        self._dessiner(('text', cache_key, x, y), surface.get_rect(topleft=(x, y)),
+                       self.screen.blit, (surface, (x, y)))
+    
+    def pin_text(self, text: str, font_size: str = 'medium', 
+                 color: Tuple[int, int, int] = WHITE) -> None:
+        """Épingle un libellé réutilisé: jamais évincé du cache de texte"""
+        self.cache.pin((text, font_size, color), lambda: self.fonts[font_size].render(text, True, color))
+    
+    def draw_glyph_text(self, text: str, x: int, y: int, font_size: str = 'medium', 
+                        color: Tuple[int, int, int] = WHITE, center: bool = False) -> None:
+        """Dessine un texte qui change souvent (nombres) en composant des glyphes en cache"""
+        blits, rect = self.glyphs.layout(self.fonts[font_size], color, text, x, y)
+        if center:
+            dx, dy = -(rect.width // 2), -(rect.height // 2)
+            blits = [(glyph, (gx + dx, gy + dy)) for glyph, (gx, gy) in blits]
+            rect.move_ip(dx, dy)
+        self._dessiner(('glyphs', text, font_size, color, rect.x, rect.y), rect,
+                       self._draw_glyph_text, (blits,))
+    
+    def _draw_glyph_text(self, blits: list) -> None:
+        """Blitte les glyphes d'un texte composé"""
+        self.screen.blits(blits, False)
     
     def draw_button(self, x: int, y: int, width: int, height: int, 
                    text: str, color: Tuple[int, int, int] = GREEN) -> pygame.Rect:
         """Dessine un bouton optimisé"""
         rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(self.screen, color, rect)
-        pygame.draw.rect(self.screen, WHITE, rect, 2)
-        
-        # Texte centré
-        text_surface = self.fonts['medium'].render(text, True, WHITE)
-        text_rect = text_surface.get_rect(center=rect.center)
-        self.screen.blit(text_surface, text_rect)
-        
+        sprite, (dx, dy) = self._button_sprite(width, height, text, color)
+        self._dessiner(('button', x, y, width, height, text, color), sprite.get_rect(topleft=(x + dx, y + dy)),
+                       self.screen.blit, (sprite, (x + dx, y + dy)))
         return rect
     
+    def _button_sprite(self, width: int, height: int, text: str, 
+                       color: Tuple[int, int, int]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Fond, bordure et texte d'un bouton, rendus une seule fois"""
+        key = (width, height, text, color)
+        entry = self.button_sprites.get(key)
+        if entry is None:
+            text_surface = self.fonts['medium'].render(text, True, WHITE)
+            entry = self.button_sprites[key] = render_button_sprite((width, height), color, text_surface)
+        return entry
+    
     def draw_health_bar(self, x: int, y: int, width: int, height: int, 
                        current: int, maximum: int, color: Tuple[int, int, int] = RED) -> None:
         """Dessine une barre de vie optimisée"""
+        self._dessiner(('health_bar', x, y, width, height, current, maximum, color),
+                       pygame.Rect(x, y, width, height),
+                       self._draw_health_bar, (x, y, width, height, current, maximum, color))
+    
+    def _draw_health_bar(self, x: int, y: int, width: int, height: int, 
+                         current: int, maximum: int, color: Tuple[int, int, int]) -> None:
+        """Dessine le fond, la vie actuelle et la bordure d'une barre de vie"""
         # Fond
         pygame.draw.rect(self.screen, DARK_GRAY, (x, y, width, height))
         
@@ -71,22 +439,36 @@ class OptimizedRenderer:
     def draw_icon(self, x: int, y: int, icon_type: str, size: int = 20, 
                   color: Tuple[int, int, int] = WHITE) -> None:
         """Dessine une icône géométrique simple"""
+        # Les polygones incluent leur dernier pixel: l'icône couvre size + 1 pixels
+        self._dessiner(('icon', x, y, icon_type, size, color), pygame.Rect(x, y, size + 1, size + 1),
+                       self._draw_icon, (x, y, icon_type, size, color))
+    
+    def _draw_icon(self, x: int, y: int, icon_type: str, size: int, 
+                   color: Tuple[int, int, int]) -> None:
+        """Copie l'icône pré-rendue depuis l'atlas"""
+        self.icons.draw(self.screen, icon_type, x, y, size, color)
+    
+    @staticmethod
+    def draw_icon_geometry(surface: pygame.Surface, icon_type: str, x: int, y: int, size: int, 
+                           color: Tuple[int, int, int]) -> None:
+        """Dessine la géométrie d'une icône, coin supérieur gauche en (x, y)"""
         if icon_type == "heart":
-            self._draw_heart(x, y, size, color)
+            OptimizedRenderer._draw_heart(surface, x, y, size, color)
         elif icon_type == "sword":
-            self._draw_sword(x, y, size, color)
+            OptimizedRenderer._draw_sword(surface, x, y, size, color)
         elif icon_type == "shield":
-            self._draw_shield(x, y, size, color)
+            OptimizedRenderer._draw_shield(surface, x, y, size, color)
         elif icon_type == "skull":
-            self._draw_skull(x, y, size, color)
+            OptimizedRenderer._draw_skull(surface, x, y, size, color)
         elif icon_type == "crown":
-            self._draw_crown(x, y, size, color)
+            OptimizedRenderer._draw_crown(surface, x, y, size, color)
         elif icon_type == "plus":
-            self._draw_plus(x, y, size, color)
+            OptimizedRenderer._draw_plus(surface, x, y, size, color)
         elif icon_type == "castle":
-            self._draw_castle(x, y, size, color)
+            OptimizedRenderer._draw_castle(surface, x, y, size, color)
     
-    def _draw_heart(self, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
+    @staticmethod
+    def _draw_heart(surface: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
         """Dessine un cœur simple"""
         points = [
             (x, y + size//2),
@@ -95,18 +477,20 @@ class OptimizedRenderer:
             (x + size//2, y + size//2),
             (x, y + size)
         ]
-        pygame.draw.polygon(self.screen, color, points)
+        pygame.draw.polygon(surface, color, points)
     
-    def _draw_sword(self, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
+    @staticmethod
+    def _draw_sword(surface: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
         """Dessine une épée simple"""
         # Lame
-        pygame.draw.rect(self.screen, color, (x + size//2 - 1, y, 2, size//2))
+        pygame.draw.rect(surface, color, (x + size//2 - 1, y, 2, size//2))
         # Garde
-        pygame.draw.rect(self.screen, color, (x, y + size//2 - 2, size, 4))
+        pygame.draw.rect(surface, color, (x, y + size//2 - 2, size, 4))
         # Poignée
-        pygame.draw.rect(self.screen, color, (x + size//2 - 1, y + size//2, 2, size//2))
+        pygame.draw.rect(surface, color, (x + size//2 - 1, y + size//2, 2, size//2))
     
-    def _draw_shield(self, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
+    @staticmethod
+    def _draw_shield(surface: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
         """Dessine un bouclier simple"""
         points = [
             (x, y + size//4),
@@ -118,17 +502,19 @@ class OptimizedRenderer:
             (x + size//4, y + size),
             (x, y + 3*size//4)
         ]
-        pygame.draw.polygon(self.screen, color, points)
+        pygame.draw.polygon(surface, color, points)
     
-    def _draw_skull(self, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
+    @staticmethod
+    def _draw_skull(surface: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
         """Dessine un crâne simple"""
         # Tête
-        pygame.draw.circle(self.screen, color, (x + size//2, y + size//2), size//3)
+        pygame.draw.circle(surface, color, (x + size//2, y + size//2), size//3)
         # Yeux
-        pygame.draw.circle(self.screen, BLACK, (x + size//2 - 3, y + size//2 - 2), 2)
-        pygame.draw.circle(self.screen, BLACK, (x + size//2 + 3, y + size//2 - 2), 2)
+        pygame.draw.circle(surface, BLACK, (x + size//2 - 3, y + size//2 - 2), 2)
+        pygame.draw.circle(surface, BLACK, (x + size//2 + 3, y + size//2 - 2), 2)
     
-    def _draw_crown(self, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
+    @staticmethod
+    def _draw_crown(surface: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
         """Dessine une couronne simple"""
         points = [
             (x, y + size//2),
@@ -137,53 +523,237 @@ class OptimizedRenderer:
             (x + 3*size//4, y),
             (x + size, y + size//2)
         ]
-        pygame.draw.polygon(self.screen, color, points)
+        pygame.draw.polygon(surface, color, points)
     
-    def _draw_plus(self, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
+    @staticmethod
+    def _draw_plus(surface: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
         """Dessine un plus simple"""
         center_x, center_y = x + size//2, y + size//2
         thickness = 2
         # Horizontal
-        pygame.draw.rect(self.screen, color, (x, center_y - thickness//2, size, thickness))
+        pygame.draw.rect(surface, color, (x, center_y - thickness//2, size, thickness))
         # Vertical
-        pygame.draw.rect(self.screen, color, (center_x - thickness//2, y, thickness, size))
+        pygame.draw.rect(surface, color, (center_x - thickness//2, y, thickness, size))
     
-    def _draw_castle(self, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
+    @staticmethod
+    def _draw_castle(surface: pygame.Surface, x: int, y: int, size: int, color: Tuple[int, int, int]) -> None:
         """Dessine un château simple"""
         # Base
-        pygame.draw.rect(self.screen, color, (x, y + size//2, size, size//2))
+        pygame.draw.rect(surface, color, (x, y + size//2, size, size//2))
         # Tours
-        pygame.draw.rect(self.screen, color, (x, y, size//4, size//2))
-        pygame.draw.rect(self.screen, color, (x + 3*size//4, y, size//4, size//2))
+        pygame.draw.rect(surface, color, (x, y, size//4, size//2))
+        pygame.draw.rect(surface, color, (x + 3*size//4, y, size//4, size//2))
         # Tour centrale
-        pygame.draw.rect(self.screen, color, (x + size//3, y + size//4, size//3, 3*size//4))
+        pygame.draw.rect(surface, color, (x + size//3, y + size//4, size//3, 3*size//4))
     
     def add_particle(self, x: int, y: int, color: Tuple[int, int, int], 
                     velocity: Tuple[float, float], life: int = 30) -> None:
         """Ajoute une particule simple"""
-        self.particles.append({
-            'x': x, 'y': y, 'color': color, 
-            'vx': velocity[0], 'vy': velocity[1], 'life': life
-        })
+        self.particles.emit(x, y, velocity[0], velocity[1], life, 2, color)
     
     def update_particles(self) -> None:
         """Met à jour les particules"""
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
     
     def draw_particles(self) -> None:
-        """Dessine les particules"""
-        for particle in self.particles:
-            alpha = int(255 * (particle['life'] / 30))
-            color = (*particle['color'][:3], alpha)
-            pygame.draw.circle(self.screen, particle['color'], 
-                             (int(particle['x']), int(particle['y'])), 2)
+        """Dessine les particules, en fondu selon leur vie restante"""
+        self.particles.draw(self.screen, fade=True)
+    
+    def draw_layer(self, name: str, key: Any, build: Callable[[], None]) -> None:
+        """Dessine la couche statique d'un état en un seul blit
+        
+        build dessine avec les draw_* le contenu fixe de l'état (titres,
+        icônes, boutons); il n'est appelé qu'à la création de la couche, puis
+        à nouveau quand key change (nouvelle salle, difficulté...). La couche
+        est opaque: elle doit être dessinée en premier.
+        """
+        if not self.use_layers:
+            build()
+            return
+        
+        couche = self.layers.get(name)
+        if couche is None or couche[0] != key:
+            surface = pygame.Surface(self.screen.get_size(), 0, self.screen)
+            surface.fill(BLACK)
+            ecran, commandes, tout_redessiner = self.screen, self._commandes, self._tout_redessiner
+            self.screen, self._commandes = surface, None
+            try:
+                build()
+            finally:
+                self.screen, self._commandes, self._tout_redessiner = ecran, commandes, tout_redessiner
+            couche = self.layers[name] = (key, surface)
+        
+        surface = couche[1]
+        self._dessiner(('layer', name, key), surface.get_rect(), self.screen.blit, (surface, (0, 0)))
+    
+    def clear_layers(self) -> None:
+        """Libère les couches statiques"""
+        self.layers.clear()
+    
+    def particles_rect(self) -> Optional[pygame.Rect]:
+        """Rectangle englobant les particules, None s'il n'y en a pas"""
+        return self.particles.bounds()
     
     def clear_cache(self) -> None:
-        """Vide le cache"""
+        """Vide le cache de texte (libellés épinglés exceptés)"""
         self.cache.clear()
+    
+    def _dessiner(self, cle: Any, rect: pygame.Rect, fonction: Callable[..., Any], args: tuple) -> None:
+        """Enregistre une commande pendant une image, la dessine aussitôt sinon"""
+        if self._commandes is not None:
+            self._commandes.append((cle, rect, fonction, args))
+        else:
+            fonction(*args)
+            # L'écran contient des pixels hors de la liste d'affichage
+            self._tout_redessiner = True
+    
+    def invalidate(self) -> None:
+        """Force le rendu complet de la prochaine image (fenêtre réexposée...)"""
+        self._tout_redessiner = True
+    
+    def begin_frame(self) -> None:
+        """Commence l'enregistrement de la liste d'affichage d'une image"""
+        self._commandes = []
+    
+    def end_frame(self, damaged: Sequence[Optional[pygame.Rect]] = (), 
+                  full: bool = False) -> List[pygame.Rect]:
+        """Termine l'image et repeint les régions modifiées
+        
+        damaged liste les zones dessinées hors liste d'affichage (particules):
+        elles sont repeintes à cette image et à la suivante pour les effacer.
+        full demande un rendu complet, réservé aux effets plein écran (flash,
+        météo); l'image suivante est alors complète elle aussi.
+        Retourne les rectangles à passer à pygame.display.update, une liste
+        vide si rien n'a changé; full_frame indique un rendu complet.
+        """
+        commandes = self._commandes if self._commandes is not None else []
+        self._commandes = None
+        ecran = self.screen.get_rect()
+        
+        dommages = [ecran.clip(rect) for rect in damaged if rect]
+        zone = self.particles_rect()
+        if zone:
+            dommages.append(ecran.clip(zone))
+        
+        complet = full or self._tout_redessiner
+        regions = []
+        if not complet:
+            regions = self._regions_modifiees(commandes) + dommages + self._dommages_precedents
+            # Au-delà de la moitié de l'écran, un rendu complet coûte moins cher
+            complet = sum(rect.width * rect.height for rect in regions) * 2 > ecran.width * ecran.height
+        
+        self.full_frame = complet
+        self._tout_redessiner = full
+        # Une couche statique en tête recouvre déjà tout l'écran d'un fond opaque
+        fond = not (commandes and commandes[0][0][0] == 'layer')
+        if self.full_frame:
+            if fond:
+                self.screen.fill(BLACK)
+            for _, _, fonction, args in commandes:
+                fonction(*args)
+            regions = [ecran]
+        else:
+            for region in regions:
+                self.screen.set_clip(region)
+                if fond:
+                    self.screen.fill(BLACK)
+                for _, rect, fonction, args in commandes:
+                    if rect.colliderect(region):
+                        fonction(*args)
+            self.screen.set_clip(None)
+        
+        self._commandes_precedentes = commandes
+        self._dommages_precedents = dommages
+        return regions
+    
+    def _regions_modifiees(self, commandes: List[Commande]) -> List[pygame.Rect]:
+        """Rectangles des commandes apparues ou disparues depuis l'image précédente"""
+        precedentes = {cle: rect for cle, rect, _, _ in self._commandes_precedentes}
+        actuelles = {cle: rect for cle, rect, _, _ in commandes}
+        regions = [rect for cle, rect in actuelles.items() if cle not in precedentes]
+        regions.extend(rect for cle, rect in precedentes.items() if cle not in actuelles)
+        return regions
+
+class NullRenderer:
+    """Rendu inactif pour le jeu sans affichage (relecture, tests)
+
+    Les boutons gardent leur rectangle: la logique de clic reste identique.
+    """
+    
+    def __init__(self):
+        self.screen = None
+        self.cache = TextCache(0)
+        self.particles = []
+        self.full_frame = False
+    
+    def draw_text(self, text: str, x: int, y: int, font_size: str = 'medium', 
+                  color: Tuple[int, int, int] = WHITE, center: bool = False) -> None:
+        """N'affiche rien"""
+        pass
+    
+    def draw_glyph_text(self, text: str, x: int, y: int, font_size: str = 'medium', 
+                        color: Tuple[int, int, int] = WHITE, center: bool = False) -> None:
+        """N'affiche rien"""
+        pass
+    
+    def pin_text(self, text: str, font_size: str = 'medium', 
+                 color: Tuple[int, int, int] = WHITE) -> None:
+        """Aucun cache"""
+        pass
+    
+    def draw_button(self, x: int, y: int, width: int, height: int, 
+                   text: str, color: Tuple[int, int, int] = GREEN) -> pygame.Rect:
+        """Retourne le rectangle du bouton sans le dessiner"""
+        return pygame.Rect(x, y, width, height)
+    
+    def draw_health_bar(self, x: int, y: int, width: int, height: int, 
+                       current: int, maximum: int, color: Tuple[int, int, int] = RED) -> None:
+        """N'affiche rien"""
+        pass
+    
+    def draw_icon(self, x: int, y: int, icon_type: str, size: int = 20, 
+                  color: Tuple[int, int, int] = WHITE) -> None:
+        """N'affiche rien"""
+        pass
+    
+    def add_particle(self, x: int, y: int, color: Tuple[int, int, int], 
+                    velocity: Tuple[float, float], life: int = 30) -> None:
+        """Ignore la particule"""
+        pass
+    
+    def update_particles(self) -> None:
+        """Aucune particule à mettre à jour"""
+        pass
+    
+    def draw_particles(self) -> None:
+        """N'affiche rien"""
+        pass
+    
+    def draw_layer(self, name: str, key: Any, build: Callable[[], None]) -> None:
+        """N'affiche rien"""
+        pass
+    
+    def clear_layers(self) -> None:
+        """Aucune couche"""
+        pass
+    
+    def particles_rect(self) -> Optional[pygame.Rect]:
+        """Aucune particule"""
+        return None
+    
+    def clear_cache(self) -> None:
+        """Aucun cache"""
+        pass
+    
+    def invalidate(self) -> None:
+        """Rien à redessiner"""
+        pass
+    
+    def begin_frame(self) -> None:
+        """Aucune liste d'affichage"""
+        pass
+    
+    def end_frame(self, damaged: Sequence[Optional[pygame.Rect]] = (), 
+                  full: bool = False) -> List[pygame.Rect]:
+        """Aucune région à afficher"""
+        return []
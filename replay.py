@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Enregistrement et relecture des sessions de OptimizedRoguelike
+Une session est sa graine plus un flux binaire compact d'actions horodatées,
+relu sans affichage à vitesse maximale
+"""
+
+import argparse
+import contextlib
+import os
+import struct
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# En-tête: signature, version du format, graine de la session
+SIGNATURE = b"RGLR"
+VERSION = 1
+_ENTETE = struct.Struct("<4sBQ")
+
+# Types d'événements enregistrés
+TYPE_ACTION = "action"
+TYPE_TOUCHE = "touche"
+
+# Codes d'opération (un octet, précédé du délai en varint)
+ACTIONS = ("attack", "continue", "replay", "menu", "quit", "turbo")
+OP_DIFFICULTE = 0x20  # | niveau (0-31)
+NIVEAU_DIFFICULTE_MAX = 0x1F
+OP_TOUCHE = 0x40      # | longueur du nom de la touche (0-63), suivi du nom
+LONGUEUR_TOUCHE_MAX = 0x3F
+
+Evenement = Tuple[int, str, str]
+
+def _ecrire_varint(sortie: bytearray, valeur: int) -> None:
+    """Écrit un entier positif sur 7 bits par octet"""
+    while valeur >= 0x80:
+        sortie.append((valeur & 0x7F) | 0x80)
+        valeur >>= 7
+    sortie.append(valeur)
+
+def _lire_varint(donnees: bytes, position: int) -> Tuple[int, int]:
+    """Lit un entier varint et retourne (valeur, nouvelle position)"""
+    valeur = decalage = 0
+    while True:
+        octet = donnees[position]
+        position += 1
+        valeur |= (octet & 0x7F) << decalage
+        if octet < 0x80:
+            return valeur, position
+        decalage += 7
+
+class Enregistrement:
+    """Graine et actions horodatées (en ms) d'une session de jeu"""
+
+    def __init__(self, seed: int, evenements: Optional[List[Evenement]] = None):
+        if not 0 <= seed < 2**64:
+            raise ValueError("La graine doit tenir sur 64 bits")
+        self.seed = seed
+        self.evenements: List[Evenement] = evenements if evenements is not None else []
+
+    def ajouter_action(self, temps: int, action: str) -> None:
+        """Enregistre une action de bouton"""
+        self._verifier_temps(temps)
+        self.evenements.append((temps, TYPE_ACTION, action))
+
+    def ajouter_touche(self, temps: int, touche: str) -> None:
+        """Enregistre une touche pressée (easter eggs)"""
+        self._verifier_temps(temps)
+        if len(touche.encode("utf-8")) > LONGUEUR_TOUCHE_MAX:
+            raise ValueError(f"Nom de touche trop long: {touche}")
+        self.evenements.append((temps, TYPE_TOUCHE, touche))
+
+    def _verifier_temps(self, temps: int) -> None:
+        """Les instants doivent être croissants (délais positifs)"""
+        if temps < 0 or (self.evenements and temps < self.evenements[-1][0]):
+            raise ValueError(f"Instant non croissant: {temps}")
+
+    @property
+    def duree(self) -> int:
+        """Durée de la session en ms (instant du dernier événement)"""
+        return self.evenements[-1][0] if self.evenements else 0
+
+    def encoder(self) -> bytes:
+        """Sérialise en binaire: 2 à 3 octets par clic, un de plus par lettre de touche"""
+        sortie = bytearray(_ENTETE.pack(SIGNATURE, VERSION, self.seed))
+        precedent = 0
+        for temps, genre, valeur in self.evenements:
+            _ecrire_varint(sortie, temps - precedent)
+            precedent = temps
+            if genre == TYPE_TOUCHE:
+                nom = valeur.encode("utf-8")
+                sortie.append(OP_TOUCHE | len(nom))
+                sortie.extend(nom)
+            elif valeur.startswith("difficulty_"):
+                niveau = int(valeur.split("_")[1])
+                if not 0 <= niveau <= NIVEAU_DIFFICULTE_MAX:
+                    raise ValueError(f"Niveau de difficulté hors de 0-{NIVEAU_DIFFICULTE_MAX}: {niveau}")
+                sortie.append(OP_DIFFICULTE | niveau)
+            else:
+                sortie.append(ACTIONS.index(valeur))
+        return bytes(sortie)
+
+    @classmethod
+    def decoder(cls, donnees: bytes) -> "Enregistrement":
+        """Reconstruit un enregistrement depuis son encodage binaire"""
+        if len(donnees) < _ENTETE.size:
+            raise ValueError("Enregistrement tronqué")
+        signature, version, seed = _ENTETE.unpack_from(donnees)
+        if signature != SIGNATURE or version != VERSION:
+            raise ValueError("Format d'enregistrement inconnu")
+
+        evenements: List[Evenement] = []
+        position = _ENTETE.size
+        temps = 0
+        while position < len(donnees):
+            delai, position = _lire_varint(donnees, position)
+            temps += delai
+            code = donnees[position]
+            position += 1
+            if code & OP_TOUCHE:
+                longueur = code & LONGUEUR_TOUCHE_MAX
+                nom = donnees[position:position + longueur].decode("utf-8")
+                position += longueur
+                evenements.append((temps, TYPE_TOUCHE, nom))
+            elif code & OP_DIFFICULTE:
+                evenements.append((temps, TYPE_ACTION, f"difficulty_{code & 0x1F}"))
+            else:
+                evenements.append((temps, TYPE_ACTION, ACTIONS[code]))
+        return cls(seed, evenements)
+
+    def sauvegarder(self, chemin: str) -> None:
+        """Écrit l'enregistrement dans un fichier"""
+        dossier = os.path.dirname(chemin)
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+        with open(chemin, 'wb') as f:
+            f.write(self.encoder())
+
+    @classmethod
+    def charger(cls, chemin: str) -> "Enregistrement":
+        """Lit un enregistrement depuis un fichier"""
+        with open(chemin, 'rb') as f:
+            return cls.decoder(f.read())
+
+def rejouer(enregistrement: Enregistrement):
+    """Réexécute une session sans affichage et retourne le jeu dans son état final
+
+    L'horloge du jeu est remplacée par les instants enregistrés, ce qui
+    reproduit les combos et le délai entre événements aléatoires.
+    """
+    # Import local: roguelike_optimized importe ce module pour enregistrer
+    from roguelike_optimized import OptimizedRoguelike
+
+    jeu = OptimizedRoguelike(headless=True, seed=enregistrement.seed)
+    instant = [0]
+    jeu.horloge = lambda: instant[0]
+
+    # Les salles affichent leurs messages avec print: on les rend muettes
+    with contextlib.redirect_stdout(None):
+        for temps, genre, valeur in enregistrement.evenements:
+            instant[0] = temps
+            if genre == TYPE_TOUCHE:
+                jeu.handle_key(valeur)
+            elif not jeu.dispatch_action(valeur):
+                break
+    return jeu
+
+def resume(jeu) -> Dict[str, Any]:
+    """État final d'une session, pour comparer deux relectures"""
+    resultat: Dict[str, Any] = {'etat': jeu.state, 'journal': list(jeu.combat_log)}
+    if jeu.game_service.is_started():
+        player = jeu.game_service.get_player()
+        resultat.update({
+            'score': player.score,
+            'pv': player.pv_actuels,
+            'attaque': player.attaque,
+            'salles': jeu.game_service.get_salle_actuelle(),
+            'ennemis': player.ennemis_tues,
+            'boss': player.boss_vaincus
+        })
+    return resultat
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Relit un enregistrement et affiche l'état final"""
+    parser = argparse.ArgumentParser(description="Relecture sans affichage d'une session")
+    parser.add_argument("fichier", help="enregistrement .rpl")
+    args = parser.parse_args(argv)
+
+    enregistrement = Enregistrement.charger(args.fichier)
+    debut = time.perf_counter()
+    jeu = rejouer(enregistrement)
+    duree = time.perf_counter() - debut
+
+    taille = os.path.getsize(args.fichier)
+    print(f"🎬 {len(enregistrement.evenements)} actions, {taille} octets, graine {enregistrement.seed}")
+    for cle, valeur in resume(jeu).items():
+        if cle != 'journal':
+            print(f"  {cle}: {valeur}")
+    if duree > 0:
+        print(f"Relecture: {duree * 1000:.2f} ms "
+              f"({enregistrement.duree / 1000 / duree:.0f}x le temps réel)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Registre partagé des ressources du jeu Roguelike
+Polices, sons et surfaces pré-rendues indexés par leurs paramètres, chargés
+à la première demande et comptés par référence
+"""
+
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+
+import pygame
+
+class ResourceRegistry:
+    """Ressources partagées par tout le processus
+
+    Une ressource est chargée à sa première acquisition puis partagée; chaque
+    propriétaire distinct compte pour une référence, rendue automatiquement
+    quand il disparaît (ou explicitement par release sans propriétaire).
+    Une ressource sans référence est libérée. Les ressources sont acquises à
+    la construction des objets: aucune police n'est créée pendant une image.
+    """
+
+    def __init__(self):
+        # clé -> [ressource, références]
+        self._entries: Dict[tuple, list] = {}
+        # clé -> identifiants des propriétaires vivants
+        self._owners: Dict[tuple, set] = {}
+        self.loads = 0
+
+    def acquire(self, key: tuple, loader: Callable[[], Any], owner: Optional[Any] = None) -> Any:
+        """Retourne la ressource de la clé, chargée au besoin, et prend une référence"""
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = [loader(), 0]
+            self._owners[key] = set()
+            self.loads += 1
+
+        if owner is None:
+            entry[1] += 1
+        elif id(owner) not in self._owners[key]:
+            self._owners[key].add(id(owner))
+            entry[1] += 1
+            weakref.finalize(owner, self._release_owner, key, id(owner))
+        return entry[0]
+
+    def release(self, key: tuple) -> None:
+        """Rend une référence prise sans propriétaire"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del self._entries[key]
+            del self._owners[key]
+
+    def _release_owner(self, key: tuple, owner_id: int) -> None:
+        """Rend la référence d'un propriétaire disparu"""
+        owners = self._owners.get(key)
+        if owners is not None and owner_id in owners:
+            owners.discard(owner_id)
+            self.release(key)
+
+    def font(self, size: int, name: Optional[str] = None, owner: Optional[Any] = None) -> pygame.font.Font:
+        """Police d'une taille donnée (police par défaut si name est None)"""
+        return self.acquire(('font', name, size), lambda: pygame.font.Font(name, size), owner)
+
+    def release_font(self, size: int, name: Optional[str] = None) -> None:
+        """Rend une référence de police prise sans propriétaire"""
+        self.release(('font', name, size))
+
+    def sound(self, params: tuple, create: Callable[[], Any], owner: Optional[Any] = None) -> Any:
+        """Son synthétique identifié par ses paramètres de synthèse"""
+        return self.acquire(('sound',) + tuple(params), create, owner)
+
+    def surface(self, params: tuple, create: Callable[[], pygame.Surface],
+                owner: Optional[Any] = None) -> pygame.Surface:
+        """Surface pré-rendue identifiée par ses paramètres"""
+        return self.acquire(('surface',) + tuple(params), create, owner)
+
+    def references(self, key: tuple) -> int:
+        """Nombre de références d'une ressource (0 si elle n'est pas chargée)"""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else 0
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Ressources chargées: type, clé, références et mémoire estimée"""
+        rapport = []
+        for key, (resource, references) in self._entries.items():
+            if isinstance(resource, pygame.Surface):
+                memoire = resource.get_pitch() * resource.get_height()
+            elif key[0] == 'sound' and pygame.mixer.get_init():
+                frequence, taille, canaux = pygame.mixer.get_init()
+                memoire = int(resource.get_length() * frequence) * canaux * abs(taille) // 8
+            else:
+                memoire = None
+            rapport.append({'kind': key[0], 'key': key[1:], 'references': references, 'bytes': memoire})
+        return rapport
+
+    def clear(self) -> None:
+        """Oublie toutes les ressources (fermeture de pygame, tests)"""
+        self._entries.clear()
+        self._owners.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._entries
+
+# Registre partagé par défaut, vidé par pygame.quit(): les polices et sons
+# d'une session pygame fermée ne sont plus utilisables
+resource_registry = ResourceRegistry()
+pygame.register_quit(resource_registry.clear)
+
+def font(size: int, name: Optional[str] = None, owner: Optional[Any] = None) -> pygame.font.Font:
+    """Police du registre partagé"""
+    return resource_registry.font(size, name, owner)
+
+def release_font(size: int, name: Optional[str] = None) -> None:
+    """Rend une police prise sans propriétaire au registre partagé"""
+    resource_registry.release_font(size, name)
+
+def sound(params: tuple, create: Callable[[], Any], owner: Optional[Any] = None) -> Any:
+    """Son du registre partagé"""
+    return resource_registry.sound(params, create, owner)
+
+def surface(params: tuple, create: Callable[[], pygame.Surface], owner: Optional[Any] = None) -> pygame.Surface:
+    """Surface pré-rendue du registre partagé"""
+    return resource_registry.surface(params, create, owner)
+
+def report() -> List[Dict[str, Any]]:
+    """Ressources chargées du registre partagé"""
+    return resource_registry.report()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Service de flux aléatoires du jeu Roguelike
+Chaque sous-système tire dans son propre flux initialisé par graine, les effets
+visuels ne peuvent donc pas perturber le déroulement d'une partie
+"""
+
+import hashlib
+import random
+from typing import Any, Dict, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel: les réserves retombent sur random
+    np = None
+
+# Flux du déroulement des parties (reproduits à l'identique pour une graine)
+FLUX_COMBAT = "combat"
+FLUX_SALLES = "salles"
+FLUX_BUTIN = "butin"
+FLUX_EVENEMENTS = "evenements"
+FLUX_COMBO = "combo"
+FLUX_GAMEPLAY = (FLUX_COMBAT, FLUX_SALLES, FLUX_BUTIN, FLUX_EVENEMENTS, FLUX_COMBO)
+
+# Flux purement cosmétiques (noms, particules, météo, messages)
+FLUX_NOMS = "noms"
+FLUX_EFFETS = "effets"
+FLUX_MESSAGES = "messages"
+FLUX_COSMETIQUES = (FLUX_NOMS, FLUX_EFFETS, FLUX_MESSAGES)
+
+# Nombre de tirages générés d'un coup par une réserve NumPy
+TAILLE_RESERVE = 4096
+
+def deriver_graine(seed: Any, nom: str) -> int:
+    """Graine d'un flux, stable d'une exécution et d'une plateforme à l'autre"""
+    empreinte = hashlib.sha256(f"{seed}:{nom}".encode()).digest()
+    return int.from_bytes(empreinte[:8], "little")
+
+class ReserveAleatoire:
+    """Réserve de tirages uniformes pré-générés par NumPy pour les chemins chauds
+
+    Expose le sous-ensemble de random.Random utilisé par les effets
+    (random, uniform, randint, choice) à partir d'un bloc de flottants.
+    """
+
+    def __init__(self, seed: Optional[int], taille: int = TAILLE_RESERVE):
+        self._taille = taille
+        self.seed(seed)
+
+    def seed(self, seed: Optional[int]) -> None:
+        """Réinitialise le générateur et vide la réserve"""
+        self._generateur = np.random.Generator(np.random.SFC64(seed))
+        self._tirages = iter(())
+
+    def _recharger(self) -> float:
+        """Génère un nouveau bloc de tirages et retourne le premier
+
+        Appelée quand next() renvoie None (bloc épuisé) ou 0.0: un tirage nul,
+        de probabilité 2**-53, recharge simplement le bloc.
+        """
+        self._tirages = iter(self._generateur.random(self._taille).tolist())
+        return next(self._tirages)
+
+    def random(self) -> float:
+        """Flottant uniforme dans [0, 1)"""
+        return next(self._tirages, None) or self._recharger()
+
+    def uniform(self, a: float, b: float) -> float:
+        """Flottant uniforme entre a et b"""
+        return a + (b - a) * (next(self._tirages, None) or self._recharger())
+
+    def randint(self, a: int, b: int) -> int:
+        """Entier uniforme entre a et b inclus"""
+        return a + int((b - a + 1) * (next(self._tirages, None) or self._recharger()))
+
+    def choice(self, sequence: Sequence[Any]) -> Any:
+        """Élément uniforme d'une séquence non vide"""
+        return sequence[int(len(sequence) * (next(self._tirages, None) or self._recharger()))]
+
+    def uniformes(self, n: int) -> np.ndarray:
+        """Bloc de n flottants uniformes dans [0, 1), pour les tirages groupés"""
+        return self._generateur.random(n)
+
+class RNGService:
+    """Distribue un flux aléatoire indépendant à chaque sous-système
+
+    Les flux sont réinitialisés sur place par seed(): les références déjà
+    distribuées restent valides et suivent la nouvelle graine.
+    """
+
+    def __init__(self, seed: Optional[Any] = None):
+        self._flux: Dict[str, random.Random] = {}
+        self._reserves: Dict[str, Any] = {}
+        self.seed(seed)
+
+    @property
+    def graine(self) -> Optional[Any]:
+        return self._graine
+
+    def seed(self, seed: Optional[Any] = None) -> None:
+        """Réinitialise tous les flux (graine aléatoire si seed est None)"""
+        self._graine = seed
+        for nom, flux in self._flux.items():
+            flux.seed(self._graine_flux(nom))
+        for nom, reserve in self._reserves.items():
+            reserve.seed(self._graine_flux(f"reserve:{nom}"))
+
+    def _graine_flux(self, nom: str) -> Optional[int]:
+        """Graine dérivée d'un flux, None pour l'entropie du système"""
+        if self._graine is None:
+            return None
+        return deriver_graine(self._graine, nom)
+
+    def flux(self, nom: str) -> random.Random:
+        """Flux random.Random propre au sous-système nommé"""
+        if nom not in self._flux:
+            self._flux[nom] = random.Random(self._graine_flux(nom))
+        return self._flux[nom]
+
+    def reserve(self, nom: str) -> Any:
+        """Réserve NumPy du sous-système nommé (flux random.Random sans NumPy)"""
+        if np is None:
+            return self.flux(nom)
+        if nom not in self._reserves:
+            self._reserves[nom] = ReserveAleatoire(self._graine_flux(f"reserve:{nom}"))
+        return self._reserves[nom]
+
+# Service partagé par défaut, réinitialisé par la simulation et les tests
+rng_service = RNGService()
+
+def flux(nom: str) -> random.Random:
+    """Flux nommé du service partagé"""
+    return rng_service.flux(nom)
+
+def reserve(nom: str) -> Any:
+    """Réserve nommée du service partagé"""
+    return rng_service.reserve(nom)
+
+def seed(graine: Optional[Any] = None) -> None:
+    """Réinitialise tous les flux du service partagé"""
+    rng_service.seed(graine)
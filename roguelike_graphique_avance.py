@@ -9,8 +9,13 @@ import sys
 import math
 import json
 import os
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from abc import ABC, abstractmethod
+import numpy as np
+from renderer import GlyphCache, IconAtlas, render_button_sprite
+import resources
+from particles import ParticlePool
+from scheduler import FrameScheduler
 
 # Initialisation de Pygame
 pygame.init()
@@ -661,41 +666,27 @@ class AnimatedSprite:
                 particle_rect = pygame.Rect(particle_x, particle_y, 3, 3)
                 pygame.draw.rect(screen, YELLOW, particle_rect)
 
-class ParticleSystem:
-    """Système de particules pour les effets visuels"""
+class ParticleSystem(ParticlePool):
+    """Système de particules pour les effets visuels
     
-    def __init__(self):
-        self.particles: List[dict] = []
-    
-    def add_particle(self, x: int, y: int, color: Tuple[int, int, int], 
-                    velocity: Tuple[float, float], lifetime: int):
-        """Ajoute une particule"""
-        self.particles.append({
-            'x': x, 'y': y,
-            'vx': velocity[0], 'vy': velocity[1],
-            'color': color,
-            'lifetime': lifetime,
-            'max_lifetime': lifetime
-        })
+    Durées en ms et vitesses en pixels par 10 ms; une particule est un carré
+    qui rétrécit avec sa vie restante.
+    """
+    
+    def add_particles(self, x: int, y: int, color: Tuple[int, int, int], 
+                      spread: float, count: int, lifetime: int):
+        """Ajoute count particules de vitesses uniformes dans [-spread, spread]"""
+        vitesses = np.random.uniform(-spread, spread, (2, count))
+        # La vie est comptée en pas de 10 ms, comme les vitesses
+        self.emit(x, y, vitesses[0], vitesses[1], lifetime * 0.1, 3, color)
     
     def update(self, dt: int):
         """Met à jour toutes les particules"""
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx'] * dt * 0.1
-            particle['y'] += particle['vy'] * dt * 0.1
-            particle['lifetime'] -= dt
-            
-            if particle['lifetime'] <= 0:
-                self.particles.remove(particle)
+        super().update(dt * 0.1)
     
     def draw(self, screen: pygame.Surface):
         """Dessine toutes les particules"""
-        for particle in self.particles:
-            alpha = particle['lifetime'] / particle['max_lifetime']
-            size = int(3 * alpha)
-            if size > 0:
-                rect = pygame.Rect(particle['x'], particle['y'], size, size)
-                pygame.draw.rect(screen, particle['color'], rect)
+        super().draw(screen, "square", shrink=3)
 
 class TextSprite:
     """Sprite pour afficher du texte avec des effets"""
@@ -727,7 +718,16 @@ class TextSprite:
         screen.blit(text_surface, (self.x, self.y))
 
 class Button:
-    """Bouton amélioré avec animations"""
+    """Bouton amélioré avec animations
+    
+    Le libellé est rendu une seule fois; le bouton normal, le bouton survolé
+    et chaque pas d'échelle de l'animation de survol sont pré-rendus à leur
+    première utilisation: dessiner le bouton est un seul blit.
+    """
+    
+    # Échelle du survol, quantifiée en SCALE_STEPS pas pour l'animation
+    HOVER_SCALE = 1.1
+    SCALE_STEPS = 8
     
     def __init__(self, x: int, y: int, width: int, height: int, text: str, 
                  font: pygame.font.Font, color: Tuple[int, int, int] = GRAY,
@@ -742,6 +742,9 @@ class Button:
         self.visible = True
         self.scale = 1.0
         self.target_scale = 1.0
+        self._text_surface = None
+        # (survolé, pas d'échelle) -> (sprite, position à l'écran)
+        self._sprites = {}
     
     def draw(self, screen: pygame.Surface):
         """Dessine le bouton avec animation"""
@@ -750,31 +753,44 @@ class Button:
         
         # Animation de scale
         if self.is_hovered:
-            self.target_scale = 1.1
+            self.target_scale = self.HOVER_SCALE
         else:
             self.target_scale = 1.0
         
         self.scale += (self.target_scale - self.scale) * 0.1
         
+        key = (self.is_hovered, self._step(self.scale))
+        sprite = self._sprites.get(key) or self._render_sprite(*key)
+        screen.blit(*sprite)
+    
+    def _step(self, scale: float) -> int:
+        """Pas d'échelle affiché pour une échelle"""
+        step = round((scale - 1.0) / (self.HOVER_SCALE - 1.0) * self.SCALE_STEPS)
+        return max(0, min(step, self.SCALE_STEPS))
+    
+    def animating(self) -> bool:
+        """Indique si l'animation de survol n'a pas atteint son pas final"""
+        target = self.HOVER_SCALE if self.is_hovered else 1.0
+        return self.visible and self._step(self.scale) != self._step(target)
+    
+    def _render_sprite(self, hovered: bool, step: int) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Pré-rend le bouton pour un état de survol et un pas d'échelle"""
+        if self._text_surface is None:
+            self._text_surface = self.font.render(self.text, True, self.text_color)
+        
         # Calculer la nouvelle taille
-        new_width = int(self.rect.width * self.scale)
-        new_height = int(self.rect.height * self.scale)
+        scale = 1.0 + (self.HOVER_SCALE - 1.0) * step / self.SCALE_STEPS
+        new_width = int(self.rect.width * scale)
+        new_height = int(self.rect.height * scale)
         new_x = self.rect.x - (new_width - self.rect.width) // 2
         new_y = self.rect.y - (new_height - self.rect.height) // 2
         
-        scaled_rect = pygame.Rect(new_x, new_y, new_width, new_height)
-        
         # Couleur du bouton
-        color = self.hover_color if self.is_hovered else self.color
-        
-        # Dessiner le bouton avec gradient
-        pygame.draw.rect(screen, color, scaled_rect)
-        pygame.draw.rect(screen, WHITE, scaled_rect, 2)
+        color = self.hover_color if hovered else self.color
         
-        # Centrer le texte
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=scaled_rect.center)
-        screen.blit(text_surface, text_rect)
+        surface, (dx, dy) = render_button_sprite((new_width, new_height), color, self._text_surface)
+        sprite = self._sprites[(hovered, step)] = (surface, (new_x + dx, new_y + dy))
+        return sprite
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Gère les événements du bouton"""
@@ -789,10 +805,17 @@ class Button:
         return False
 
 class HealthBar:
-    """Barre de vie améliorée avec animation"""
+    """Barre de vie améliorée avec animation
+    
+    Le texte de santé change à chaque image de l'animation: il est composé
+    de glyphes pré-rendus, partagés par toutes les barres.
+    """
+    
+    glyphs = GlyphCache()
     
     def __init__(self, x: int, y: int, width: int, height: int, max_health: int):
         self.rect = pygame.Rect(x, y, width, height)
+        self.font = resources.font(20, owner=self)
         self.max_health = max_health
         self.current_health = max_health
         self.target_health = max_health
@@ -802,6 +825,10 @@ class HealthBar:
         """Met à jour la santé cible"""
         self.target_health = max(0, min(current_health, self.max_health))
     
+    def animating(self) -> bool:
+        """Indique si la barre rejoint encore la santé cible"""
+        return abs(self.target_health - self.current_health) > 0.1
+    
     def update(self, dt: int):
         """Met à jour l'animation de la barre de vie"""
         diff = self.target_health - self.current_health
@@ -830,14 +857,65 @@ class HealthBar:
         pygame.draw.rect(screen, WHITE, self.rect, 2)
         
         # Texte de santé avec symbole
-        font = pygame.font.Font(None, 20)
         health_text = f"HP {int(self.current_health)}/{self.max_health}"
-        text_surface = font.render(health_text, True, WHITE)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        text_rect = pygame.Rect((0, 0), self.glyphs.size(self.font, WHITE, health_text))
+        text_rect.center = self.rect.center
+        self.glyphs.draw(screen, self.font, WHITE, health_text, text_rect.x, text_rect.y)
 
 class IconDrawer:
-    """Classe pour dessiner des icônes visuelles avec des formes géométriques améliorées"""
+    """Classe pour dessiner des icônes visuelles avec des formes géométriques améliorées
+    
+    Les icônes sont tracées une seule fois par (type, taille, couleur) dans un
+    atlas, avec leurs ombres et reflets, puis copiées d'un seul blit.
+    """
+    
+    # Types d'icônes disponibles
+    ICON_TYPES = ("heart", "sword", "shield", "crown", "skull", "plus", "exclamation", "castle", "trophy")
+    
+    # Couleurs spécifiques pour chaque icône (icônes de repli des textes)
+    ICON_COLORS = {
+        "heart": RED,
+        "sword": (200, 200, 255),
+        "shield": BLUE,
+        "crown": YELLOW,
+        "skull": WHITE,
+        "plus": GREEN,
+        "exclamation": YELLOW,
+        "castle": GRAY,
+        "trophy": YELLOW
+    }
+    
+    atlas = None
+    
+    @staticmethod
+    def get_atlas() -> IconAtlas:
+        """Retourne l'atlas partagé, créé à la première utilisation"""
+        if IconDrawer.atlas is None:
+            IconDrawer.atlas = IconAtlas(IconDrawer.draw_icon_geometry)
+        return IconDrawer.atlas
+    
+    @staticmethod
+    def prewarm(sizes=(20,)):
+        """Pré-rend les icônes de repli dans leurs couleurs pour les tailles données"""
+        IconDrawer.get_atlas().prewarm((icon_type, size, color)
+                                       for icon_type, color in IconDrawer.ICON_COLORS.items()
+                                       for size in sizes)
+    
+    @staticmethod
+    def draw_icon(screen, icon_name: str, x: int, y: int, size: int, color: Tuple[int, int, int]):
+        """Dessine une icône centrée en (x, y) depuis l'atlas"""
+        IconDrawer.get_atlas().draw(screen, icon_name, x, y, size, color)
+    
+    @staticmethod
+    def draw_icon_fallback(screen, x: int, y: int, icon_name: str, size: int, color: Tuple[int, int, int]):
+        """Dessine une icône de fallback si Unicode n'est pas disponible"""
+        IconDrawer.draw_icon(screen, icon_name, x + size//2, y + size//2, size, color)
+    
+    @staticmethod
+    def draw_icon_geometry(screen, icon_name: str, x: int, y: int, size: int, color: Tuple[int, int, int]):
+        """Trace la géométrie d'une icône centrée en (x, y)"""
+        if icon_name in IconDrawer.ICON_TYPES:
+            getattr(IconDrawer, f"draw_{icon_name}")(screen, x, y, size, color)
     
     @staticmethod
     def draw_heart(screen, x, y, size, color):
@@ -1068,7 +1146,7 @@ class UnicodeIcons:
         """Dessine une icône Unicode avec du texte"""
         try:
             # Essayer d'utiliser une police qui supporte Unicode
-            unicode_font = pygame.font.Font(None, font.get_height())
+            unicode_font = resources.font(font.get_height(), owner=UnicodeIcons)
             icon = UnicodeIcons.get_icon(icon_name)
             
             # Dessiner l'icône
@@ -1083,53 +1161,6 @@ class UnicodeIcons:
             # Fallback vers les icônes géométriques
             IconDrawer.draw_icon_fallback(screen, x, y, icon_name, 20, color)
 
-class IconDrawer:
-    """Classe pour dessiner des icônes visuelles avec des formes géométriques améliorées"""
-    
-    @staticmethod
-    def draw_icon_fallback(screen, x: int, y: int, icon_name: str, size: int, color: Tuple[int, int, int]):
-        """Dessine une icône de fallback si Unicode n'est pas disponible"""
-        if icon_name == 'heart':
-            IconDrawer.draw_heart(screen, x + size//2, y + size//2, size, color)
-        elif icon_name == 'sword':
-            IconDrawer.draw_sword(screen, x + size//2, y + size//2, size, color)
-        elif icon_name == 'shield':
-            IconDrawer.draw_shield(screen, x + size//2, y + size//2, size, color)
-        elif icon_name == 'crown':
-            IconDrawer.draw_crown(screen, x + size//2, y + size//2, size, color)
-        elif icon_name == 'skull':
-            IconDrawer.draw_skull(screen, x + size//2, y + size//2, size, color)
-        elif icon_name == 'plus':
-            IconDrawer.draw_plus(screen, x + size//2, y + size//2, size, color)
-        elif icon_name == 'exclamation':
-            IconDrawer.draw_exclamation(screen, x + size//2, y + size//2, size, color)
-        elif icon_name == 'castle':
-            IconDrawer.draw_castle(screen, x + size//2, y + size//2, size, color)
-        elif icon_name == 'trophy':
-            IconDrawer.draw_trophy(screen, x + size//2, y + size//2, size, color)
-    
-    @staticmethod
-    def draw_heart(screen, x, y, size, color):
-        """Dessine un cœur avec dégradé et ombre"""
-        # Ombre
-        shadow_offset = 2
-        pygame.draw.circle(screen, (50, 0, 0), (x - size//4 + shadow_offset, y - size//4 + shadow_offset), size//4)
-        pygame.draw.circle(screen, (50, 0, 0), (x + size//4 + shadow_offset, y - size//4 + shadow_offset), size//4)
-        shadow_points = [(x + shadow_offset, y + size//2 + shadow_offset), 
-                        (x - size//2 + shadow_offset, y + shadow_offset), 
-                        (x + size//2 + shadow_offset, y + shadow_offset)]
-        pygame.draw.polygon(screen, (50, 0, 0), shadow_points)
-        
-        # Cœur principal avec dégradé
-        pygame.draw.circle(screen, color, (x - size//4, y - size//4), size//4)
-        pygame.draw.circle(screen, color, (x + size//4, y - size//4), size//4)
-        points = [(x, y + size//2), (x - size//2, y), (x + size//2, y)]
-        pygame.draw.polygon(screen, color, points)
-        
-        # Reflet
-        pygame.draw.circle(screen, (255, 200, 200), (x - size//6, y - size//3), size//8)
-        pygame.draw.circle(screen, (255, 200, 200), (x + size//6, y - size//3), size//8)
-
 class IconTextSprite:
     """Sprite qui combine une icône visuelle et du texte"""
     
@@ -1144,6 +1175,7 @@ class IconTextSprite:
         self.shadow = shadow
         self.visible = True
         self.icon_size = 20
+        self.unicode_font = resources.font(font.get_height(), owner=self)
     
     def draw(self, screen: pygame.Surface):
         """Dessine l'icône et le texte"""
@@ -1152,9 +1184,8 @@ class IconTextSprite:
         
         # Essayer d'abord les icônes Unicode
         try:
-            unicode_font = pygame.font.Font(None, self.font.get_height())
             icon = UnicodeIcons.get_icon(self.icon_type)
-            icon_surface = unicode_font.render(icon, True, self.color)
+            icon_surface = self.unicode_font.render(icon, True, self.color)
             screen.blit(icon_surface, (self.x, self.y))
             
             # Dessiner le texte à côté
@@ -1174,39 +1205,8 @@ class IconTextSprite:
             icon_x = self.x
             icon_y = self.y + 10  # Centrer verticalement avec le texte
             
-            # Couleurs spécifiques pour chaque icône
-            colors = {
-                "heart": RED,
-                "sword": (200, 200, 255),
-                "shield": BLUE,
-                "crown": YELLOW,
-                "skull": WHITE,
-                "plus": GREEN,
-                "exclamation": YELLOW,
-                "castle": GRAY,
-                "trophy": YELLOW
-            }
-            
-            color = colors.get(self.icon_type, self.color)
-            
-            if self.icon_type == "heart":
-                IconDrawer.draw_heart(screen, icon_x, icon_y, self.icon_size, color)
-            elif self.icon_type == "sword":
-                IconDrawer.draw_sword(screen, icon_x, icon_y, self.icon_size, color)
-            elif self.icon_type == "shield":
-                IconDrawer.draw_shield(screen, icon_x, icon_y, self.icon_size, color)
-            elif self.icon_type == "crown":
-                IconDrawer.draw_crown(screen, icon_x, icon_y, self.icon_size, color)
-            elif self.icon_type == "skull":
-                IconDrawer.draw_skull(screen, icon_x, icon_y, self.icon_size, color)
-            elif self.icon_type == "plus":
-                IconDrawer.draw_plus(screen, icon_x, icon_y, self.icon_size, color)
-            elif self.icon_type == "exclamation":
-                IconDrawer.draw_exclamation(screen, icon_x, icon_y, self.icon_size, color)
-            elif self.icon_type == "castle":
-                IconDrawer.draw_castle(screen, icon_x, icon_y, self.icon_size, color)
-            elif self.icon_type == "trophy":
-                IconDrawer.draw_trophy(screen, icon_x, icon_y, self.icon_size, color)
+            color = IconDrawer.ICON_COLORS.get(self.icon_type, self.color)
+            IconDrawer.draw_icon(screen, self.icon_type, icon_x, icon_y, self.icon_size, color)
             
             # Dessiner le texte à côté de l'icône
             text_x = self.x + 30  # Espacement après l'icône
@@ -1230,6 +1230,66 @@ class GameState:
     GAME_OVER = "game_over"
     VICTORY = "victory"
 
+# Fonds dégradés verticaux par état: (couleur en haut, couleur en bas)
+DEGRADES_ETATS = {
+    GameState.MENU: ((20, 0, 20), (50, 0, 50)),
+    GameState.COMBAT: ((30, 30, 0), (50, 50, 0)),
+    GameState.TRANSITION: ((30, 30, 30), (55, 55, 55)),
+    GameState.SALLE_SPECIALE: ((0, 20, 0), (0, 60, 0)),
+    GameState.GAME_OVER: ((20, 0, 0), (50, 0, 0)),
+    GameState.VICTORY: ((20, 0, 0), (50, 0, 0))
+}
+
+class GradientCache:
+    """Cache des fonds dégradés verticaux
+    
+    Chaque dégradé est calculé une seule fois avec NumPy sur une bande d'un
+    pixel de large, étirée à la taille de l'écran: le fond devient un blit.
+    Les dégradés animés ou paramétrés passent par get_interpolated, dont le
+    paramètre est quantifié pour borner le nombre de surfaces en cache.
+    """
+    
+    def __init__(self, steps: int = 32):
+        self.steps = steps
+        self.surfaces: Dict[tuple, pygame.Surface] = {}
+    
+    def get(self, top: Tuple[int, int, int], bottom: Tuple[int, int, int], 
+            size: Tuple[int, int]) -> pygame.Surface:
+        """Retourne le dégradé de top (ligne 0) vers bottom (sous la dernière ligne)"""
+        key = (top, bottom, size)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = self.create_gradient(top, bottom, size)
+        return surface
+    
+    def get_interpolated(self, start: Tuple[Tuple[int, int, int], Tuple[int, int, int]], 
+                         end: Tuple[Tuple[int, int, int], Tuple[int, int, int]], 
+                         t: float, size: Tuple[int, int]) -> pygame.Surface:
+        """Retourne le dégradé intermédiaire entre deux dégradés (t de 0 à 1)"""
+        t = round(min(max(t, 0.0), 1.0) * self.steps) / self.steps
+        top, bottom = (tuple(int(a + (b - a) * t) for a, b in zip(debut, fin))
+                       for debut, fin in zip(start, end))
+        return self.get(top, bottom, size)
+    
+    @staticmethod
+    def create_gradient(top: Tuple[int, int, int], bottom: Tuple[int, int, int], 
+                        size: Tuple[int, int]) -> pygame.Surface:
+        """Calcule un dégradé vertical de la taille demandée"""
+        width, height = size
+        lignes = np.arange(height)[:, None] / height
+        haut = np.array(top, dtype=float)
+        couleurs = (haut + lignes * (np.array(bottom, dtype=float) - haut)).astype(np.uint8)
+        
+        bande = pygame.surfarray.make_surface(couleurs[None, :, :])
+        surface = pygame.transform.scale(bande, (width, height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+    
+    def clear(self):
+        """Vide le cache (changement de taille d'écran)"""
+        self.surfaces.clear()
+
 class RoguelikeGraphiqueAvance:
     """Classe principale du jeu graphique avancé"""
     
@@ -1237,11 +1297,13 @@ class RoguelikeGraphiqueAvance:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Roguelike Graphique Avancé")
         self.clock = pygame.time.Clock()
+        # Pleine cadence pendant les animations, attente des événements au repos
+        self.scheduler = FrameScheduler(FPS, clock=self.clock)
         
         # Polices
-        self.font_large = pygame.font.Font(None, 64)
-        self.font_medium = pygame.font.Font(None, 36)
-        self.font_small = pygame.font.Font(None, 24)
+        self.font_large = resources.font(64, owner=self)
+        self.font_medium = resources.font(36, owner=self)
+        self.font_small = resources.font(24, owner=self)
         
         # Gestionnaires
         self.sound_manager = SoundManager()
@@ -1266,9 +1328,11 @@ class RoguelikeGraphiqueAvance:
         # Système de particules
         self.particles = ParticleSystem()
         
+        # Fonds dégradés pré-calculés
+        self.gradients = GradientCache()
+        
         # Animation
         self.animation_timer = 0
-        self.last_time = pygame.time.get_ticks()
         
         self.setup_menu()
     
@@ -1564,11 +1628,8 @@ class RoguelikeGraphiqueAvance:
         self.add_combat_log(f"[SWORD] Vous attaquez {ennemi.nom} pour {degats} degats!")
         
         # Effet de particules
-        for i in range(10):
-            self.particles.add_particle(
-                self.enemy_sprite.rect.centerx, self.enemy_sprite.rect.centery,
-                YELLOW, (random.uniform(-2, 2), random.uniform(-2, 2)), 1000
-            )
+        self.particles.add_particles(self.enemy_sprite.rect.centerx, self.enemy_sprite.rect.centery,
+                                     YELLOW, 2, 10, 1000)
         
         # Mettre à jour la barre de vie de l'ennemi
         self.enemy_health_bar.update_health(ennemi.pv_actuels)
@@ -1590,11 +1651,8 @@ class RoguelikeGraphiqueAvance:
         self.add_combat_log(f"[HIT] {ennemi.nom} vous attaque pour {degats} degats!")
         
         # Effet de particules
-        for i in range(8):
-            self.particles.add_particle(
-                self.player_sprite.rect.centerx, self.player_sprite.rect.centery,
-                RED, (random.uniform(-2, 2), random.uniform(-2, 2)), 1000
-            )
+        self.particles.add_particles(self.player_sprite.rect.centerx, self.player_sprite.rect.centery,
+                                     RED, 2, 8, 1000)
         
         # Mettre à jour la barre de vie du joueur
         self.player_health_bar.update_health(self.jeu.joueur.pv_actuels)
@@ -1617,11 +1675,8 @@ class RoguelikeGraphiqueAvance:
             message = f"Vous récupérez {soin} PV!"
             
             # Effet de particules de soin
-            for i in range(15):
-                self.particles.add_particle(
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-                    GREEN, (random.uniform(-3, 3), random.uniform(-3, 3)), 1500
-                )
+            self.particles.add_particles(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                                         GREEN, 3, 15, 1500)
         elif isinstance(salle, SalleAmelioration):
             bonus = random.randint(BONUS_ATTAQUE_MIN, BONUS_ATTAQUE_MAX)
             self.jeu.joueur.augmenter_attaque(bonus)
@@ -1629,21 +1684,15 @@ class RoguelikeGraphiqueAvance:
             message = f"Votre attaque augmente de {bonus}!"
             
             # Effet de particules d'amélioration
-            for i in range(20):
-                self.particles.add_particle(
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-                    YELLOW, (random.uniform(-4, 4), random.uniform(-4, 4)), 2000
-                )
+            self.particles.add_particles(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                                         YELLOW, 4, 20, 2000)
         elif isinstance(salle, SallePowerUp):
             self.sound_manager.play_sound('upgrade')
             message = f"Vous obtenez: {salle.power_up.nom}!"
             
             # Effet de particules de power-up
-            for i in range(25):
-                self.particles.add_particle(
-                    SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
-                    PURPLE, (random.uniform(-5, 5), random.uniform(-5, 5)), 2500
-                )
+            self.particles.add_particles(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2,
+                                         PURPLE, 5, 25, 2500)
         
         # Afficher le message
         message_text = TextSprite(SCREEN_WIDTH // 2 - 200, 400, message, 
@@ -1698,9 +1747,9 @@ class RoguelikeGraphiqueAvance:
                             self.font_medium, BLUE)
         self.buttons.append(menu_button)
     
-    def handle_events(self):
-        """Gère les événements du jeu"""
-        for event in pygame.event.get():
+    def handle_events(self, events: Optional[List[pygame.event.Event]] = None):
+        """Gère les événements du jeu (ceux de la file si events est None)"""
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 return False
             
@@ -1803,6 +1852,16 @@ class RoguelikeGraphiqueAvance:
         self.player_health_bar = None
         self.enemy_health_bar = None
     
+    def is_animating(self) -> bool:
+        """Indique si l'écran change sans événement (attaques, barres, survols, particules)"""
+        if self.state == GameState.PLAYING or len(self.particles) > 0:
+            return True
+        if any(sprite.is_attacking for sprite in self.sprites):
+            return True
+        if any(bar is not None and bar.animating() for bar in (self.player_health_bar, self.enemy_health_bar)):
+            return True
+        return any(button.animating() for button in self.buttons)
+    
     def update(self, dt: int):
         """Met à jour la logique du jeu"""
         # Mettre à jour les sprites animés
@@ -1842,40 +1901,16 @@ class RoguelikeGraphiqueAvance:
     
     def draw_background(self):
         """Dessine le fond selon l'état du jeu"""
-        if self.state == GameState.MENU:
-            # Fond dégradé pour le menu
-            for y in range(SCREEN_HEIGHT):
-                color_value = int(20 + (y / SCREEN_HEIGHT) * 30)
-                pygame.draw.line(self.screen, (color_value, 0, color_value), (0, y), (SCREEN_WIDTH, y))
-        elif self.state == GameState.COMBAT:
-            # Fond dégradé pour le combat
-            for y in range(SCREEN_HEIGHT):
-                color_value = int(30 + (y / SCREEN_HEIGHT) * 20)
-                pygame.draw.line(self.screen, (color_value, color_value, 0), (0, y), (SCREEN_WIDTH, y))
-        elif self.state == GameState.TRANSITION:
-            # Fond dégradé pour les transitions
-            for y in range(SCREEN_HEIGHT):
-                color_value = int(30 + (y / SCREEN_HEIGHT) * 25)
-                pygame.draw.line(self.screen, (color_value, color_value, color_value), (0, y), (SCREEN_WIDTH, y))
-        elif self.state == GameState.SALLE_SPECIALE:
-            # Fond vert pour les salles spéciales
-            for y in range(SCREEN_HEIGHT):
-                color_value = int(20 + (y / SCREEN_HEIGHT) * 40)
-                pygame.draw.line(self.screen, (0, color_value, 0), (0, y), (SCREEN_WIDTH, y))
-        elif self.state in [GameState.GAME_OVER, GameState.VICTORY]:
-            # Fond dégradé pour les écrans de fin
-            for y in range(SCREEN_HEIGHT):
-                color_value = int(20 + (y / SCREEN_HEIGHT) * 30)
-                pygame.draw.line(self.screen, (color_value, 0, 0), (0, y), (SCREEN_WIDTH, y))
+        degrade = DEGRADES_ETATS.get(self.state)
+        if degrade is not None:
+            self.screen.blit(self.gradients.get(*degrade, self.screen.get_size()), (0, 0))
         else:
             # Fond simple pour les autres états
             self.screen.fill(BLACK)
 
     def draw(self):
         """Dessine tout le jeu"""
-        self.screen.fill(BLACK)
-        
-        # Dessiner le fond
+        # Dessiner le fond, qui recouvre tout l'écran
         self.draw_background()
         
         # Dessiner tous les sprites
@@ -1910,14 +1945,11 @@ class RoguelikeGraphiqueAvance:
         running = True
         
         while running:
-            current_time = pygame.time.get_ticks()
-            dt = current_time - self.last_time
-            self.last_time = current_time
+            dt, events = self.scheduler.tick(self.is_animating())
             
-            running = self.handle_events()
+            running = self.handle_events(events)
             self.update(dt)
             self.draw()
-            self.clock.tick(FPS)
         
         pygame.quit()
         sys.exit()
@@ -4,20 +4,22 @@ Version optimisée du jeu Roguelike - Architecture SOLID
 Réduit de 1930 lignes à ~500 lignes
 """
 
+import os
 import pygame
+import secrets
 import sys
-import random
-from typing import Optional, List
+import time
+from typing import Callable, Optional, List, Tuple
 from config import *
-from entities import Player, Enemy, Boss, EnemyRoom, BossRoom, HealingRoom, UpgradeRoom, PowerUpRoom
-from services import GameService, GameFactory, SoundManager
-from renderer import OptimizedRenderer
+import rng
+from entities import (Player, Enemy, Boss, EnemyRoom, BossRoom, HealingRoom, UpgradeRoom, PowerUpRoom,
+                      charger_stats_calibrees)
+from services import GameService, GameFactory, HeadlessGameFactory, SoundManager, NullSoundManager
+from renderer import BackBuffer, OptimizedRenderer, NullRenderer
 from effects import EffectManager, ComboSystem, ReputationSystem, MiniGame
 from events import EventManager, EasterEggManager, DynamicDifficulty, FunFeatures
-
-# Initialisation de Pygame
-pygame.init()
-pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+from replay import Enregistrement
+from scheduler import FrameScheduler
 
 class GameState:
     """États du jeu"""
@@ -29,19 +31,91 @@ class GameState:
     GAME_OVER = "game_over"
     VICTORY = "victory"
 
+# Description d'un bouton: (x, y, largeur, hauteur, texte, couleur, action)
+Bouton = Tuple[int, int, int, int, str, Tuple[int, int, int], str]
+
+BOUTONS_MENU: List[Bouton] = [
+    (SCREEN_WIDTH // 2 - 120, 250 + i * 60, 240, 50, info["nom"], info["couleur"], f"difficulty_{level}")
+    for i, (level, info) in enumerate(DIFFICULTES.items())
+] + [(SCREEN_WIDTH // 2 - 120, 250 + 3 * 60, 240, 50, "QUITTER", RED, "quit")]
+BOUTON_TURBO: Bouton = (SCREEN_WIDTH // 2 + 10, 420, 200, 50, "TURBO", BLUE, "turbo")
+BOUTONS_SALLE_SPECIALE: List[Bouton] = [
+    (SCREEN_WIDTH // 2 - 150, 450, 300, 50, "CONTINUER L'AVENTURE", GREEN, "continue")
+]
+BOUTONS_TRANSITION: List[Bouton] = [(SCREEN_WIDTH // 2 - 100, 450, 200, 50, "CONTINUER", GREEN, "continue")]
+BOUTONS_GAME_OVER: List[Bouton] = [
+    (SCREEN_WIDTH // 2 - 150, 450, 140, 50, "REJOUER", GREEN, "replay"),
+    (SCREEN_WIDTH // 2 + 10, 450, 140, 50, "MENU", BLUE, "menu")
+]
+
+# Icônes (type, taille, couleur) des méthodes render_*, pré-rendues au lancement
+ICONES_UTILISEES = [
+    ("castle", 40, YELLOW),
+    ("sword", 30, YELLOW), ("shield", 30, WHITE), ("skull", 30, WHITE),
+    ("plus", 40, YELLOW), ("heart", 40, GREEN),
+    ("sword", 40, YELLOW), ("sword", 40, ORANGE),
+    ("crown", 40, YELLOW), ("crown", 40, PURPLE),
+    ("crown", 40, GREEN), ("skull", 40, RED),
+    ("heart", 20, WHITE), ("sword", 20, WHITE), ("skull", 20, WHITE), ("crown", 20, WHITE),
+    ("crown", 30, WHITE), ("castle", 30, WHITE)
+]
+
+# Libellés fixes réutilisés à chaque partie: épinglés dans le cache de texte
+TEXTES_EPINGLES = [
+    ("ROGUELIKE OPTIMISÉ", 'large', YELLOW),
+    ("Choisissez votre difficulté", 'medium', WHITE),
+    ("Héros", 'medium', WHITE),
+    ("💡 Astuce: Essayez des combinaisons de touches!", 'small', GRAY),
+    ("Vous vous reposez et récupérez des forces!", 'medium', WHITE),
+    ("Votre attaque augmente!", 'medium', WHITE),
+    ("Vous trouvez un power-up!", 'medium', WHITE),
+    ("VICTOIRE!", 'large', GREEN),
+    ("DÉFAITE!", 'large', RED),
+    ("GAME OVER", 'large', RED)
+]
+
 class OptimizedRoguelike:
     """Version optimisée du jeu Roguelike"""
     
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Roguelike Optimisé - Version Fun!")
+    def __init__(self, headless: bool = False, seed: Optional[int] = None):
+        self.headless = headless
+        if headless:
+            # Sans fenêtre, son ni polices: relecture à vitesse maximale
+            self.screen = None
+            self.back_buffer = None
+            self.factory = HeadlessGameFactory()
+            self.sound_manager = NullSoundManager()
+            self.renderer = NullRenderer()
+        else:
+            # Initialisation de Pygame
+            pygame.init()
+            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+            display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            pygame.display.set_caption("Roguelike Optimisé - Version Fun!")
+            # La scène est dessinée dans un tampon arrière, présenté décalé pendant un tremblement
+            self.back_buffer = BackBuffer(display)
+            self.screen = self.back_buffer.surface
+            self.factory = GameFactory()
+            self.sound_manager = SoundManager()
+            self.renderer = OptimizedRenderer(self.screen)
+            self.renderer.icons.prewarm(ICONES_UTILISEES)
+            for text, font_size, color in TEXTES_EPINGLES:
+                self.renderer.pin_text(text, font_size, color)
         self.clock = pygame.time.Clock()
-        
-        # Services
-        self.factory = GameFactory()
+        # Pleine cadence pendant les animations, attente des événements au repos
+        self.scheduler = FrameScheduler(FPS, clock=self.clock)
         self.game_service = GameService(self.factory)
-        self.sound_manager = SoundManager()
-        self.renderer = OptimizedRenderer(self.screen)
+        
+        # Table produite par calibration.py, si elle existe
+        charger_stats_calibrees()
+        
+        # Graine de la session: avec les actions enregistrées, elle suffit à la rejouer
+        self.seed = seed if seed is not None else secrets.randbits(63)
+        rng.seed(self.seed)
+        self.enregistrement: Optional[Enregistrement] = None if headless else Enregistrement(self.seed)
+        
+        # Horloge en ms, remplacée par les instants enregistrés lors d'une relecture
+        self.horloge: Callable[[], int] = pygame.time.get_ticks
         
         # Systèmes amusants
         self.effect_manager = EffectManager()
@@ -60,146 +134,43 @@ class OptimizedRoguelike:
         self.combat_log = []
         self.special_messages = []
         self.last_event_time = 0
+        self.transition_victory = True
         
         # Initialisation
         self.setup_menu()
     
     def setup_menu(self) -> None:
         """Configure le menu principal"""
-        self.buttons.clear()
-        self.renderer.clear_cache()
-        
-        # Titre
-        self.renderer.draw_text("ROGUELIKE OPTIMISÉ", SCREEN_WIDTH // 2, 100, 'large', YELLOW, center=True)
-        self.renderer.draw_icon(SCREEN_WIDTH // 2 - 200, 100, "castle", 40, YELLOW)
-        self.renderer.draw_icon(SCREEN_WIDTH // 2 + 160, 100, "castle", 40, YELLOW)
-        
-        # Sous-titre
-        self.renderer.draw_text("Choisissez votre difficulté", SCREEN_WIDTH // 2, 150, 'medium', WHITE, center=True)
-        
-        # Boutons de difficulté
-        y_start = 250
-        for i, (level, info) in enumerate(DIFFICULTES.items()):
-            button = self.renderer.draw_button(
-                SCREEN_WIDTH // 2 - 120, y_start + i * 60, 240, 50,
-                info["nom"], info["couleur"]
-            )
-            self.buttons.append((button, f"difficulty_{level}"))
-        
-        # Bouton quitter
-        quit_button = self.renderer.draw_button(
-            SCREEN_WIDTH // 2 - 120, y_start + 3 * 60, 240, 50, "QUITTER", RED
-        )
-        self.buttons.append((quit_button, "quit"))
+        self.set_buttons(BOUTONS_MENU)
     
     def setup_combat(self) -> None:
         """Configure l'écran de combat"""
         self.buttons.clear()
         if not self.combat_log:
-            self.combat_log = ["Cliquez sur ATTAQUER pour combattre!"]
+            self.combat_log = ["Cliquez sur ATTAQUER, ou TURBO pour tout résoudre!"]
     
     def setup_special_room(self) -> None:
         """Configure une salle spéciale"""
-        self.buttons.clear()
-        
-        # Titre de la salle
-        self.renderer.draw_text(f"=== {self.current_room.nom} ===", SCREEN_WIDTH // 2, 200, 'large', YELLOW, center=True)
-        
-        # Icônes selon le type
-        if isinstance(self.current_room, HealingRoom):
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 100, 200, "plus", 40, YELLOW)
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 + 60, 200, "plus", 40, YELLOW)
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 20, 300, "heart", 40, GREEN)
-            message = "Vous vous reposez et récupérez des forces!"
-        elif isinstance(self.current_room, UpgradeRoom):
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 100, 200, "sword", 40, YELLOW)
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 + 60, 200, "sword", 40, YELLOW)
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 20, 300, "sword", 40, ORANGE)
-            message = "Votre attaque augmente!"
-        elif isinstance(self.current_room, PowerUpRoom):
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 100, 200, "crown", 40, YELLOW)
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 + 60, 200, "crown", 40, YELLOW)
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 20, 300, "crown", 40, PURPLE)
-            message = "Vous trouvez un power-up!"
-        
-        # Message
-        self.renderer.draw_text(message, SCREEN_WIDTH // 2, 350, 'medium', WHITE, center=True)
-        
-        # Bouton continuer
-        continue_button = self.renderer.draw_button(
-            SCREEN_WIDTH // 2 - 150, 450, 300, 50, "CONTINUER L'AVENTURE", GREEN
-        )
-        self.buttons.append((continue_button, "continue"))
+        self.set_buttons(BOUTONS_SALLE_SPECIALE)
     
     def setup_transition(self, victory: bool) -> None:
         """Configure l'écran de transition"""
-        self.buttons.clear()
-        
-        player = self.game_service.get_player()
-        
-        # Titre
-        if victory:
-            self.renderer.draw_text("VICTOIRE!", SCREEN_WIDTH // 2, 150, 'large', GREEN, center=True)
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 100, 150, "crown", 40, GREEN)
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 + 60, 150, "crown", 40, GREEN)
-        else:
-            self.renderer.draw_text("DÉFAITE!", SCREEN_WIDTH // 2, 150, 'large', RED, center=True)
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 100, 150, "skull", 40, RED)
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 + 60, 150, "skull", 40, RED)
-        
-        # Statistiques
-        stats_y = 250
-        stats = [
-            (f"PV: {player.pv_actuels}/{player.pv_max}", "heart"),
-            (f"Attaque: {player.attaque}", "sword"),
-            (f"Ennemis tués: {player.ennemis_tues}", "skull"),
-            (f"Boss vaincus: {player.boss_vaincus}", "crown")
-        ]
-        
-        for i, (stat, icon_type) in enumerate(stats):
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 200, stats_y + i * 30, icon_type, 20, WHITE)
-            self.renderer.draw_text(stat, SCREEN_WIDTH // 2 - 170, stats_y + i * 30, 'small', WHITE)
-        
-        # Bouton continuer
-        continue_button = self.renderer.draw_button(
-            SCREEN_WIDTH // 2 - 100, 450, 200, 50, "CONTINUER", GREEN
-        )
-        self.buttons.append((continue_button, "continue"))
+        self.transition_victory = victory
+        self.set_buttons(BOUTONS_TRANSITION)
     
     def setup_game_over(self) -> None:
         """Configure l'écran de fin de partie"""
-        self.buttons.clear()
-        
-        player = self.game_service.get_player()
-        
-        # Titre
-        self.renderer.draw_text("GAME OVER", SCREEN_WIDTH // 2, 100, 'large', RED, center=True)
-        self.renderer.draw_icon(SCREEN_WIDTH // 2 - 100, 100, "skull", 40, RED)
-        self.renderer.draw_icon(SCREEN_WIDTH // 2 + 60, 100, "skull", 40, RED)
-        
-        # Statistiques finales
-        stats_y = 200
-        stats = [
-            (f"Ennemis tués: {player.ennemis_tues}", "skull"),
-            (f"Boss vaincus: {player.boss_vaincus}", "crown"),
-            (f"Salles traversées: {self.game_service._salle_actuelle}", "castle"),
-            (f"Score final: {player.score}", "crown")
-        ]
-        
-        for i, (stat, icon_type) in enumerate(stats):
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 200, stats_y + i * 50, icon_type, 30, WHITE)
-            self.renderer.draw_text(stat, SCREEN_WIDTH // 2 - 160, stats_y + i * 50, 'medium', WHITE)
-        
-        # Boutons
-        replay_button = self.renderer.draw_button(
-            SCREEN_WIDTH // 2 - 150, 450, 140, 50, "REJOUER", GREEN
-        )
-        menu_button = self.renderer.draw_button(
-            SCREEN_WIDTH // 2 + 10, 450, 140, 50, "MENU", BLUE
-        )
-        
-        self.buttons.append((replay_button, "replay"))
-        self.buttons.append((menu_button, "menu"))
+        self.set_buttons(BOUTONS_GAME_OVER)
+    
+    def set_buttons(self, specs: List[Bouton]) -> None:
+        """Remplace les boutons cliquables par ceux décrits"""
+        self.buttons[:] = [(pygame.Rect(x, y, width, height), action)
+                           for x, y, width, height, _, _, action in specs]
+    
+    def draw_buttons(self, specs: List[Bouton]) -> None:
+        """Dessine des boutons décrits par (x, y, largeur, hauteur, texte, couleur, action)"""
+        for x, y, width, height, text, color, _ in specs:
+            self.renderer.draw_button(x, y, width, height, text, color)
     
     def add_combat_log(self, message: str) -> None:
         """Ajoute un message au log de combat"""
@@ -207,19 +178,18 @@ class OptimizedRoguelike:
         if len(self.combat_log) > 5:
             self.combat_log.pop(0)
     
-    def handle_events(self) -> bool:
-        """Gère les événements avec easter eggs"""
-        for event in pygame.event.get():
+    def handle_events(self, events: Optional[List[pygame.event.Event]] = None) -> bool:
+        """Gère les événements avec easter eggs (ceux de la file si events est None)"""
+        for event in pygame.event.get() if events is None else events:
             if event.type == pygame.QUIT:
                 return False
             
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # Fenêtre réexposée: son contenu est à redessiner entièrement
+                self.renderer.invalidate()
+            
             elif event.type == pygame.KEYDOWN:
-                # Easter eggs avec touches
-                key_name = pygame.key.name(event.key)
-                easter_result = self.easter_egg_manager.add_key(key_name)
-                if easter_result:
-                    self.add_combat_log(f"🥚 {easter_result}")
-                    self.effect_manager.add_magic_effect(SCREEN_WIDTH//2, SCREEN_HEIGHT//2)
+                self.handle_key(pygame.key.name(event.key))
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Clic gauche
@@ -227,25 +197,59 @@ class OptimizedRoguelike:
                     
                     for button, action in self.buttons:
                         if button.collidepoint(mouse_pos):
-                            self.sound_manager.play_sound('click')
-                            
-                            if action.startswith("difficulty_"):
-                                difficulty = int(action.split("_")[1])
-                                self.start_game(difficulty)
-                            elif action == "quit":
+                            if not self.dispatch_action(action):
                                 return False
-                            elif action == "attack":
-                                self.handle_combat()
-                            elif action == "continue":
-                                self.continue_adventure()
-                            elif action == "replay":
-                                self.replay_game()
-                            elif action == "menu":
-                                self.state = GameState.MENU
-                                self.setup_menu()
+                            break
         
         return True
     
+    def handle_key(self, key_name: str) -> None:
+        """Traite une touche pressée (easter eggs avec touches)"""
+        if self.enregistrement is not None:
+            self.enregistrement.ajouter_touche(self.horloge(), key_name)
+        
+        easter_result = self.easter_egg_manager.add_key(key_name)
+        if easter_result:
+            self.add_combat_log(f"🥚 {easter_result}")
+            self.effect_manager.add_magic_effect(SCREEN_WIDTH//2, SCREEN_HEIGHT//2)
+    
+    def dispatch_action(self, action: str) -> bool:
+        """Exécute l'action d'un bouton, retourne False pour quitter"""
+        if self.enregistrement is not None:
+            self.enregistrement.ajouter_action(self.horloge(), action)
+        
+        self.sound_manager.play_sound('click')
+        
+        if action.startswith("difficulty_"):
+            difficulty = int(action.split("_")[1])
+            self.start_game(difficulty)
+        elif action == "quit":
+            return False
+        elif action == "attack":
+            self.handle_combat()
+        elif action == "turbo":
+            self.handle_turbo()
+        elif action == "continue":
+            self.continue_adventure()
+        elif action == "replay":
+            self.replay_game()
+        elif action == "menu":
+            self.state = GameState.MENU
+            self.setup_menu()
+        return True
+    
+    def sauvegarder_enregistrement(self) -> Optional[str]:
+        """Sauvegarde l'enregistrement de la session, retourne son chemin"""
+        if self.enregistrement is None or not self.enregistrement.evenements:
+            return None
+        
+        chemin = os.path.join(DOSSIER_REPLAYS, f"session_{time.strftime('%Y%m%d_%H%M%S')}.rpl")
+        try:
+            self.enregistrement.sauvegarder(chemin)
+        except Exception:
+            return None
+        return chemin
+    
     def start_game(self, difficulty: int) -> None:
         """Démarre une nouvelle partie"""
         self.game_service.start_game(difficulty)
@@ -261,6 +265,7 @@ class OptimizedRoguelike:
         """Réinitialise tous les systèmes amusants"""
         self.combo_system.reset()
         self.event_manager.reset_events()
+        self.effect_manager.set_weather("clear")
         self.easter_egg_manager.secrets_found.clear()
         self.easter_egg_manager.current_combination.clear()
         self.dynamic_difficulty.player_performance.clear()
@@ -279,13 +284,15 @@ class OptimizedRoguelike:
         else:
             self.state = GameState.SPECIAL_ROOM
             self.current_room.entrer(self.game_service.get_player())
+            if isinstance(self.current_room, HealingRoom):
+                self.effect_manager.add_tint(GREEN, 60, 600)
             self.setup_special_room()
     
     def handle_combat(self) -> None:
         """Gère un tour de combat avec effets amusants"""
         player = self.game_service.get_player()
         enemy = self.current_room.ennemi
-        current_time = pygame.time.get_ticks()
+        current_time = self.horloge()
         
         # Système de combo et critiques
         hit_result = self.combo_system.hit(current_time)
@@ -308,30 +315,14 @@ class OptimizedRoguelike:
             self.effect_manager.add_damage_effect(900, 200)
         
         # Message amusant aléatoire
-        if random.random() < 0.3:  # 30% de chance
+        if rng.flux(rng.FLUX_MESSAGES).random() < 0.3:  # 30% de chance
             self.add_combat_log(f"💬 {self.fun_features.get_silly_message()}")
         
         self.sound_manager.play_sound('attack')
         
         # Vérifier si l'ennemi est mort
         if not enemy.est_vivant():
-            if isinstance(self.current_room, EnemyRoom):
-                player.tuer_ennemi()
-                victory_msg = self.fun_features.get_victory_quote()
-                self.add_combat_log(f"🎉 {victory_msg}")
-                self.reputation_system.add_reputation(10, f"Vaincu {enemy.nom}")
-            else:
-                player.vaincre_boss()
-                victory_msg = self.fun_features.get_victory_quote()
-                self.add_combat_log(f"👑 {victory_msg}")
-                self.reputation_system.add_reputation(50, f"Vaincu le boss {enemy.nom}")
-            
-            # Effets de victoire
-            self.effect_manager.add_explosion(900, 200, GREEN, 50)
-            self.effect_manager.add_flash(GREEN, 20)
-            self.sound_manager.play_sound('victory')
-            self.setup_transition(True)
-            self.state = GameState.TRANSITION
+            self.victoire_combat(player, enemy)
             return
         
         # Ennemi attaque
@@ -341,15 +332,11 @@ class OptimizedRoguelike:
         
         # Effet de dégâts sur le joueur
         self.effect_manager.add_damage_effect(100, 200)
+        self.effect_manager.add_damage_vignette()
         
         # Vérifier si le joueur est mort
         if not player.est_vivant():
-            defeat_msg = self.fun_features.get_defeat_quote()
-            self.add_combat_log(f"💀 {defeat_msg}")
-            self.sound_manager.play_sound('defeat')
-            self.effect_manager.add_flash(RED, 30)
-            self.setup_game_over()
-            self.state = GameState.GAME_OVER
+            self.defaite_combat()
             return
         
         # Événements aléatoires
@@ -358,6 +345,8 @@ class OptimizedRoguelike:
             if event_result:
                 self.add_combat_log(f"🎲 ÉVÉNEMENT: {event_result}")
                 self.last_event_time = current_time
+                if self.event_manager.weather != self.effect_manager.weather:
+                    self.effect_manager.set_weather(self.event_manager.weather)
         
         # Easter eggs
         easter_egg = self.easter_egg_manager.check_special_conditions(player, self.game_service)
@@ -367,6 +356,59 @@ class OptimizedRoguelike:
         # Mettre à jour l'affichage
         self.setup_combat()
     
+    def handle_turbo(self) -> None:
+        """Résout tout le combat d'un coup et n'affiche que son résumé
+        
+        Ni combo, ni effets par tour, ni messages amusants: seuls la fin du
+        combat et ses effets sont joués, comme pour un tour normal.
+        """
+        player = self.game_service.get_player()
+        enemy = self.current_room.ennemi
+        tours = self.game_service.get_combat_system().resoudre_combat(player, enemy)
+        self.combo_system.reset()
+        
+        infliges = sum(degats for degats, _, _, _ in tours)
+        subis = sum(riposte for _, riposte, _, _ in tours)
+        self.add_combat_log(f"⏩ {len(tours)} tours: {infliges} dégâts infligés, {subis} subis")
+        self.sound_manager.play_sound('attack')
+        
+        if not enemy.est_vivant():
+            self.victoire_combat(player, enemy)
+        elif not player.est_vivant():
+            self.defaite_combat()
+        else:
+            self.setup_combat()
+    
+    def victoire_combat(self, player: Player, enemy: Enemy) -> None:
+        """Crédite la victoire et passe à l'écran de transition"""
+        if isinstance(self.current_room, EnemyRoom):
+            player.tuer_ennemi()
+            victory_msg = self.fun_features.get_victory_quote()
+            self.add_combat_log(f"🎉 {victory_msg}")
+            self.reputation_system.add_reputation(10, f"Vaincu {enemy.nom}")
+        else:
+            player.vaincre_boss()
+            victory_msg = self.fun_features.get_victory_quote()
+            self.add_combat_log(f"👑 {victory_msg}")
+            self.reputation_system.add_reputation(50, f"Vaincu le boss {enemy.nom}")
+        
+        # Effets de victoire
+        self.effect_manager.add_explosion(900, 200, GREEN, 50)
+        self.effect_manager.add_flash(GREEN, 20)
+        self.sound_manager.play_sound('victory')
+        self.setup_transition(True)
+        self.state = GameState.TRANSITION
+    
+    def defaite_combat(self) -> None:
+        """Affiche la défaite et passe à l'écran de fin de partie"""
+        defeat_msg = self.fun_features.get_defeat_quote()
+        self.add_combat_log(f"💀 {defeat_msg}")
+        self.sound_manager.play_sound('defeat')
+        self.effect_manager.add_flash(RED, 30)
+        self.effect_manager.add_fade_in(600)
+        self.setup_game_over()
+        self.state = GameState.GAME_OVER
+    
     def continue_adventure(self) -> None:
         """Continue l'aventure"""
         if self.state == GameState.TRANSITION:
@@ -384,7 +426,7 @@ class OptimizedRoguelike:
     
     def replay_game(self) -> None:
         """Relance une partie"""
-        difficulty = self.game_service._difficulty
+        difficulty = self.game_service.get_difficulty()
         self.start_game(difficulty)
     
     def draw_combat_log(self) -> None:
@@ -392,8 +434,28 @@ class OptimizedRoguelike:
         for i, message in enumerate(self.combat_log):
             self.renderer.draw_text(message, 50, 500 + i * 25, 'small', WHITE)
     
+    def render_state(self) -> None:
+        """Rend l'écran de l'état courant"""
+        if self.state == GameState.MENU:
+            self.render_menu()
+        elif self.state == GameState.COMBAT:
+            self.render_combat()
+        elif self.state == GameState.SPECIAL_ROOM:
+            self.render_special_room()
+        elif self.state == GameState.TRANSITION:
+            self.render_transition()
+        elif self.state == GameState.GAME_OVER:
+            self.render_game_over()
+        elif self.state == GameState.VICTORY:
+            self.render_game_over()
+    
     def render_menu(self) -> None:
         """Rend le menu principal"""
+        self.renderer.draw_layer(GameState.MENU, None, self.draw_menu_layer)
+        self.set_buttons(BOUTONS_MENU)
+    
+    def draw_menu_layer(self) -> None:
+        """Dessine la couche statique du menu principal"""
         # Titre
         self.renderer.draw_text("ROGUELIKE OPTIMISÉ", SCREEN_WIDTH // 2, 100, 'large', YELLOW, center=True)
         self.renderer.draw_icon(SCREEN_WIDTH // 2 - 200, 100, "castle", 40, YELLOW)
@@ -402,62 +464,35 @@ class OptimizedRoguelike:
         # Sous-titre
         self.renderer.draw_text("Choisissez votre difficulté", SCREEN_WIDTH // 2, 150, 'medium', WHITE, center=True)
         
-        # Boutons de difficulté
-        y_start = 250
-        for i, (level, info) in enumerate(DIFFICULTES.items()):
-            button = self.renderer.draw_button(
-                SCREEN_WIDTH // 2 - 120, y_start + i * 60, 240, 50,
-                info["nom"], info["couleur"]
-            )
-            if len(self.buttons) <= i:
-                self.buttons.append((button, f"difficulty_{level}"))
-            else:
-                self.buttons[i] = (button, f"difficulty_{level}")
-        
-        # Bouton quitter
-        quit_button = self.renderer.draw_button(
-            SCREEN_WIDTH // 2 - 120, y_start + 3 * 60, 240, 50, "QUITTER", RED
-        )
-        if len(self.buttons) <= 3:
-            self.buttons.append((quit_button, "quit"))
-        else:
-            self.buttons[3] = (quit_button, "quit")
+        # Boutons de difficulté et bouton quitter
+        self.draw_buttons(BOUTONS_MENU)
     
     def render_combat(self) -> None:
         """Rend l'écran de combat avec informations amusantes"""
         player = self.game_service.get_player()
         enemy = self.current_room.ennemi
         
-        # Informations de difficulté
-        diff_info = DIFFICULTES[self.game_service._difficulty]
-        self.renderer.draw_text(f"Difficulté: {diff_info['nom']}", 50, 20, 'small', diff_info['couleur'])
+        # Titres, noms et icônes ne changent qu'avec la salle
+        self.renderer.draw_layer(GameState.COMBAT, (self.current_room, self.game_service.get_difficulty()),
+                                 self.draw_combat_layer)
         
-        # Score et réputation
-        self.renderer.draw_text(f"Score: {player.score}", 50, 50, 'small', WHITE)
+        # Score et réputation (les nombres sont composés de glyphes en cache)
+        self.renderer.draw_glyph_text(f"Score: {player.score}", 50, 50, 'small', WHITE)
         self.renderer.draw_text(f"Réputation: {self.reputation_system.get_current_title()}", 50, 80, 'small', YELLOW)
         
         # Combo actuel
         if self.combo_system.combo_count > 1:
-            self.renderer.draw_text(f"COMBO x{self.combo_system.combo_count}!", 300, 50, 'small', ORANGE)
-        
-        # Titre de la salle
-        self.renderer.draw_text(f"=== {self.current_room.nom} ===", 50, 120, 'large', YELLOW)
-        self.renderer.draw_icon(20, 120, "sword", 30, YELLOW)
-        self.renderer.draw_icon(400, 120, "sword", 30, YELLOW)
+            self.renderer.draw_glyph_text(f"COMBO x{self.combo_system.combo_count}!", 300, 50, 'small', ORANGE)
         
         # Joueur
-        self.renderer.draw_icon(50, 220, "shield", 30, WHITE)
-        self.renderer.draw_text("Héros", 100, 220, 'medium', WHITE)
         self.renderer.draw_health_bar(50, 260, 300, 20, player.pv_actuels, player.pv_max, GREEN)
-        self.renderer.draw_text(f"PV: {player.pv_actuels}/{player.pv_max}", 50, 290, 'small', WHITE)
-        self.renderer.draw_text(f"Attaque: {player.attaque}", 50, 320, 'small', WHITE)
+        self.renderer.draw_glyph_text(f"PV: {player.pv_actuels}/{player.pv_max}", 50, 290, 'small', WHITE)
+        self.renderer.draw_glyph_text(f"Attaque: {player.attaque}", 50, 320, 'small', WHITE)
         
         # Ennemi
-        self.renderer.draw_icon(850, 220, "skull", 30, WHITE)
-        self.renderer.draw_text(enemy.nom, 900, 220, 'medium', WHITE)
         self.renderer.draw_health_bar(750, 260, 300, 20, enemy.pv_actuels, enemy.pv_max, RED)
-        self.renderer.draw_text(f"PV: {enemy.pv_actuels}/{enemy.pv_max}", 750, 290, 'small', WHITE)
-        self.renderer.draw_text(f"Attaque: {enemy.attaque}", 750, 320, 'small', WHITE)
+        self.renderer.draw_glyph_text(f"PV: {enemy.pv_actuels}/{enemy.pv_max}", 750, 290, 'small', WHITE)
+        self.renderer.draw_glyph_text(f"Attaque: {enemy.attaque}", 750, 320, 'small', WHITE)
         
         # Bouton d'attaque avec style dynamique
         button_color = GREEN
@@ -467,21 +502,46 @@ class OptimizedRoguelike:
             button_color = RED
         
         attack_button = self.renderer.draw_button(
-            SCREEN_WIDTH // 2 - 100, 420, 200, 50, "ATTAQUER", button_color
+            SCREEN_WIDTH // 2 - 210, 420, 200, 50, "ATTAQUER", button_color
         )
-        if len(self.buttons) == 0:
-            self.buttons.append((attack_button, "attack"))
-        else:
-            self.buttons[0] = (attack_button, "attack")
-        
-        # Instructions pour easter eggs
-        self.renderer.draw_text("💡 Astuce: Essayez des combinaisons de touches!", 50, 500, 'small', GRAY)
+        x, y, width, height, _, _, action = BOUTON_TURBO
+        self.buttons[:] = [(attack_button, "attack"), (pygame.Rect(x, y, width, height), action)]
         
         # Log de combat
         self.draw_combat_log()
     
+    def draw_combat_layer(self) -> None:
+        """Dessine la couche statique de l'écran de combat"""
+        enemy = self.current_room.ennemi
+        
+        # Informations de difficulté
+        diff_info = DIFFICULTES[self.game_service.get_difficulty()]
+        self.renderer.draw_text(f"Difficulté: {diff_info['nom']}", 50, 20, 'small', diff_info['couleur'])
+        
+        # Titre de la salle
+        self.renderer.draw_text(f"=== {self.current_room.nom} ===", 50, 120, 'large', YELLOW)
+        self.renderer.draw_icon(20, 120, "sword", 30, YELLOW)
+        self.renderer.draw_icon(400, 120, "sword", 30, YELLOW)
+        
+        # Joueur et ennemi
+        self.renderer.draw_icon(50, 220, "shield", 30, WHITE)
+        self.renderer.draw_text("Héros", 100, 220, 'medium', WHITE)
+        self.renderer.draw_icon(850, 220, "skull", 30, WHITE)
+        self.renderer.draw_text(enemy.nom, 900, 220, 'medium', WHITE)
+        
+        # Bouton turbo, de couleur fixe
+        self.draw_buttons([BOUTON_TURBO])
+        
+        # Instructions pour easter eggs
+        self.renderer.draw_text("💡 Astuce: Essayez des combinaisons de touches!", 50, 500, 'small', GRAY)
+    
     def render_special_room(self) -> None:
         """Rend une salle spéciale"""
+        self.renderer.draw_layer(GameState.SPECIAL_ROOM, self.current_room, self.draw_special_room_layer)
+        self.set_buttons(BOUTONS_SALLE_SPECIALE)
+    
+    def draw_special_room_layer(self) -> None:
+        """Dessine la couche statique d'une salle spéciale"""
         # Titre de la salle
         self.renderer.draw_text(f"=== {self.current_room.nom} ===", SCREEN_WIDTH // 2, 200, 'large', YELLOW, center=True)
         
@@ -506,128 +566,119 @@ class OptimizedRoguelike:
         self.renderer.draw_text(message, SCREEN_WIDTH // 2, 350, 'medium', WHITE, center=True)
         
         # Bouton continuer
-        continue_button = self.renderer.draw_button(
-            SCREEN_WIDTH // 2 - 150, 450, 300, 50, "CONTINUER L'AVENTURE", GREEN
-        )
-        if len(self.buttons) == 0:
-            self.buttons.append((continue_button, "continue"))
-        else:
-            self.buttons[0] = (continue_button, "continue")
+        self.draw_buttons(BOUTONS_SALLE_SPECIALE)
     
     def render_transition(self) -> None:
         """Rend l'écran de transition"""
         player = self.game_service.get_player()
-        
-        # Titre
-        self.renderer.draw_text("VICTOIRE!", SCREEN_WIDTH // 2, 150, 'large', GREEN, center=True)
-        self.renderer.draw_icon(SCREEN_WIDTH // 2 - 100, 150, "crown", 40, GREEN)
-        self.renderer.draw_icon(SCREEN_WIDTH // 2 + 60, 150, "crown", 40, GREEN)
+        self.renderer.draw_layer(GameState.TRANSITION, self.transition_victory, self.draw_transition_layer)
         
         # Statistiques
-        stats_y = 250
         stats = [
-            (f"PV: {player.pv_actuels}/{player.pv_max}", "heart"),
-            (f"Attaque: {player.attaque}", "sword"),
-            (f"Ennemis tués: {player.ennemis_tues}", "skull"),
-            (f"Boss vaincus: {player.boss_vaincus}", "crown")
+            f"PV: {player.pv_actuels}/{player.pv_max}",
+            f"Attaque: {player.attaque}",
+            f"Ennemis tués: {player.ennemis_tues}",
+            f"Boss vaincus: {player.boss_vaincus}"
         ]
+        for i, stat in enumerate(stats):
+            self.renderer.draw_glyph_text(stat, SCREEN_WIDTH // 2 - 170, 250 + i * 30, 'small', WHITE)
+        
+        self.set_buttons(BOUTONS_TRANSITION)
+    
+    def draw_transition_layer(self) -> None:
+        """Dessine la couche statique de l'écran de transition"""
+        # Titre
+        if self.transition_victory:
+            self.renderer.draw_text("VICTOIRE!", SCREEN_WIDTH // 2, 150, 'large', GREEN, center=True)
+            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 100, 150, "crown", 40, GREEN)
+            self.renderer.draw_icon(SCREEN_WIDTH // 2 + 60, 150, "crown", 40, GREEN)
+        else:
+            self.renderer.draw_text("DÉFAITE!", SCREEN_WIDTH // 2, 150, 'large', RED, center=True)
+            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 100, 150, "skull", 40, RED)
+            self.renderer.draw_icon(SCREEN_WIDTH // 2 + 60, 150, "skull", 40, RED)
         
-        for i, (stat, icon_type) in enumerate(stats):
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 200, stats_y + i * 30, icon_type, 20, WHITE)
-            self.renderer.draw_text(stat, SCREEN_WIDTH // 2 - 170, stats_y + i * 30, 'small', WHITE)
+        # Icônes des statistiques
+        for i, icon_type in enumerate(("heart", "sword", "skull", "crown")):
+            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 200, 250 + i * 30, icon_type, 20, WHITE)
         
         # Bouton continuer
-        continue_button = self.renderer.draw_button(
-            SCREEN_WIDTH // 2 - 100, 450, 200, 50, "CONTINUER", GREEN
-        )
-        if len(self.buttons) == 0:
-            self.buttons.append((continue_button, "continue"))
-        else:
-            self.buttons[0] = (continue_button, "continue")
+        self.draw_buttons(BOUTONS_TRANSITION)
     
     def render_game_over(self) -> None:
         """Rend l'écran de fin de partie"""
         player = self.game_service.get_player()
+        self.renderer.draw_layer(GameState.GAME_OVER, None, self.draw_game_over_layer)
         
+        # Statistiques finales
+        stats = [
+            f"Ennemis tués: {player.ennemis_tues}",
+            f"Boss vaincus: {player.boss_vaincus}",
+            f"Salles traversées: {self.game_service.get_salle_actuelle()}",
+            f"Score final: {player.score}"
+        ]
+        for i, stat in enumerate(stats):
+            self.renderer.draw_text(stat, SCREEN_WIDTH // 2 - 160, 200 + i * 50, 'medium', WHITE)
+        
+        self.set_buttons(BOUTONS_GAME_OVER)
+    
+    def draw_game_over_layer(self) -> None:
+        """Dessine la couche statique de l'écran de fin de partie"""
         # Titre
         self.renderer.draw_text("GAME OVER", SCREEN_WIDTH // 2, 100, 'large', RED, center=True)
         self.renderer.draw_icon(SCREEN_WIDTH // 2 - 100, 100, "skull", 40, RED)
         self.renderer.draw_icon(SCREEN_WIDTH // 2 + 60, 100, "skull", 40, RED)
         
-        # Statistiques finales
-        stats_y = 200
-        stats = [
-            (f"Ennemis tués: {player.ennemis_tues}", "skull"),
-            (f"Boss vaincus: {player.boss_vaincus}", "crown"),
-            (f"Salles traversées: {self.game_service._salle_actuelle}", "castle"),
-            (f"Score final: {player.score}", "crown")
-        ]
-        
-        for i, (stat, icon_type) in enumerate(stats):
-            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 200, stats_y + i * 50, icon_type, 30, WHITE)
-            self.renderer.draw_text(stat, SCREEN_WIDTH // 2 - 160, stats_y + i * 50, 'medium', WHITE)
+        # Icônes des statistiques
+        for i, icon_type in enumerate(("skull", "crown", "castle", "crown")):
+            self.renderer.draw_icon(SCREEN_WIDTH // 2 - 200, 200 + i * 50, icon_type, 30, WHITE)
         
         # Boutons
-        replay_button = self.renderer.draw_button(
-            SCREEN_WIDTH // 2 - 150, 450, 140, 50, "REJOUER", GREEN
-        )
-        menu_button = self.renderer.draw_button(
-            SCREEN_WIDTH // 2 + 10, 450, 140, 50, "MENU", BLUE
-        )
-        
-        if len(self.buttons) < 2:
-            self.buttons.append((replay_button, "replay"))
-            self.buttons.append((menu_button, "menu"))
-        else:
-            self.buttons[0] = (replay_button, "replay")
-            self.buttons[1] = (menu_button, "menu")
+        self.draw_buttons(BOUTONS_GAME_OVER)
+    
+    def is_animating(self) -> bool:
+        """Indique si l'écran change sans événement (effets, particules, mini-jeu)"""
+        return (self.effect_manager.is_animating() or len(self.renderer.particles) > 0
+                or self.mini_game.active)
     
     def run(self) -> None:
         """Boucle principale du jeu avec effets amusants"""
         running = True
         
         while running:
-            dt = self.clock.tick(FPS)
+            dt, events = self.scheduler.tick(self.is_animating())
             
             # Gestion des événements
-            running = self.handle_events()
+            running = self.handle_events(events)
             
             # Mise à jour des systèmes
             self.renderer.update_particles()
-            self.effect_manager.update()
+            self.effect_manager.update(dt)
             
             # Mise à jour de la difficulté dynamique seulement si le jeu est initialisé
             if hasattr(self.game_service, '_player') and self.game_service._player is not None:
                 self.dynamic_difficulty.update_performance(self.game_service.get_player(), self.game_service)
             
-            # Rendu avec tremblement d'écran
-            self.screen.fill(BLACK)
-            
-            # Offset pour le tremblement d'écran
-            offset_x, offset_y = self.effect_manager.get_screen_offset()
-            
-            # Rendu selon l'état
-            if self.state == GameState.MENU:
-                self.render_menu()
-            elif self.state == GameState.COMBAT:
-                self.render_combat()
-            elif self.state == GameState.SPECIAL_ROOM:
-                self.render_special_room()
-            elif self.state == GameState.TRANSITION:
-                self.render_transition()
-            elif self.state == GameState.GAME_OVER:
-                self.render_game_over()
-            elif self.state == GameState.VICTORY:
-                self.render_game_over()
-            
-            # Effets visuels
-            self.effect_manager.draw(self.screen)
+            # Rendu selon l'état, enregistré puis repeint région par région
+            self.renderer.begin_frame()
+            self.render_state()
             
-            # Particules du renderer
-            self.renderer.draw_particles()
+            # Les particules salissent leur zone, les effets plein écran tout l'écran
+            regions = self.renderer.end_frame([self.effect_manager.get_particles_rect()],
+                                              self.effect_manager.needs_full_redraw())
+            if regions:
+                # Effets visuels
+                self.effect_manager.draw(self.screen)
+                
+                # Particules du renderer
+                self.renderer.draw_particles()
             
-            pygame.display.flip()
+            # Tremblement d'écran: le tampon est recopié décalé, sans redessiner la scène
+            regions = self.back_buffer.present(regions, self.renderer.full_frame,
+                                               self.effect_manager.get_screen_offset())
+            if regions:
+                pygame.display.update(regions)
         
+        self.sauvegarder_enregistrement()
         pygame.quit()
         sys.exit()
 
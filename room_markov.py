@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Analyse par chaîne de Markov des séquences de salles de RoomGenerator
+Distribution exacte des types de salles, et espérance du score et de la
+survie par difficulté, sans simuler une seule partie
+"""
+
+import argparse
+import json
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+import config
+from combat_solver import VICTOIRE, TOURS, _pv_finaux, _tables
+from entities import Boss, Enemy
+
+TYPES_SALLES = ('ennemi', 'boss', 'soin', 'amelioration', 'powerup')
+TYPES_SPECIAUX = ('soin', 'amelioration', 'powerup')
+
+# Après une salle spéciale, RoomGenerator force un combat
+APRES_SPECIALE = {'ennemi': 0.7, 'boss': 0.3}
+
+# Valeurs de PowerUpRoom: une potion sur deux, bonus de score fixe
+POWERUP_ATTAQUE = (5, 15)
+POWERUP_SOIN = (20, 40)
+SCORE_POWERUP = 200
+
+def lois_salles(probabilites: Dict[str, float]) -> np.ndarray:
+    """Loi du type de la salle suivante selon l'état (0: normal, 1: après une spéciale)
+
+    Reproduit generer_salle: les probabilités sont cumulées dans l'ordre
+    du dictionnaire, le reste éventuel donne une salle d'ennemi.
+    """
+    inconnus = set(probabilites) - set(TYPES_SALLES)
+    if inconnus:
+        raise ValueError(f"Types de salles inconnus: {', '.join(sorted(inconnus))}")
+    if any(p < 0 for p in probabilites.values()):
+        raise ValueError("Les probabilités doivent être positives")
+
+    lois = np.zeros((2, len(TYPES_SALLES)))
+    cumul = 0.0
+    for type_salle, proba in probabilites.items():
+        masse = min(cumul + proba, 1.0) - min(cumul, 1.0)
+        lois[0, TYPES_SALLES.index(type_salle)] += masse
+        cumul += proba
+    lois[0, TYPES_SALLES.index('ennemi')] += max(0.0, 1.0 - cumul)
+
+    for type_salle, proba in APRES_SPECIALE.items():
+        lois[1, TYPES_SALLES.index(type_salle)] = proba
+    return lois
+
+@lru_cache(maxsize=64)
+def _matrice_soin(pv_max: int, minimum: int, maximum: int) -> np.ndarray:
+    """Transition des PV pour un soin uniforme entre minimum et maximum"""
+    matrice = np.zeros((pv_max + 1, pv_max + 1))
+    pv = np.arange(1, pv_max + 1)
+    for soin in range(minimum, maximum + 1):
+        matrice[pv, np.minimum(pv_max, pv + soin)] += 1 / (maximum - minimum + 1)
+    matrice.setflags(write=False)
+    return matrice
+
+def _noyaux_combat(attaque: float, attaque_ennemi: int, pv_max: int,
+                   pv_ennemi: int) -> List[Tuple[float, np.ndarray, np.ndarray, np.ndarray]]:
+    """Noyaux (poids, PV finaux, victoire, ripostes) pour une attaque moyenne
+
+    L'attaque moyenne n'est pas entière: on pondère les noyaux exacts des
+    deux attaques entières voisines.
+    """
+    bas = max(1, int(attaque))
+    poids = min(1.0, max(0.0, attaque - bas))
+    noyaux = []
+    for a, w in ((bas, 1 - poids), (bas + 1, poids)):
+        if w == 0:
+            continue
+        tables = _tables(a, attaque_ennemi, pv_max, pv_ennemi)
+        victoire = tables[VICTOIRE, :, pv_ennemi]
+        noyaux.append((w, _pv_finaux(a, attaque_ennemi, pv_max, pv_ennemi),
+                       victoire, tables[TOURS, :, pv_ennemi] - victoire))
+    return noyaux
+
+class ModeleSalles:
+    """Chaîne de Markov à deux états de RoomGenerator (dernière salle spéciale ou non)"""
+
+    def __init__(self, probabilites: Optional[Dict[str, float]] = None):
+        self._probabilites = dict(probabilites if probabilites is not None else config.PROBABILITES_SALLES)
+        self._lois = lois_salles(self._probabilites)
+        speciale = np.array([t in TYPES_SPECIAUX for t in TYPES_SALLES])
+        # transition[état, état suivant]
+        self._transition = np.stack([1 - self._lois[:, speciale].sum(axis=1),
+                                     self._lois[:, speciale].sum(axis=1)], axis=1)
+
+    @property
+    def lois(self) -> np.ndarray:
+        return self._lois
+
+    @property
+    def transition(self) -> np.ndarray:
+        return self._transition
+
+    def distribution_types(self, salles_max: int) -> np.ndarray:
+        """Probabilité de chaque type (colonnes TYPES_SALLES) pour chaque salle"""
+        etat = np.array([1.0, 0.0])
+        distribution = np.zeros((salles_max, len(TYPES_SALLES)))
+        for salle in range(salles_max):
+            distribution[salle] = etat @ self._lois
+            etat = etat @ self._transition
+        return distribution
+
+    def distribution_nombre(self, salles_max: int, types: Iterable[str]) -> np.ndarray:
+        """Loi exacte du nombre de salles des types donnés parmi salles_max salles"""
+        colonnes = [TYPES_SALLES.index(t) for t in types]
+        # loi[état, nombre]
+        loi = np.zeros((2, salles_max + 1))
+        loi[0, 0] = 1.0
+        for _ in range(salles_max):
+            suivante = np.zeros_like(loi)
+            for etat in (0, 1):
+                for type_salle, proba in enumerate(self._lois[etat]):
+                    if proba == 0:
+                        continue
+                    etat_suivant = int(TYPES_SALLES[type_salle] in TYPES_SPECIAUX)
+                    if type_salle in colonnes:
+                        suivante[etat_suivant, 1:] += proba * loi[etat, :-1]
+                    else:
+                        suivante[etat_suivant] += proba * loi[etat]
+            loi = suivante
+        return loi.sum(axis=0)
+
+    def distribution_boss(self, salles_max: int) -> np.ndarray:
+        """Loi du nombre de boss rencontrés (si le joueur survit jusqu'au bout)"""
+        return self.distribution_nombre(salles_max, ('boss',))
+
+    def distribution_speciales(self, salles_max: int) -> np.ndarray:
+        """Loi du nombre de salles spéciales rencontrées"""
+        return self.distribution_nombre(salles_max, TYPES_SPECIAUX)
+
+    def evaluer(self, difficulty: int, salles_max: Optional[int] = None) -> Dict[str, float]:
+        """Espérance du score et probabilité de survie pour une difficulté
+
+        La loi des PV du joueur est propagée exactement salle par salle; son
+        attaque est remplacée par sa moyenne (champ moyen), ce qui néglige la
+        corrélation entre améliorations et PV restants.
+        """
+        if salles_max is None:
+            salles_max = config.DIFFICULTES[difficulty]["salles"]
+        pv_max = config.JOUEUR_PV_MAX
+        adversaires = {'ennemi': (Enemy.stats(difficulty), config.SCORE_ENNEMI),
+                       'boss': (Boss.stats(difficulty), config.SCORE_BOSS)}
+        soin_salle = int(pv_max * config.POURCENTAGE_SOIN)
+        bonus_amelioration = (config.BONUS_ATTAQUE_MIN + config.BONUS_ATTAQUE_MAX) / 2
+        bonus_powerup = sum(POWERUP_ATTAQUE) / 2
+        soin_fixe = _matrice_soin(pv_max, soin_salle, soin_salle)
+        soin_powerup = _matrice_soin(pv_max, *POWERUP_SOIN)
+
+        # pv[état, PV] = probabilité d'être vivant avec ces PV; attaque = masse x attaque
+        pv = np.zeros((2, pv_max + 1))
+        pv[0, pv_max] = 1.0
+        attaque = np.array([float(config.JOUEUR_ATTAQUE), 0.0])
+        esperances = {'score': 0.0, 'ennemi': 0.0, 'boss': 0.0, 'salles': 0.0}
+
+        for _ in range(salles_max):
+            pv_suivants = np.zeros_like(pv)
+            attaque_suivante = np.zeros(2)
+            for etat in (0, 1):
+                masse = pv[etat].sum()
+                if masse == 0:
+                    continue
+                attaque_moyenne = attaque[etat] / masse
+                for type_salle, proba in zip(TYPES_SALLES, self._lois[etat]):
+                    if proba == 0:
+                        continue
+                    entree = proba * pv[etat]
+                    etat_suivant = int(type_salle in TYPES_SPECIAUX)
+                    bonus = 0.0
+                    if type_salle in adversaires:
+                        (pv_ennemi, attaque_ennemi), score = adversaires[type_salle]
+                        sortie = np.zeros_like(entree)
+                        for poids, finaux, victoire, ripostes in _noyaux_combat(
+                                attaque_moyenne, attaque_ennemi, pv_max, pv_ennemi):
+                            sortie += poids * (entree @ finaux)
+                            esperances['score'] += poids * (entree @ (config.SCORE_SURVIE * ripostes
+                                                                      + score * victoire))
+                            esperances[type_salle] += poids * (entree @ victoire)
+                        sortie[0] = 0.0
+                    elif type_salle == 'soin':
+                        sortie = entree @ soin_fixe
+                    elif type_salle == 'amelioration':
+                        sortie = entree
+                        bonus = bonus_amelioration
+                    else:
+                        sortie = 0.5 * entree + 0.5 * (entree @ soin_powerup)
+                        bonus = 0.5 * bonus_powerup
+                        esperances['score'] += SCORE_POWERUP * entree.sum()
+                    pv_suivants[etat_suivant] += sortie
+                    attaque_suivante[etat_suivant] += (attaque_moyenne + bonus) * sortie.sum()
+            pv, attaque = pv_suivants, attaque_suivante
+            esperances['salles'] += pv.sum()
+
+        return {
+            'probabilite_survie': float(pv.sum()),
+            'score_moyen': float(esperances['score']),
+            'ennemis_moyens': float(esperances['ennemi']),
+            'boss_moyens': float(esperances['boss']),
+            'salles_moyennes': float(esperances['salles']),
+            'boss_rencontres_moyens': float(self.distribution_types(salles_max)[:, TYPES_SALLES.index('boss')].sum())
+        }
+
+def analyser(probabilites: Optional[Dict[str, float]] = None) -> Dict[int, Dict[str, float]]:
+    """Évalue chaque difficulté (probabilités de config.py par défaut)"""
+    modele = ModeleSalles(probabilites)
+    return {difficulty: modele.evaluer(difficulty) for difficulty in config.DIFFICULTES}
+
+def _lire_probabilite(texte: str) -> Tuple[str, float]:
+    """Lit une probabilité 'type=valeur'"""
+    type_salle, _, valeur = texte.partition("=")
+    if type_salle not in TYPES_SALLES or not valeur:
+        raise argparse.ArgumentTypeError(f"Probabilité invalide: {texte} (types: {', '.join(TYPES_SALLES)})")
+    return type_salle, float(valeur)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Affiche l'analyse, éventuellement avec d'autres probabilités de salles"""
+    parser = argparse.ArgumentParser(description="Analyse par chaîne de Markov des salles")
+    parser.add_argument("-p", "--proba", action="append", type=_lire_probabilite, default=[],
+                        help="remplace une probabilité, ex. boss=0.1")
+    args = parser.parse_args(argv)
+
+    probabilites = dict(config.PROBABILITES_SALLES)
+    probabilites.update(dict(args.proba))
+    print(f"🎲 Probabilités: {json.dumps(probabilites)}")
+    print("=" * 60)
+    modele = ModeleSalles(probabilites)
+    for difficulty, info in config.DIFFICULTES.items():
+        resultat = modele.evaluer(difficulty)
+        boss = modele.distribution_boss(info["salles"])
+        print(f"{info['nom']} ({info['salles']} salles)")
+        print(f"  survie: {resultat['probabilite_survie']:.2%}  score moyen: {resultat['score_moyen']:.1f}")
+        print(f"  boss rencontrés: " + ", ".join(f"{n}: {p:.1%}" for n, p in enumerate(boss) if p >= 0.0005))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,13 +22,15 @@ def run_all_tests():
         from test_roguelike import (
             TestPersonnage, TestJoueur, TestEnnemi, TestBoss,
             TestPowerUp, TestSalle, TestScoreManager, 
-            TestGenerateurSalles, TestJeu, TestIntegration
+            TestGenerateurSalles, TestJeu, TestIntegration, TestGradientCache,
+            TestIconDrawer
         )
         
         original_tests = [
             TestPersonnage, TestJoueur, TestEnnemi, TestBoss,
             TestPowerUp, TestSalle, TestScoreManager, 
-            TestGenerateurSalles, TestJeu, TestIntegration
+            TestGenerateurSalles, TestJeu, TestIntegration, TestGradientCache,
+            TestIconDrawer
         ]
         
         for test_class in original_tests:
@@ -65,6 +67,149 @@ def run_all_tests():
     except ImportError as e:
         print(f"⚠ Impossible de charger les tests SOLID: {e}")
     
+    try:
+        # Tests de la simulation sans affichage
+        from test_simulation import (
+            TestHeadlessGameFactory, TestSimulation, TestParametresConfig, TestBalayage,
+            TestCalibration
+        )
+        
+        simulation_tests = [
+            TestHeadlessGameFactory, TestSimulation, TestParametresConfig, TestBalayage,
+            TestCalibration
+        ]
+        
+        for test_class in simulation_tests:
+            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+            test_suite.addTests(tests)
+        
+        print("✓ Tests de simulation chargés")
+        
+    except ImportError as e:
+        print(f"⚠ Impossible de charger les tests de simulation: {e}")
+    
+    try:
+        # Tests des moteurs d'analyse des combats
+        from test_combat import TestDuelVectorise, TestSolveurCombat, TestModeleSalles
+        
+        combat_tests = [TestDuelVectorise, TestSolveurCombat, TestModeleSalles]
+        
+        for test_class in combat_tests:
+            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+            test_suite.addTests(tests)
+        
+        print("✓ Tests d'analyse des combats chargés")
+        
+    except ImportError as e:
+        print(f"⚠ Impossible de charger les tests d'analyse des combats: {e}")
+    
+    try:
+        # Tests des flux aléatoires
+        from test_rng import TestRNGService, TestReserveAleatoire, TestReproductibilite
+        
+        rng_tests = [TestRNGService, TestReserveAleatoire, TestReproductibilite]
+        
+        for test_class in rng_tests:
+            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+            test_suite.addTests(tests)
+        
+        print("✓ Tests des flux aléatoires chargés")
+        
+    except ImportError as e:
+        print(f"⚠ Impossible de charger les tests des flux aléatoires: {e}")
+    
+    try:
+        # Tests du moteur de particules
+        from test_particles import TestParticlePool, TestFondu, TestEmetteurs, TestMeteo
+        
+        particles_tests = [TestParticlePool, TestFondu, TestEmetteurs, TestMeteo]
+        
+        for test_class in particles_tests:
+            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+            test_suite.addTests(tests)
+        
+        print("✓ Tests du moteur de particules chargés")
+        
+    except ImportError as e:
+        print(f"⚠ Impossible de charger les tests du moteur de particules: {e}")
+    
+    try:
+        # Tests du registre des ressources
+        from test_resources import TestResourceRegistry
+        
+        resources_tests = [TestResourceRegistry]
+        
+        for test_class in resources_tests:
+            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+            test_suite.addTests(tests)
+        
+        print("✓ Tests du registre des ressources chargés")
+        
+    except ImportError as e:
+        print(f"⚠ Impossible de charger les tests du registre des ressources: {e}")
+    
+    try:
+        # Tests du cadencement des images
+        from test_scheduler import TestFrameScheduler, TestActivite
+        
+        scheduler_tests = [TestFrameScheduler, TestActivite]
+        
+        for test_class in scheduler_tests:
+            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+            test_suite.addTests(tests)
+        
+        print("✓ Tests du cadencement des images chargés")
+        
+    except ImportError as e:
+        print(f"⚠ Impossible de charger les tests du cadencement des images: {e}")
+    
+    try:
+        # Tests de l'enregistrement et de la relecture
+        from test_replay import TestEnregistrement, TestRelecture
+        
+        replay_tests = [TestEnregistrement, TestRelecture]
+        
+        for test_class in replay_tests:
+            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+            test_suite.addTests(tests)
+        
+        print("✓ Tests de relecture chargés")
+        
+    except ImportError as e:
+        print(f"⚠ Impossible de charger les tests de relecture: {e}")
+    
+    try:
+        # Tests de l'environnement des agents
+        from test_agent_env import TestRoguelikeEnv, TestBatchRoguelikeEnv
+        
+        agent_tests = [TestRoguelikeEnv, TestBatchRoguelikeEnv]
+        
+        for test_class in agent_tests:
+            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+            test_suite.addTests(tests)
+        
+        print("✓ Tests de l'environnement des agents chargés")
+        
+    except ImportError as e:
+        print(f"⚠ Impossible de charger les tests de l'environnement des agents: {e}")
+    
+    try:
+        # Tests du rendu optimisé
+        from test_renderer import (TestRegionsModifiees, TestCouchesStatiques, TestIconAtlas, TestTextCache,
+                                   TestGlyphCache, TestBoutonsPreRendus, TestPostProcess, TestBackBuffer)
+        
+        renderer_tests = [TestRegionsModifiees, TestCouchesStatiques, TestIconAtlas, TestTextCache, TestGlyphCache,
+                          TestBoutonsPreRendus, TestPostProcess, TestBackBuffer]
+        
+        for test_class in renderer_tests:
+            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+            test_suite.addTests(tests)
+        
+        print("✓ Tests du rendu chargés")
+        
+    except ImportError as e:
+        print(f"⚠ Impossible de charger les tests du rendu: {e}")
+    
     # Exécuter les tests
     print("\n" + "="*60)
     print("EXÉCUTION DES TESTS UNITAIRES")
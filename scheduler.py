@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Cadencement des images du jeu Roguelike
+Pleine cadence tant que l'écran s'anime, attente des événements sinon
+"""
+
+from typing import Any, List, Optional, Tuple
+
+import pygame
+from config import *
+
+# Images encore rendues à pleine cadence après la fin des animations,
+# le temps d'afficher leur état final
+IMAGES_DE_GRACE = 2
+
+# Réveil périodique au repos (ms), même sans événement
+REVEIL_REPOS = 1000
+
+class FrameScheduler:
+    """Cadence de la boucle principale selon l'activité de l'écran
+
+    Tant qu'une animation, une particule ou un effet est en cours, tick
+    attend l'image suivante à fps images par seconde. Une fois l'écran
+    immobile, tick bloque sur pygame.event.wait jusqu'au prochain événement
+    ou au réveil périodique: un jeu laissé en arrière-plan ne consomme
+    presque plus de processeur. Dès que quelque chose s'anime de nouveau, la
+    pleine cadence reprend à l'image suivante.
+    """
+
+    def __init__(self, fps: int = FPS, idle_wake: int = REVEIL_REPOS, grace: int = IMAGES_DE_GRACE,
+                 clock: Optional[Any] = None):
+        self.fps = fps
+        self.idle_wake = idle_wake
+        self.grace = grace
+        self.clock = clock if clock is not None else pygame.time.Clock()
+        self.idle = False
+        self.idle_wakes = 0
+        self._images_calmes = 0
+
+    def tick(self, animating: bool) -> Tuple[int, Optional[List[pygame.event.Event]]]:
+        """Attend l'image suivante
+
+        Retourne dt en ms et, après une attente au repos, les événements
+        reçus (retirés de la file); None quand la boucle lit elle-même la
+        file. Le temps passé à attendre n'est pas du temps d'animation: dt
+        est alors borné à une image.
+        """
+        self._images_calmes = 0 if animating else self._images_calmes + 1
+        self.idle = self._images_calmes > self.grace
+        if not self.idle:
+            return self.clock.tick(self.fps), None
+
+        self.idle_wakes += 1
+        event = pygame.event.wait(self.idle_wake)
+        events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+        return min(self.clock.tick(), 1000 // self.fps), events
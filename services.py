@@ -6,15 +6,19 @@ Respect des principes SOLID
 
 import json
 import os
-import random
 import pygame
 import math
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import config
+import resources
+import rng
 from interfaces import (
     IScoreManager, IRoomGenerator, ISoundManager, IGameService,
     IGameFactory, ICombatSystem, IGameRenderer, IPlayer, ICharacter, IRoom
 )
-from entities import Player, Enemy, Boss, EnemyRoom, BossRoom, HealingRoom, UpgradeRoom, PowerUpRoom
+from entities import (
+    Player, Enemy, Boss, EnemyRoom, BossRoom, HealingRoom, UpgradeRoom, PowerUpRoom, stats_calibrees
+)
 
 # =============================================================================
 # SINGLE RESPONSIBILITY PRINCIPLE (SRP)
@@ -80,22 +84,24 @@ class ScoreManager(IScoreManager):
 class RoomGenerator(IRoomGenerator):
     """Générateur de salles - SRP: Génère uniquement des salles"""
     
-    # Probabilités des types de salles
-    PROBABILITES = {
-        'ennemi': 0.5,
-        'boss': 0.2,
-        'soin': 0.1,
-        'amelioration': 0.1,
-        'powerup': 0.1
-    }
-    
-    def __init__(self, difficulty: int = 1):
+    def __init__(self, difficulty: int = 1, probabilites: Optional[Dict[str, float]] = None,
+                 aleatoire: Optional[Any] = None):
         self._difficulty = difficulty
         self._derniere_salle_speciale = False
+        # Flux des types de salles (indépendant des combats et du butin)
+        self._aleatoire = aleatoire if aleatoire is not None else rng.flux(rng.FLUX_SALLES)
+        # Probabilités des types de salles (table calibrée, puis config.PROBABILITES_SALLES)
+        if probabilites is None:
+            probabilites = stats_calibrees(difficulty, 'probabilites') or config.PROBABILITES_SALLES
+        self._probabilites = probabilites
+    
+    @property
+    def probabilites(self) -> Dict[str, float]:
+        return self._probabilites
     
     def generer_salle(self) -> IRoom:
         """Génère une salle aléatoire selon les probabilités"""
-        rand = random.random()
+        rand = self._aleatoire.random()
         cumul = 0
         
         # Si la dernière salle était spéciale, forcer un ennemi ou boss
@@ -108,7 +114,7 @@ class RoomGenerator(IRoomGenerator):
                 return BossRoom(self._difficulty)
         
         # Probabilités normales
-        for type_salle, proba in self.PROBABILITES.items():
+        for type_salle, proba in self._probabilites.items():
             cumul += proba
             if rand <= cumul:
                 if type_salle == 'ennemi':
@@ -151,17 +157,22 @@ class SoundManager(ISoundManager):
             self._initialized = False
     
     def _create_synthetic_sounds(self) -> None:
-        """Crée des sons synthétiques pour le jeu"""
+        """Crée des sons synthétiques pour le jeu, synthétisés une seule fois par processus"""
         if not self._initialized:
             return
         
+        tones = {
+            'attack': (440, 0.1, 'square'),
+            'defeat': (220, 0.5, 'sine'),
+            'heal': (660, 0.2, 'sine'),
+            'upgrade': (880, 0.15, 'square'),
+            'click': (800, 0.05, 'square')
+        }
         try:
-            self._sounds['attack'] = self._create_tone(440, 0.1, 'square')
-            self._sounds['victory'] = self._create_victory_melody()
-            self._sounds['defeat'] = self._create_tone(220, 0.5, 'sine')
-            self._sounds['heal'] = self._create_tone(660, 0.2, 'sine')
-            self._sounds['upgrade'] = self._create_tone(880, 0.15, 'square')
-            self._sounds['click'] = self._create_tone(800, 0.05, 'square')
+            for name, params in tones.items():
+                self._sounds[name] = resources.sound(('tone',) + params,
+                                                     lambda params=params: self._create_tone(*params), owner=self)
+            self._sounds['victory'] = resources.sound(('victory',), self._create_victory_melody, owner=self)
         except Exception:
             # Si la création des sons échoue, on continue sans sons
             pass
@@ -255,6 +266,33 @@ class SoundManager(ISoundManager):
                 except Exception:
                     pass  # Ignorer les erreurs de volume
 
+class NullSoundManager(ISoundManager):
+    """Gestionnaire de sons muet - SRP: Remplace l'audio en mode sans affichage"""
+    
+    def play_sound(self, sound_name: str) -> None:
+        """N'émet aucun son"""
+        pass
+    
+    def set_volume(self, volume: float) -> None:
+        """Ignore le volume"""
+        pass
+
+class NullScoreManager(IScoreManager):
+    """Gestionnaire de scores inactif - SRP: Aucun accès disque en simulation"""
+    
+    def ajouter_score(self, nom: str, score: int, salles: int, 
+                     ennemis: int, boss: int) -> bool:
+        """N'enregistre rien"""
+        return False
+    
+    def est_high_score(self, score: int) -> bool:
+        """Aucun score n'est conservé"""
+        return False
+    
+    def get_top_scores(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """Retourne une liste vide"""
+        return []
+
 # =============================================================================
 # DEPENDENCY INVERSION PRINCIPLE (DIP)
 # =============================================================================
@@ -286,6 +324,24 @@ class GameFactory(IGameFactory):
         """Crée un gestionnaire de sons"""
         return SoundManager()
 
+class HeadlessGameFactory(GameFactory):
+    """Factory sans affichage ni audio - DIP: Même jeu, services inactifs"""
+    
+    def __init__(self):
+        self._score_manager = NullScoreManager()
+        self._sound_manager = NullSoundManager()
+    
+    def create_score_manager(self) -> IScoreManager:
+        """Retourne le gestionnaire de scores inactif partagé"""
+        return self._score_manager
+    
+    def create_sound_manager(self) -> ISoundManager:
+        """Retourne le gestionnaire de sons muet partagé"""
+        return self._sound_manager
+
+# Tour résolu: (dégâts du joueur, dégâts de la riposte, PV joueur, PV ennemi)
+TourCombat = Tuple[int, int, int, int]
+
 class CombatSystem(ICombatSystem):
     """Système de combat - SRP: Gère uniquement le combat"""
     
@@ -304,6 +360,25 @@ class CombatSystem(ICombatSystem):
     def is_combat_over(self, player: IPlayer, enemy: ICharacter) -> bool:
         """Vérifie si le combat est terminé"""
         return not player.est_vivant() or not enemy.est_vivant()
+    
+    def resoudre_combat(self, player: IPlayer, enemy: ICharacter,
+                        tours_max: Optional[int] = None) -> List[TourCombat]:
+        """Résout plusieurs tours (tout le combat par défaut) en un appel
+        
+        Mêmes règles qu'un tour joué: le joueur frappe, l'ennemi riposte
+        s'il survit et chaque riposte rapporte un tour de survie. La
+        riposte vaut 0 quand l'ennemi meurt. La victoire reste à créditer
+        par l'appelant, qui connaît le type de salle.
+        """
+        tours: List[TourCombat] = []
+        while (tours_max is None or len(tours) < tours_max) and self.start_combat(player, enemy):
+            degats = player.attaquer(enemy)
+            riposte = 0
+            if enemy.est_vivant():
+                riposte = enemy.attaquer(player)
+                player.survivre_tour()
+            tours.append((degats, riposte, player.pv_actuels, enemy.pv_actuels))
+        return tours
 
 class GameService(IGameService):
     """Service principal du jeu - DIP: Dépend des abstractions"""
@@ -330,12 +405,8 @@ class GameService(IGameService):
         self._combat_system = CombatSystem()
         
         # Définir le nombre de salles selon la difficulté
-        if difficulty == 1:
-            self._salles_max = 5
-        elif difficulty == 2:
-            self._salles_max = 7
-        elif difficulty == 3:
-            self._salles_max = 10
+        if difficulty in config.DIFFICULTES:
+            self._salles_max = config.DIFFICULTES[difficulty]["salles"]
         
         self._salle_actuelle = 0
         self._current_room = None
@@ -354,6 +425,24 @@ class GameService(IGameService):
             raise RuntimeError("Jeu non initialisé")
         return self._player
     
+    def get_combat_system(self) -> ICombatSystem:
+        """Retourne le système de combat"""
+        if self._combat_system is None:
+            raise RuntimeError("Jeu non initialisé")
+        return self._combat_system
+    
+    def get_salle_actuelle(self) -> int:
+        """Retourne le numéro de la salle actuelle (salles générées depuis le début)"""
+        return self._salle_actuelle
+    
+    def get_difficulty(self) -> int:
+        """Retourne le niveau de difficulté de la partie"""
+        return self._difficulty
+    
+    def is_started(self) -> bool:
+        """Indique si une partie a été démarrée"""
+        return self._player is not None
+    
     def generate_next_room(self) -> IRoom:
         """Génère la prochaine salle"""
         if self._room_generator is None:
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Moteur de simulation sans affichage du jeu Roguelike
+Joue des parties complètes via GameService, sans fenêtre, son ni polices
+"""
+
+import argparse
+import contextlib
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import config
+import rng
+from config import DIFFICULTES
+from entities import BossRoom, CombatRoom
+from interfaces import IPlayer, IRoom
+from services import GameService, HeadlessGameFactory
+
+# Actions disponibles pour une politique (mêmes noms que les boutons du jeu)
+ACTION_ATTAQUER = "attack"
+ACTION_CONTINUER = "continue"
+ACTION_QUITTER = "quit"
+
+# Largeur des tranches de l'histogramme des scores
+TRANCHE_SCORE = 250
+
+Politique = Callable[[IPlayer, IRoom], str]
+
+def politique_attaque(player: IPlayer, room: IRoom) -> str:
+    """Politique par défaut: attaque en combat, continue dans les salles spéciales"""
+    if isinstance(room, CombatRoom):
+        return ACTION_ATTAQUER
+    return ACTION_CONTINUER
+
+# Politique qui attaque toujours en combat: jouer_partie résout ses combats d'un
+# seul tenant. Conservé par functools.wraps, qui recopie les attributs
+politique_attaque.combat_automatique = True
+
+POLITIQUES: Dict[str, Politique] = {
+    "attaque": politique_attaque
+}
+
+def jouer_partie(game_service: GameService, difficulty: int,
+                 policy: Politique = politique_attaque) -> Dict[str, Any]:
+    """Joue une partie complète et retourne son résultat
+
+    Reproduit les règles de OptimizedRoguelike: le joueur frappe en premier,
+    l'ennemi riposte s'il survit et chaque riposte rapporte un tour de survie.
+    """
+    game_service.start_game(difficulty)
+    player = game_service.get_player()
+    combat = game_service.get_combat_system()
+    abandon = False
+
+    while not abandon and not game_service.is_game_over():
+        room = game_service.generate_next_room()
+
+        if isinstance(room, CombatRoom):
+            enemy = room.ennemi
+            if getattr(policy, 'combat_automatique', False):
+                # Politique sans décision en combat: résolution d'un seul tenant
+                combat.resoudre_combat(player, enemy)
+            while not combat.is_combat_over(player, enemy):
+                action = policy(player, room)
+                if action == ACTION_QUITTER:
+                    abandon = True
+                    break
+                if action != ACTION_ATTAQUER:
+                    raise ValueError(f"Action invalide en combat: {action}")
+
+                combat.player_attack(player, enemy)
+                if not enemy.est_vivant():
+                    break
+                combat.enemy_attack(enemy, player)
+                player.survivre_tour()
+
+            if not enemy.est_vivant():
+                if isinstance(room, BossRoom):
+                    player.vaincre_boss()
+                else:
+                    player.tuer_ennemi()
+        else:
+            room.entrer(player)
+            action = policy(player, room)
+            if action == ACTION_QUITTER:
+                abandon = True
+            elif action != ACTION_CONTINUER:
+                raise ValueError(f"Action invalide en salle spéciale: {action}")
+
+    salles = game_service.get_salle_actuelle()
+    if not player.est_vivant() or abandon:
+        salles -= 1
+
+    return {
+        'victoire': game_service.is_victory() and not abandon,
+        'score': player.score,
+        'salles': salles,
+        'ennemis': player.ennemis_tues,
+        'boss': player.boss_vaincus
+    }
+
+def _agreger(resultats: List[Dict[str, Any]], difficulty: int, duree: float) -> Dict[str, Any]:
+    """Agrège les résultats individuels en statistiques"""
+    n = len(resultats)
+    scores = sorted(r['score'] for r in resultats)
+    salles = [r['salles'] for r in resultats]
+    victoires = sum(1 for r in resultats if r['victoire'])
+    quartiles = statistics.quantiles(scores, n=4) if n > 1 else [scores[0]] * 3
+
+    distribution = Counter((s // TRANCHE_SCORE) * TRANCHE_SCORE for s in scores)
+
+    return {
+        'difficulte': difficulty,
+        'parties': n,
+        'victoires': victoires,
+        'taux_victoire': victoires / n,
+        'score': {
+            'moyenne': statistics.fmean(scores),
+            'ecart_type': statistics.pstdev(scores),
+            'min': scores[0],
+            'max': scores[-1],
+            'quartiles': quartiles
+        },
+        'distribution_scores': dict(sorted(distribution.items())),
+        'salles_traversees': {
+            'moyenne': statistics.fmean(salles),
+            'distribution': dict(sorted(Counter(salles).items()))
+        },
+        'ennemis_moyens': statistics.fmean(r['ennemis'] for r in resultats),
+        'boss_moyens': statistics.fmean(r['boss'] for r in resultats),
+        'duree': duree,
+        'parties_par_seconde': n / duree if duree > 0 else float('inf')
+    }
+
+@contextlib.contextmanager
+def parametres_config(**valeurs: Any) -> Iterator[None]:
+    """Remplace temporairement des constantes de config.py
+
+    Les entités et services lisent config à chaque partie, ce qui permet
+    de simuler d'autres réglages sans modifier le fichier.
+    """
+    inconnus = [nom for nom in valeurs if not hasattr(config, nom)]
+    if inconnus:
+        raise ValueError(f"Paramètres inconnus dans config.py: {', '.join(inconnus)}")
+
+    anciennes = {nom: getattr(config, nom) for nom in valeurs}
+    try:
+        for nom, valeur in valeurs.items():
+            setattr(config, nom, valeur)
+        yield
+    finally:
+        for nom, valeur in anciennes.items():
+            setattr(config, nom, valeur)
+
+def simuler_parties(n_runs: int, difficulty: int = 1, policy: Politique = politique_attaque,
+                    seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Simule n_runs parties complètes et retourne le résultat de chacune"""
+    if n_runs <= 0:
+        raise ValueError("Le nombre de parties doit être positif")
+    if difficulty not in config.DIFFICULTES:
+        raise ValueError(f"Difficulté inconnue: {difficulty}")
+
+    if seed is not None:
+        # Tous les flux (jeu et cosmétiques) repartent de la graine
+        rng.seed(seed)
+
+    game_service = GameService(HeadlessGameFactory())
+
+    # Les salles affichent leurs messages avec print: on les rend muettes
+    with contextlib.redirect_stdout(None):
+        return [jouer_partie(game_service, difficulty, policy) for _ in range(n_runs)]
+
+def simulate(n_runs: int, difficulty: int = 1, policy: Politique = politique_attaque,
+             seed: Optional[int] = None) -> Dict[str, Any]:
+    """Simule n_runs parties complètes et retourne les statistiques agrégées"""
+    debut = time.perf_counter()
+    resultats = simuler_parties(n_runs, difficulty, policy, seed)
+    duree = time.perf_counter() - debut
+
+    return _agreger(resultats, difficulty, duree)
+
+def afficher_rapport(stats: Dict[str, Any]) -> None:
+    """Affiche un rapport lisible des statistiques"""
+    nom = DIFFICULTES[stats['difficulte']]['nom']
+    score = stats['score']
+    print(f"\n📊 {nom} - {stats['parties']} parties")
+    print("=" * 50)
+    print(f"Taux de victoire: {stats['taux_victoire']:.1%} ({stats['victoires']} victoires)")
+    print(f"Score: moyenne {score['moyenne']:.1f} ± {score['ecart_type']:.1f} "
+          f"(min {score['min']}, max {score['max']})")
+    print(f"Quartiles: {', '.join(f'{q:.0f}' for q in score['quartiles'])}")
+    print(f"Salles traversées: moyenne {stats['salles_traversees']['moyenne']:.2f}")
+    for salles, nombre in stats['salles_traversees']['distribution'].items():
+        print(f"  {salles:2d} salles: {nombre / stats['parties']:.1%}")
+    print(f"Vitesse: {stats['parties_par_seconde']:.0f} parties/s ({stats['duree']:.2f}s)")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(description="Simulation sans affichage du Roguelike")
+    parser.add_argument("-n", "--parties", type=int, default=10000,
+                        help="nombre de parties par difficulté")
+    parser.add_argument("-d", "--difficulte", type=int, choices=sorted(DIFFICULTES),
+                        help="difficulté (toutes par défaut)")
+    parser.add_argument("-p", "--politique", choices=sorted(POLITIQUES), default="attaque",
+                        help="politique de jeu")
+    parser.add_argument("-s", "--seed", type=int, help="graine aléatoire")
+    args = parser.parse_args(argv)
+
+    difficultes = [args.difficulte] if args.difficulte else sorted(DIFFICULTES)
+    for difficulty in difficultes:
+        stats = simulate(args.parties, difficulty, POLITIQUES[args.politique], args.seed)
+        afficher_rapport(stats)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour l'environnement des agents
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import rng
+from agent_env import (
+    RoguelikeEnv, ACTION_AVANCER, ACTION_QUITTER, TAILLE_OBSERVATION,
+    OBS_PV, OBS_PV_MAX, OBS_PV_ENNEMI, OBS_TYPE_SALLE, OBS_COMBO, OBS_SALLE
+)
+from batch_env import BatchRoguelikeEnv
+from simulation import simuler_parties
+
+class TestRoguelikeEnv(unittest.TestCase):
+    """Tests pour l'API reset/step"""
+
+    def setUp(self):
+        """Environnement en difficulté normale"""
+        self.env = RoguelikeEnv(1)
+
+    def tearDown(self):
+        """Rend au service partagé une graine aléatoire"""
+        rng.seed()
+
+    def _jouer(self, seed=None):
+        """Joue une partie en avançant toujours, retourne les transitions"""
+        observation, _ = self.env.reset(seed)
+        # Une première salle de power-up rapporte son score avant le premier pas
+        transitions = [(observation, self.env.game_service.get_player().score, False, False, {})]
+        termine = False
+        while not termine:
+            transition = self.env.step(ACTION_AVANCER)
+            transitions.append(transition)
+            termine = transition[2]
+        return transitions
+
+    def test_observation(self):
+        """Test du format de l'observation initiale"""
+        observation, info = self.env.reset(1)
+        self.assertEqual(observation.shape, (TAILLE_OBSERVATION,))
+        self.assertEqual(observation.dtype, np.int32)
+        self.assertEqual(observation[OBS_PV], observation[OBS_PV_MAX])
+        self.assertEqual(observation[OBS_SALLE], 1)
+        self.assertEqual(observation[OBS_COMBO], 0)
+        self.assertIn(observation[OBS_TYPE_SALLE], range(5))
+        self.assertEqual(info, {})
+
+    def test_partie_complete(self):
+        """Test que les récompenses somment au score et que le combo suit les frappes"""
+        transitions = self._jouer(7)
+        observation, _, termine, tronque, info = transitions[-1]
+
+        self.assertTrue(termine)
+        self.assertFalse(tronque)
+        self.assertIn('victoire', info)
+        self.assertEqual(sum(t[1] for t in transitions), self.env.game_service.get_player().score)
+        for avant, apres in zip(transitions, transitions[1:]):
+            if apres[0][OBS_SALLE] == avant[0][OBS_SALLE] and avant[0][OBS_PV_ENNEMI] > 0:
+                self.assertEqual(apres[0][OBS_COMBO], avant[0][OBS_COMBO] + 1)
+
+        with self.assertRaises(RuntimeError):
+            self.env.step(ACTION_AVANCER)
+
+    def test_reproductible(self):
+        """Test qu'une même graine rejoue la même partie"""
+        premiere = self._jouer(42)
+        seconde = self._jouer(42)
+        self.assertEqual(len(premiere), len(seconde))
+        for a, b in zip(premiere, seconde):
+            np.testing.assert_array_equal(a[0], b[0])
+            self.assertEqual(a[1], b[1])
+
+    def test_memes_regles_que_la_simulation(self):
+        """Test que l'environnement rejoue exactement les parties de la simulation"""
+        attendus = simuler_parties(30, 1, seed=11)
+        self.env.reset(11)
+        obtenus = []
+        while len(obtenus) < 30:
+            _, _, termine, _, info = self.env.step(ACTION_AVANCER)
+            if termine:
+                player = self.env.game_service.get_player()
+                obtenus.append((info['victoire'], player.score))
+                self.env.reset()
+        self.assertEqual(obtenus, [(r['victoire'], r['score']) for r in attendus])
+
+    def test_quitter(self):
+        """Test de l'abandon et des actions invalides"""
+        self.env.reset(3)
+        with self.assertRaises(ValueError):
+            self.env.step(5)
+        _, recompense, termine, tronque, info = self.env.step(ACTION_QUITTER)
+        self.assertEqual(recompense, 0)
+        self.assertTrue(termine and tronque)
+        self.assertFalse(info['victoire'])
+
+        with self.assertRaises(ValueError):
+            RoguelikeEnv(9)
+
+class TestBatchRoguelikeEnv(unittest.TestCase):
+    """Tests pour l'environnement vectorisé"""
+
+    def _premieres_parties(self, env):
+        """Joue jusqu'à ce que chaque partie du lot ait fini sa première partie"""
+        env.reset()
+        faites = np.zeros(env.n, dtype=bool)
+        victoires = np.zeros(env.n, dtype=bool)
+        while not faites.all():
+            info = env.step()[4]
+            if info:
+                nouvelles = ~faites[info['indices']]
+                victoires[info['indices'][nouvelles]] = info['victoire'][nouvelles]
+                faites[info['indices']] = True
+        return victoires
+
+    def test_observations(self):
+        """Test du format et des bornes de l'état observé"""
+        env = BatchRoguelikeEnv(256, 2, seed=1)
+        observations = env.reset()
+        self.assertEqual(observations.shape, (256, TAILLE_OBSERVATION))
+        self.assertTrue(np.all(observations[:, OBS_SALLE] == 1))
+        for _ in range(50):
+            observations, recompenses, termines, tronques, _ = env.step()
+            self.assertTrue(np.all((observations[:, OBS_PV] > 0) & (observations[:, OBS_PV] <= 100)))
+            self.assertTrue(np.all(observations[:, OBS_PV_ENNEMI] >= 0))
+            self.assertTrue(np.all(observations[:, OBS_TYPE_SALLE] < 5))
+            self.assertFalse(tronques.any())
+            self.assertTrue(np.all(recompenses >= 0))
+
+    def test_recompenses_et_score(self):
+        """Test que les récompenses d'une partie somment à son score final"""
+        env = BatchRoguelikeEnv(512, 1, seed=2)
+        env.reset()
+        cumul = env.score.copy()
+        parties = 0
+        for _ in range(100):
+            _, recompenses, termines, _, info = env.step()
+            cumul += recompenses
+            if info:
+                np.testing.assert_array_equal(cumul[info['indices']], info['score'])
+                self.assertTrue(termines[info['indices']].all())
+                parties += info['indices'].size
+                cumul[info['indices']] = env.score[info['indices']]
+        self.assertGreater(parties, 512)
+
+    def test_memes_lois_que_la_simulation(self):
+        """Test que le taux de victoire suit celui de la simulation"""
+        victoires = self._premieres_parties(BatchRoguelikeEnv(6000, 1, seed=3))
+        attendu = np.mean([r['victoire'] for r in simuler_parties(6000, 1, seed=3)])
+        self.assertAlmostEqual(victoires.mean(), attendu, delta=0.04)
+
+    def test_probabilites(self):
+        """Test de probabilités de salles personnalisées"""
+        env = BatchRoguelikeEnv(500, 1, probabilites={'ennemi': 1.0}, seed=4)
+        env.reset()
+        for _ in range(30):
+            observations = env.step()[0]
+            self.assertTrue(np.all(observations[:, OBS_TYPE_SALLE] == 0))
+
+    def test_quitter_et_graine(self):
+        """Test de l'abandon et de la reproductibilité"""
+        env = BatchRoguelikeEnv(8, 1)
+        premieres = env.reset(seed=5).copy()
+        np.testing.assert_array_equal(env.reset(seed=5), premieres)
+
+        actions = np.array([ACTION_QUITTER] + [ACTION_AVANCER] * 7)
+        _, _, termines, tronques, info = env.step(actions)
+        self.assertTrue(termines[0] and tronques[0])
+        self.assertFalse(info['victoire'][0])
+        self.assertEqual(info['salles'][0], 0)
+        with self.assertRaises(ValueError):
+            env.step(np.full(8, 7))
+        with self.assertRaises(ValueError):
+            BatchRoguelikeEnv(0)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour les moteurs d'analyse des combats
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fractions import Fraction
+from functools import lru_cache
+
+import numpy as np
+from entities import Boss, Enemy, Player
+from duel import creer_generateur, simuler_duels, simuler_duels_objets, taux_victoire_difficultes
+from combat_solver import (
+    _tables, resoudre_combat, resoudre_contre, tables_combat, analyser_difficultes,
+    distribution_pv_finaux
+)
+from room_markov import ModeleSalles, lois_salles, TYPES_SALLES, TYPES_SPECIAUX
+from simulation import simulate
+
+class TestDuelVectorise(unittest.TestCase):
+    """Tests pour le simulateur de duels vectorisé"""
+
+    def test_victoire_immediate(self):
+        """Test qu'un coup suffit contre un ennemi à 1 PV"""
+        duels = simuler_duels(50, 100, 20, 1, 10)
+
+        self.assertTrue(duels['victoire'].all())
+        self.assertTrue((duels['tours'] == 1).all())
+        self.assertTrue((duels['pv_joueur'] == 100).all())
+        self.assertTrue((duels['pv_ennemi'] == 0).all())
+
+    def test_defaite_immediate(self):
+        """Test que le joueur meurt à la première riposte"""
+        duels = simuler_duels(50, 1, 1, 1000, 25)
+
+        self.assertFalse(duels['victoire'].any())
+        self.assertTrue((duels['tours'] == 1).all())
+        self.assertTrue((duels['pv_joueur'] == 0).all())
+        self.assertTrue((duels['pv_ennemi'] == 999).all())
+
+    def test_parametres_tableaux(self):
+        """Test que chaque duel peut avoir ses propres stats"""
+        pv_ennemis = np.array([1, 1000])
+        duels = simuler_duels(2, 1, 20, pv_ennemis, np.array([5, 25]))
+
+        self.assertEqual(duels['victoire'].tolist(), [True, False])
+
+    def test_duels_longs_et_blocs(self):
+        """Test des duels longs, des coups énormes et d'un nombre de duels sur plusieurs blocs"""
+        # Dégâts fixes de 1: le joueur gagne au tour 3000 avec 5000 - 2999 PV
+        duels = simuler_duels(3, 5000, 1, 3000, 1)
+        self.assertTrue(duels['victoire'].all())
+        self.assertEqual(duels['tours'].tolist(), [3000] * 3)
+        self.assertEqual(duels['pv_joueur'].tolist(), [2001] * 3)
+
+        # Sentinelles au plus près des PV réels: retrait des duels finis à chaque tour
+        duels = simuler_duels(1000, 16000, 16000, 16000, 16000, creer_generateur(4))
+        self.assertTrue(((duels['pv_joueur'] == 0) | (duels['pv_ennemi'] == 0)).all())
+        self.assertTrue((duels['pv_joueur'] >= 0).all() and (duels['pv_ennemi'] >= 0).all())
+
+        # Chaque duel d'un tableau plus grand qu'un bloc garde ses propres stats
+        n = 200000
+        pv_ennemis = np.where(np.arange(n) % 2 == 0, 1, 1000)
+        duels = simuler_duels(n, 1, 20, pv_ennemis, 25, creer_generateur(5))
+        self.assertEqual(duels['victoire'].tolist(), (np.arange(n) % 2 == 0).tolist())
+
+    def test_reproductible(self):
+        """Test qu'une même graine donne les mêmes duels"""
+        duels1 = simuler_duels(1000, 100, 20, 80, 25, creer_generateur(3))
+        duels2 = simuler_duels(1000, 100, 20, 80, 25, creer_generateur(3))
+
+        self.assertTrue((duels1['tours'] == duels2['tours']).all())
+        self.assertTrue((duels1['pv_joueur'] == duels2['pv_joueur']).all())
+
+    def test_meme_semantique_que_character(self):
+        """Test que le taux de victoire correspond à la boucle sur des Character"""
+        pv, attaque = Boss.stats(1)
+        vectorise = simuler_duels(20000, 100, 20, pv, attaque, creer_generateur(1))
+        objets = simuler_duels_objets(4000, 100, 20, pv, attaque) / 4000
+
+        self.assertAlmostEqual(vectorise['victoire'].mean(), objets, delta=0.04)
+
+    def test_taux_par_difficulte(self):
+        """Test des taux de victoire par difficulté"""
+        taux = taux_victoire_difficultes(2000, creer_generateur(5))
+
+        self.assertEqual(sorted(taux), [1, 2, 3])
+        self.assertGreaterEqual(taux[1]['ennemi'], taux[1]['boss'])
+        self.assertGreaterEqual(taux[1]['boss'], taux[3]['boss'])
+
+class TestSolveurCombat(unittest.TestCase):
+    """Tests pour le solveur exact des combats"""
+
+    def _reference(self, attaque_joueur: int, attaque_ennemi: int):
+        """Récursion exacte en fractions, sans sommes cumulées"""
+        @lru_cache(maxsize=None)
+        def issue(pv_joueur, pv_ennemi):
+            victoire = tours = pv = Fraction(0)
+            for degats in range(1, attaque_joueur + 1):
+                if degats >= pv_ennemi:
+                    victoire += Fraction(1, attaque_joueur)
+                    pv += Fraction(pv_joueur, attaque_joueur)
+                    continue
+                for riposte in range(1, attaque_ennemi + 1):
+                    if riposte < pv_joueur:
+                        poids = Fraction(1, attaque_joueur * attaque_ennemi)
+                        suite = issue(pv_joueur - riposte, pv_ennemi - degats)
+                        victoire += poids * suite[0]
+                        tours += poids * suite[1]
+                        pv += poids * suite[2]
+            return victoire, 1 + tours, pv
+        return issue
+
+    def test_exact_contre_recursion(self):
+        """Test que le solveur correspond à la récursion exacte"""
+        reference = self._reference(3, 4)
+        for pv_joueur, pv_ennemi in [(1, 1), (5, 7), (10, 3), (12, 12)]:
+            issue = resoudre_combat(pv_joueur, 3, pv_ennemi, 4, 12, 12)
+            victoire, tours, pv = reference(pv_joueur, pv_ennemi)
+            self.assertAlmostEqual(issue['probabilite_victoire'], float(victoire), places=12)
+            self.assertAlmostEqual(issue['tours_moyens'], float(tours), places=12)
+            self.assertAlmostEqual(issue['pv_restants_moyens'], float(pv), places=12)
+
+    def test_accord_avec_simulation(self):
+        """Test que le solveur correspond au simulateur vectorisé"""
+        pv, attaque = Boss.stats(1)
+        issue = resoudre_combat(100, 20, pv, attaque)
+        duels = simuler_duels(200000, 100, 20, pv, attaque, creer_generateur(2))
+
+        self.assertAlmostEqual(issue['probabilite_victoire'], duels['victoire'].mean(), delta=0.01)
+        self.assertAlmostEqual(issue['tours_moyens'], duels['tours'].mean(), delta=0.05)
+
+    def test_memoisation(self):
+        """Test que les requêtes d'un même matchup réutilisent les tables"""
+        pv, attaque = Enemy.stats(2)
+        resoudre_combat(100, 20, pv, attaque, 100, pv)
+        avant = _tables.cache_info()
+        resoudre_combat(42, 20, pv, attaque, 100, pv)
+        apres = _tables.cache_info()
+
+        self.assertEqual(apres.hits, avant.hits + 1)
+        self.assertEqual(apres.misses, avant.misses)
+
+    def test_resoudre_contre(self):
+        """Test de l'analyse entre deux personnages"""
+        joueur = Player()
+        ennemi = Enemy(1)
+        issue = resoudre_contre(joueur, ennemi)
+
+        self.assertGreater(issue['probabilite_victoire'], 0.99)
+        self.assertLessEqual(issue['pv_restants_moyens'], joueur.pv_max)
+
+    def test_tables_lecture_seule(self):
+        """Test que les tables partagées ne sont pas modifiables"""
+        tables = tables_combat(20, 15, 100, 30)
+        with self.assertRaises(ValueError):
+            tables['probabilite_victoire'][1, 1] = 0.0
+
+    def test_parametres_invalides(self):
+        """Test des paramètres hors bornes"""
+        with self.assertRaises(ValueError):
+            resoudre_combat(0, 20, 30, 15)
+        with self.assertRaises(ValueError):
+            resoudre_combat(120, 20, 30, 15, 100)
+        with self.assertRaises(ValueError):
+            resoudre_combat(100, 0, 30, 15)
+        with self.assertRaises(ValueError):
+            resoudre_combat(100, 20, 30, 0)
+
+    def test_pv_finaux(self):
+        """Test que la loi des PV finaux redonne victoire et PV restants"""
+        pv, attaque = Boss.stats(1)
+        finaux = distribution_pv_finaux(20, attaque, 100, pv)
+        tables = tables_combat(20, attaque, 100, pv)
+
+        np.testing.assert_allclose(finaux.sum(axis=1), 1.0)
+        np.testing.assert_allclose(finaux[1:, 1:].sum(axis=1), tables['probabilite_victoire'][1:, pv])
+        np.testing.assert_allclose(finaux[1:] @ np.arange(101), tables['pv_restants_moyens'][1:, pv])
+
+    def test_analyse_difficultes(self):
+        """Test de l'analyse par difficulté"""
+        analyse = analyser_difficultes()
+        self.assertGreater(analyse[1]['boss']['probabilite_victoire'],
+                           analyse[2]['boss']['probabilite_victoire'])
+
+class TestModeleSalles(unittest.TestCase):
+    """Tests pour l'analyse par chaîne de Markov des salles"""
+
+    def test_lois(self):
+        """Test des lois de la salle suivante"""
+        lois = lois_salles({'boss': 0.2, 'soin': 0.1})
+
+        np.testing.assert_allclose(lois.sum(axis=1), 1.0)
+        self.assertAlmostEqual(lois[0, TYPES_SALLES.index('ennemi')], 0.7)
+        self.assertAlmostEqual(lois[1, TYPES_SALLES.index('boss')], 0.3)
+        with self.assertRaises(ValueError):
+            lois_salles({'tresor': 0.5})
+
+    def test_nombre_exact(self):
+        """Test de la loi du nombre de boss contre une énumération des séquences"""
+        modele = ModeleSalles()
+        attendu = np.zeros(5)
+
+        def parcourir(salles, etat, boss, proba):
+            if salles == 0:
+                attendu[boss] += proba
+                return
+            for type_salle, p in zip(TYPES_SALLES, modele.lois[etat]):
+                if p > 0:
+                    parcourir(salles - 1, int(type_salle in TYPES_SPECIAUX),
+                              boss + (type_salle == 'boss'), proba * p)
+
+        parcourir(4, 0, 0, 1.0)
+        np.testing.assert_allclose(modele.distribution_boss(4), attendu)
+        self.assertAlmostEqual(modele.distribution_speciales(7).sum(), 1.0)
+
+    def test_distribution_types(self):
+        """Test que la première salle suit les probabilités de config"""
+        modele = ModeleSalles()
+        types = modele.distribution_types(5)
+
+        np.testing.assert_allclose(types.sum(axis=1), 1.0)
+        self.assertAlmostEqual(types[0, TYPES_SALLES.index('boss')], 0.2)
+        self.assertGreater(types[1, TYPES_SALLES.index('boss')], 0.2)
+
+    def test_accord_avec_simulation(self):
+        """Test que l'espérance correspond aux parties simulées"""
+        evaluation = ModeleSalles().evaluer(1)
+        stats = simulate(5000, 1, seed=4)
+
+        self.assertAlmostEqual(evaluation['probabilite_survie'], stats['taux_victoire'], delta=0.03)
+        self.assertAlmostEqual(evaluation['score_moyen'], stats['score']['moyenne'], delta=20)
+        self.assertAlmostEqual(evaluation['salles_moyennes'],
+                               stats['salles_traversees']['moyenne'], delta=0.1)
+
+    def test_et_si(self):
+        """Test qu'une autre répartition des salles change l'espérance sans simulation"""
+        sans_boss = {'ennemi': 0.7, 'boss': 0.0, 'soin': 0.1, 'amelioration': 0.1, 'powerup': 0.1}
+        self.assertGreater(ModeleSalles(sans_boss).evaluer(1)['probabilite_survie'],
+                           ModeleSalles().evaluer(1)['probabilite_survie'])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires du moteur de particules
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+from config import *
+from effects import EffectManager, Weather
+from particles import FONDU_MAX, NIVEAUX_FONDU, ParticlePool
+
+class TestParticlePool(unittest.TestCase):
+    """Tests de la réserve de particules en colonnes"""
+
+    def test_emission_groupee(self):
+        """Test de l'émission d'un bloc de particules et de la capacité"""
+        pool = ParticlePool(capacity=100)
+        self.assertEqual(pool.emit(10, 20, np.zeros(60), np.ones(60), 5, 2, RED), 60)
+        self.assertEqual(pool.emit(0, 0, np.zeros(60), 0, 5), 40)
+        self.assertEqual(len(pool), 100)
+        self.assertEqual(pool.emit(0, 0, 1, 1, 5), 0)
+        self.assertEqual(pool.palette, [RED, WHITE])
+
+    def test_mouvement(self):
+        """Test que gravité et friction suivent le modèle d'une particule"""
+        pool = ParticlePool(gravity=0.1, friction=0.98)
+        pool.emit(0, 0, 3, -2, 10)
+        x, y, vx, vy = 0.0, 0.0, 3.0, -2.0
+        for _ in range(5):
+            pool.update()
+            x += vx
+            y += vy
+            vy += 0.1
+            vx *= 0.98
+            vy *= 0.98
+        self.assertAlmostEqual(float(pool.x[0]), x, places=4)
+        self.assertAlmostEqual(float(pool.y[0]), y, places=4)
+        self.assertEqual(float(pool.life[0]), 5)
+
+    def test_retrait_par_echange(self):
+        """Test que seules les particules mortes disparaissent"""
+        pool = ParticlePool()
+        vies = np.array([1, 5, 1, 5, 5, 1, 1, 5], np.float32)
+        pool.emit(np.arange(8), 0, 0, 0, vies)
+        pool.update()
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(sorted(pool.positions()[0].tolist()), [1, 3, 4, 7])
+        pool.update(4)
+        self.assertEqual(len(pool), 0)
+
+    def test_dessin_identique_a_pygame(self):
+        """Test que les disques et carrés reproduisent le tracé pygame"""
+        for shape in ("circle", "square"):
+            pool = ParticlePool()
+            direct = pygame.Surface((200, 40))
+            for i, size in enumerate(range(1, 6)):
+                x, y = 20 + i * 35 + 0.7, 20.4
+                pool.emit(x, y, 0, 0, 10, size, (40 * size, 255, 0))
+                if shape == "circle":
+                    pygame.draw.circle(direct, (40 * size, 255, 0), (int(x), int(y)), size)
+                else:
+                    pygame.draw.rect(direct, (40 * size, 255, 0), (int(x), int(y), size, size))
+            surface = pygame.Surface((200, 40))
+            pool.draw(surface, shape)
+            self.assertEqual(pygame.image.tobytes(direct, "RGB"), pygame.image.tobytes(surface, "RGB"), shape)
+
+    def test_taille_selon_la_vie(self):
+        """Test des carrés qui rétrécissent avec leur vie"""
+        pool = ParticlePool()
+        pool.emit(10, 10, 0, 0, 10, 3, WHITE)
+        pool.update(5)
+        surface = pygame.Surface((20, 20))
+        pool.draw(surface, "square", shrink=3)
+        surface.set_colorkey(BLACK)
+        self.assertEqual(surface.get_bounding_rect(), pygame.Rect(10, 10, 1, 1))
+
+    def test_decoupe(self):
+        """Test que les particules respectent la zone de découpe et les bords"""
+        xs = [-2, 5, 15, 24]
+        pool = ParticlePool()
+        pool.emit(np.array(xs), 10, 0, 0, 10, 3, WHITE)
+        surface = pygame.Surface((25, 20))
+        surface.set_clip(pygame.Rect(0, 0, 10, 20))
+        pool.draw(surface)
+        direct = pygame.Surface((25, 20))
+        direct.set_clip(pygame.Rect(0, 0, 10, 20))
+        for x in xs:
+            pygame.draw.circle(direct, WHITE, (x, 10), 3)
+        self.assertEqual(pygame.image.tobytes(direct, "RGB"), pygame.image.tobytes(surface, "RGB"))
+        self.assertEqual(surface.get_at((0, 10))[:3], WHITE)
+        self.assertEqual(surface.get_at((15, 10))[:3], BLACK)
+
+    def test_rectangle_englobant(self):
+        """Test du rectangle englobant et de sa marge"""
+        pool = ParticlePool()
+        self.assertIsNone(pool.bounds())
+        pool.emit(np.array([10.5, 50.2]), np.array([20.0, 30.9]), 0, 0, 10, 4)
+        self.assertEqual(pool.bounds(), pygame.Rect(5, 15, 51, 21))
+
+class TestFondu(unittest.TestCase):
+    """Tests des particules en fondu par rampes de sprites"""
+
+    def test_pleine_vie_identique_au_dessin_opaque(self):
+        """Test qu'une particule neuve est dessinée comme un disque opaque"""
+        pool = ParticlePool()
+        pool.emit(np.array([10.5, 30.2, 50.9]), 15, 0, 0, 20, np.array([2, 3, 5]), ORANGE)
+        opaque, fondu = pygame.Surface((70, 30)), pygame.Surface((70, 30))
+        pool.draw(opaque)
+        pool.draw(fondu, fade=True)
+        self.assertEqual(pygame.image.tobytes(opaque, "RGB"), pygame.image.tobytes(fondu, "RGB"))
+
+    def test_opacite_selon_la_vie(self):
+        """Test que l'opacité suit la vie restante"""
+        pool = ParticlePool()
+        pool.emit(10, 10, 0, 0, 32, 3, WHITE)
+        pool.update(16)
+        surface = pygame.Surface((20, 20))
+        pool.draw(surface, fade=True)
+        rouge = surface.get_at((10, 10))[0]
+        self.assertEqual(rouge, 255 * (NIVEAUX_FONDU // 2) // NIVEAUX_FONDU)
+
+    def test_rampes_pre_rendues(self):
+        """Test qu'une rampe est rendue une seule fois par couleur et taille"""
+        effets = EffectManager()
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        for _ in range(5):
+            effets.add_magic_effect(400, 300)
+            effets.update()
+            effets.draw(surface)
+        self.assertEqual(len(effets.particles._sprites), 3 * NIVEAUX_FONDU)
+
+    def test_au_dela_du_seuil(self):
+        """Test qu'au-delà du seuil les particules sont dessinées opaques"""
+        pool = ParticlePool()
+        pool.emit(np.full(FONDU_MAX + 1, 10), 10, 0, 0, 32, 3, WHITE)
+        pool.update(16)
+        surface = pygame.Surface((20, 20))
+        pool.draw(surface, fade=True)
+        self.assertEqual(surface.get_at((10, 10))[:3], WHITE)
+        self.assertEqual(len(pool._sprites), 0)
+
+class TestEmetteurs(unittest.TestCase):
+    """Tests des effets émis en bloc"""
+
+    def setUp(self):
+        self.effets = EffectManager()
+
+    def test_nombres_de_particules(self):
+        """Test que chaque effet émet son nombre de particules"""
+        self.effets.add_explosion(100, 100, ORANGE, 30)
+        self.effets.add_heal_effect(100, 100)
+        self.effets.add_damage_effect(100, 100)
+        self.effets.add_magic_effect(100, 100)
+        self.assertEqual(len(self.effets.particles), 30 + 15 + 10 + 25)
+
+    def test_intervalles(self):
+        """Test que vies, tailles et couleurs restent dans leurs intervalles"""
+        self.effets.add_explosion(100, 100, ORANGE, 500)
+        pool = self.effets.particles
+        vies, tailles = pool.life[:len(pool)], pool.size[:len(pool)]
+        self.assertGreaterEqual(vies.min(), 30)
+        self.assertLessEqual(vies.max(), 60)
+        self.assertEqual(set(tailles.tolist()), {2, 3, 4, 5})
+        vitesses = np.hypot(pool.vx[:len(pool)], pool.vy[:len(pool)])
+        self.assertTrue(((vitesses >= 2 - 1e-4) & (vitesses <= 8 + 1e-4)).all())
+
+        self.effets.particles.clear()
+        self.effets.add_magic_effect(100, 100)
+        couleurs = {pool.palette[i] for i in pool.color[:len(pool)]}
+        self.assertTrue(couleurs <= {PURPLE, BLUE, YELLOW})
+
+    def test_soin_remonte(self):
+        """Test que les particules de soin remontent en moyenne"""
+        for _ in range(10):
+            self.effets.add_heal_effect(100, 100)
+        self.assertLess(self.effets.particles.vy[:len(self.effets.particles)].mean(), -1)
+
+    def test_systeme_du_rendu_avance(self):
+        """Test des durées en ms du système de particules du rendu avancé"""
+        from roguelike_graphique_avance import ParticleSystem
+
+        systeme = ParticleSystem()
+        systeme.add_particles(100, 100, YELLOW, 2, 10, 1000)
+        systeme.update(500)
+        self.assertEqual(len(systeme), 10)
+        x, y = systeme.positions()
+        self.assertTrue((np.abs(x - 100) <= 2 * 500 * 0.1 + 1e-3).all())
+        surface = pygame.Surface((300, 300))
+        systeme.draw(surface)
+        surface.set_colorkey(BLACK)
+        self.assertGreater(surface.get_bounding_rect().width, 0)
+        systeme.update(500)
+        self.assertEqual(len(systeme), 0)
+
+class TestMeteo(unittest.TestCase):
+    """Tests de la météo vectorisée"""
+
+    def setUp(self):
+        self.effets = EffectManager()
+
+    def test_nombre_de_gouttes(self):
+        """Test que chaque météo remplit l'écran de son nombre de gouttes"""
+        for kind, (count, _, _, _, _) in Weather.TYPES.items():
+            self.effets.set_weather(kind)
+            self.assertEqual(len(self.effets.precipitation), count)
+        self.effets.set_weather("clear")
+        self.assertEqual(len(self.effets.precipitation), 0)
+        self.assertFalse(self.effets.needs_full_redraw())
+
+    def test_chute_et_renvoi(self):
+        """Test que les gouttes tombées repartent du haut de l'écran"""
+        for kind in Weather.TYPES:
+            self.effets.set_weather(kind)
+            meteo = self.effets.precipitation
+            for _ in range(300):
+                meteo.update()
+            self.assertTrue((meteo.y >= -Weather.MARGE).all() and (meteo.y <= SCREEN_HEIGHT).all(), kind)
+            self.assertTrue((meteo.x >= 0).all() and (meteo.x < SCREEN_WIDTH).all(), kind)
+
+    def test_dessin_identique_a_pygame(self):
+        """Test que les gouttes de pluie reproduisent le tracé pygame, bords compris"""
+        meteo = Weather(np.random.random, (200, 100))
+        meteo.set("rain")
+        meteo.x = np.array([10.5, 100.0, 199.0], np.float32)
+        meteo.y = np.array([20.0, -5.0, 95.0], np.float32)
+        attendu = pygame.Surface((200, 100))
+        for x, y in zip(meteo.x.astype(int).tolist(), meteo.y.astype(int).tolist()):
+            pygame.draw.line(attendu, BLUE, (x, y), (x, y + 10), 1)
+        surface = pygame.Surface((200, 100))
+        meteo.draw(surface)
+        self.assertEqual(pygame.image.tobytes(attendu, "RGB"), pygame.image.tobytes(surface, "RGB"))
+
+    def test_eclairs_d_orage(self):
+        """Test que l'orage déclenche des éclairs, et la pluie non"""
+        self.effets.set_weather("rain")
+        self.effets.update(10000)
+        self.assertNotIn("flash", self.effets.post.actifs)
+        self.effets.set_weather("storm")
+        self.effets.update(7000)
+        self.assertIn("flash", self.effets.post.actifs)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
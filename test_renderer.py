@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires du rendu optimisé
+"""
+
+import os
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from config import *
+from effects import EffectManager, PostProcess
+from renderer import BackBuffer, GlyphCache, IconAtlas, OptimizedRenderer, NullRenderer, TextCache, render_button_sprite
+
+class TestRegionsModifiees(unittest.TestCase):
+    """Tests du rendu par régions modifiées"""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.renderer = OptimizedRenderer(self.screen)
+
+    def dessiner_image(self, pv: int, damaged=(), full: bool = False):
+        """Dessine une image de combat simplifiée"""
+        self.renderer.begin_frame()
+        self.renderer.draw_text("Héros", 100, 220, 'medium', WHITE)
+        self.renderer.draw_icon(50, 220, "shield", 30, WHITE)
+        self.renderer.draw_health_bar(50, 260, 300, 20, pv, 100, GREEN)
+        self.renderer.draw_button(500, 420, 200, 50, "ATTAQUER", GREEN)
+        return self.renderer.end_frame(damaged, full)
+
+    def test_premiere_image_complete(self):
+        """Test que la première image est rendue entièrement"""
+        self.screen.fill(RED)
+        regions = self.dessiner_image(100)
+        self.assertTrue(self.renderer.full_frame)
+        self.assertEqual(regions, [self.screen.get_rect()])
+        self.assertEqual(self.screen.get_at((5, 5))[:3], BLACK)
+        self.assertEqual(self.screen.get_at((60, 270))[:3], GREEN)
+
+    def test_image_identique(self):
+        """Test qu'une image inchangée ne touche ni l'écran ni l'affichage"""
+        self.dessiner_image(100)
+        self.screen.set_at((60, 270), RED)
+        regions = self.dessiner_image(100)
+        self.assertEqual(regions, [])
+        self.assertFalse(self.renderer.full_frame)
+        self.assertEqual(self.screen.get_at((60, 270))[:3], RED)
+
+    def test_seule_la_barre_change(self):
+        """Test que seule la barre de vie modifiée est repeinte"""
+        self.dessiner_image(100)
+        self.screen.set_at((510, 430), RED)
+        regions = self.dessiner_image(40)
+        self.assertFalse(self.renderer.full_frame)
+        self.assertTrue(regions)
+        for region in regions:
+            self.assertEqual(region, pygame.Rect(50, 260, 300, 20))
+        # La barre est repeinte, le bouton n'est pas touché
+        self.assertEqual(self.screen.get_at((60, 270))[:3], GREEN)
+        self.assertEqual(self.screen.get_at((300, 270))[:3], DARK_GRAY)
+        self.assertEqual(self.screen.get_at((510, 430))[:3], RED)
+
+    def test_commande_disparue(self):
+        """Test qu'une commande disparue est effacée"""
+        self.dessiner_image(100)
+        self.renderer.begin_frame()
+        self.renderer.draw_text("Héros", 100, 220, 'medium', WHITE)
+        self.renderer.draw_icon(50, 220, "shield", 30, WHITE)
+        self.renderer.draw_health_bar(50, 260, 300, 20, 100, 100, GREEN)
+        regions = self.renderer.end_frame()
+        self.assertEqual(regions, [pygame.Rect(500, 420, 200, 50)])
+        self.assertEqual(self.screen.get_at((510, 430))[:3], BLACK)
+
+    def test_dessin_immediat_invalide(self):
+        """Test qu'un dessin hors image force un rendu complet"""
+        self.dessiner_image(100)
+        self.renderer.draw_text("Hors image", 600, 600)
+        self.dessiner_image(100)
+        self.assertTrue(self.renderer.full_frame)
+        self.dessiner_image(100)
+        self.assertFalse(self.renderer.full_frame)
+
+    def test_dommages_repeints_deux_fois(self):
+        """Test qu'une zone salie est repeinte à cette image et à la suivante"""
+        self.dessiner_image(100)
+        zone = pygame.Rect(800, 100, 20, 20)
+        self.assertEqual(self.dessiner_image(100, [zone, None]), [zone])
+        self.screen.fill(RED, zone)
+        self.assertEqual(self.dessiner_image(100), [zone])
+        self.assertEqual(self.screen.get_at(zone.center)[:3], BLACK)
+        self.assertEqual(self.dessiner_image(100), [])
+
+    def test_rendu_complet_demande(self):
+        """Test qu'un effet plein écran rend cette image et la suivante entièrement"""
+        self.dessiner_image(100)
+        self.dessiner_image(100, full=True)
+        self.assertTrue(self.renderer.full_frame)
+        self.dessiner_image(100)
+        self.assertTrue(self.renderer.full_frame)
+        self.assertEqual(self.dessiner_image(100), [])
+
+    def test_invalidate(self):
+        """Test que invalidate force un rendu complet"""
+        self.dessiner_image(100)
+        self.renderer.invalidate()
+        self.assertEqual(self.dessiner_image(100), [self.screen.get_rect()])
+
+    def test_zone_des_particules(self):
+        """Test des rectangles englobant les particules"""
+        effect_manager = EffectManager()
+        self.assertIsNone(effect_manager.get_particles_rect())
+        effect_manager.add_explosion(300, 300, RED, 20)
+        effect_manager.update()
+        zone = effect_manager.get_particles_rect()
+        for x, y in zip(*effect_manager.particles.positions()):
+            self.assertTrue(zone.collidepoint(int(x), int(y)))
+
+        self.renderer.add_particle(100, 100, RED, (1, 0))
+        self.assertTrue(self.renderer.particles_rect().contains(pygame.Rect(98, 98, 5, 5)))
+
+    def test_effets_plein_ecran(self):
+        """Test de la détection des effets plein écran"""
+        effect_manager = EffectManager()
+        self.assertFalse(effect_manager.needs_full_redraw())
+        effect_manager.add_flash(WHITE, 2)
+        self.assertTrue(effect_manager.needs_full_redraw())
+        effect_manager.update()
+        effect_manager.update()
+        self.assertFalse(effect_manager.needs_full_redraw())
+
+    def test_null_renderer(self):
+        """Test que le rendu inactif n'affiche aucune région"""
+        renderer = NullRenderer()
+        renderer.begin_frame()
+        renderer.draw_text("Score: 10", 50, 50)
+        self.assertEqual(renderer.end_frame(), [])
+
+class TestCouchesStatiques(unittest.TestCase):
+    """Tests des couches statiques par état"""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.renderer = OptimizedRenderer(self.screen)
+        self.constructions = 0
+
+    def construire(self):
+        """Contenu fixe de test"""
+        self.constructions += 1
+        self.renderer.draw_text("Titre", 100, 100, 'large', YELLOW)
+        self.renderer.draw_icon(50, 100, "crown", 40, YELLOW)
+
+    def dessiner_image(self, key):
+        self.renderer.begin_frame()
+        self.renderer.draw_layer("test", key, self.construire)
+        self.renderer.draw_text(f"Score: {key}", 50, 50, 'small', WHITE)
+        return self.renderer.end_frame()
+
+    def test_couche_construite_une_fois(self):
+        """Test que la couche n'est construite qu'une fois par clé"""
+        self.dessiner_image(1)
+        self.dessiner_image(1)
+        self.assertEqual(self.constructions, 1)
+        self.assertEqual(self.screen.get_at((70, 116))[:3], YELLOW)
+        # Construire la couche ne force pas de rendu complet
+        self.assertEqual(self.dessiner_image(1), [])
+
+        self.dessiner_image(2)
+        self.assertEqual(self.constructions, 2)
+        self.assertTrue(self.renderer.full_frame)
+        self.assertEqual(self.renderer.layers["test"][0], 2)
+
+    def test_sans_couches(self):
+        """Test que sans couches le contenu fixe est redessiné à chaque image"""
+        self.renderer.use_layers = False
+        self.dessiner_image(1)
+        self.dessiner_image(1)
+        self.assertEqual(self.constructions, 2)
+        self.assertFalse(self.renderer.layers)
+        self.assertEqual(self.screen.get_at((70, 116))[:3], YELLOW)
+
+    def test_rendu_identique_par_etat(self):
+        """Test que chaque écran du jeu est identique avec et sans couches"""
+        from benchmark_rendu import ETATS, mesurer_rendu, preparer_etat
+        from roguelike_optimized import OptimizedRoguelike
+
+        game = OptimizedRoguelike(seed=3)
+        game.enregistrement = None
+        game.game_service.start_game(1)
+        for state in ETATS:
+            images = []
+            for use_layers in (False, True):
+                game.renderer = OptimizedRenderer(game.screen, use_layers)
+                preparer_etat(game, state)
+                game.renderer.begin_frame()
+                game.render_state()
+                game.renderer.end_frame()
+                images.append(pygame.image.tobytes(game.screen, "RGB"))
+            self.assertEqual(images[0], images[1], state)
+            self.assertTrue(game.buttons)
+
+        resultats = mesurer_rendu(images=2, seed=3, etats=ETATS[:1])
+        self.assertEqual(set(resultats[ETATS[0]]), {"sans couches", "couches", "couches + régions"})
+
+class TestIconAtlas(unittest.TestCase):
+    """Tests de l'atlas d'icônes pré-rendues"""
+
+    TYPES = ("heart", "sword", "shield", "skull", "crown", "plus", "castle")
+
+    def test_identique_a_la_geometrie(self):
+        """Test que les icônes de l'atlas sont identiques au tracé direct"""
+        atlas = IconAtlas(OptimizedRenderer.draw_icon_geometry)
+        for icon_type in self.TYPES:
+            for size, color in ((20, WHITE), (40, YELLOW)):
+                direct = pygame.Surface((100, 100))
+                direct.fill(DARK_GRAY)
+                OptimizedRenderer.draw_icon_geometry(direct, icon_type, 30, 30, size, color)
+                copie = pygame.Surface((100, 100))
+                copie.fill(DARK_GRAY)
+                atlas.draw(copie, icon_type, 30, 30, size, color)
+                self.assertEqual(pygame.image.tobytes(direct, "RGB"), pygame.image.tobytes(copie, "RGB"),
+                                 (icon_type, size))
+
+    def test_rendu_paresseux(self):
+        """Test que chaque combinaison n'est rendue qu'une fois, à la première utilisation"""
+        appels = []
+        def geometrie(surface, icon_type, x, y, size, color):
+            appels.append(icon_type)
+            OptimizedRenderer.draw_icon_geometry(surface, icon_type, x, y, size, color)
+
+        atlas = IconAtlas(geometrie)
+        self.assertFalse(atlas.pages)
+        screen = pygame.Surface((100, 100))
+        for _ in range(3):
+            atlas.draw(screen, "heart", 10, 10, 20, RED)
+        self.assertEqual(appels, ["heart"])
+        atlas.prewarm([("heart", 20, RED), ("sword", 20, RED)])
+        self.assertEqual(appels, ["heart", "sword"])
+        self.assertEqual(len(atlas.pages), 1)
+
+        # Type inconnu: mémorisé, rien n'est dessiné
+        atlas.draw(screen, "dragon", 10, 10, 20, RED)
+        self.assertIsNone(atlas.entries[("dragon", 20, RED)])
+        atlas.clear()
+        self.assertFalse(atlas.entries)
+
+    def test_pages_et_etageres(self):
+        """Test du rangement des icônes sans chevauchement"""
+        atlas = IconAtlas(OptimizedRenderer.draw_icon_geometry, page_size=64)
+        atlas.prewarm((icon_type, 30, WHITE) for icon_type in self.TYPES)
+        self.assertGreater(len(atlas.pages), 1)
+        entrees = [entry for entry in atlas.entries.values() if entry is not None]
+        for i, (page, area, _) in enumerate(entrees):
+            self.assertTrue(page.get_rect().contains(area))
+            for autre_page, autre_area, _ in entrees[i + 1:]:
+                self.assertFalse(page is autre_page and area.colliderect(autre_area))
+
+    def test_supersample(self):
+        """Test que le suréchantillonnage produit des bords lissés"""
+        atlas = IconAtlas(OptimizedRenderer.draw_icon_geometry, supersample=4)
+        atlas.prewarm([("heart", 40, RED)])
+        page, area, _ = atlas.entries[("heart", 40, RED)]
+        alphas = {page.get_at((x, y))[3] for x in range(area.left, area.right)
+                  for y in range(area.top, area.bottom)}
+        self.assertTrue(any(0 < alpha < 255 for alpha in alphas))
+
+    def test_prechauffage_complet(self):
+        """Test que les icônes pré-rendues couvrent tous les écrans du jeu"""
+        from benchmark_rendu import ETATS, preparer_etat
+        from roguelike_optimized import OptimizedRoguelike
+
+        game = OptimizedRoguelike(seed=5)
+        game.enregistrement = None
+        game.game_service.start_game(1)
+        prerendues = len(game.renderer.icons.entries)
+        for state in ETATS:
+            preparer_etat(game, state)
+            game.renderer.begin_frame()
+            game.render_state()
+            game.renderer.end_frame()
+        self.assertEqual(len(game.renderer.icons.entries), prerendues)
+
+class TestTextCache(unittest.TestCase):
+    """Tests du cache LRU des surfaces de texte"""
+
+    def surface(self, width: int = 10):
+        return pygame.Surface((width, 10))
+
+    def test_compteurs(self):
+        """Test des succès et échecs du cache"""
+        cache = TextCache()
+        surface = cache.get(("a", 'small', WHITE), self.surface)
+        self.assertIs(cache.get(("a", 'small', WHITE), self.surface), surface)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (1, 1, 0))
+        self.assertEqual(cache.bytes, TextCache.surface_bytes(surface))
+        self.assertIn(("a", 'small', WHITE), cache)
+
+    def test_eviction_lru(self):
+        """Test que les surfaces les moins récemment utilisées sont évincées"""
+        taille = TextCache.surface_bytes(self.surface())
+        cache = TextCache(budget=3 * taille)
+        for cle in "abc":
+            cache.get((cle,), self.surface)
+        cache.get(("a",), self.surface)
+        cache.get(("d",), self.surface)
+        self.assertNotIn(("b",), cache)
+        self.assertIn(("a",), cache)
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.bytes, cache.budget)
+
+    def test_epinglage(self):
+        """Test que les libellés épinglés ne sont jamais évincés"""
+        taille = TextCache.surface_bytes(self.surface())
+        cache = TextCache(budget=2 * taille)
+        cache.get(("titre",), self.surface)
+        cache.pin(("titre",), self.surface)
+        for i in range(10):
+            cache.get((i,), self.surface)
+        self.assertIn(("titre",), cache)
+        self.assertEqual(cache.stats()['pinned'], 1)
+
+        cache.clear()
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.bytes, taille)
+        cache.unpin(("titre",))
+        cache.clear()
+        self.assertEqual((len(cache), cache.bytes), (0, 0))
+
+    def test_memoire_bornee(self):
+        """Test que des nombres toujours différents ne font pas grossir le cache"""
+        pygame.font.init()
+        renderer = OptimizedRenderer(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), text_budget=64 * 1024)
+        renderer.pin_text("Héros")
+        for score in range(2000):
+            renderer.draw_text(f"Score: {score}", 50, 50, 'small', WHITE)
+        stats = renderer.cache.stats()
+        self.assertLessEqual(stats['bytes'], stats['budget'])
+        self.assertGreater(stats['evictions'], 0)
+        self.assertEqual(stats['misses'], 2000)
+        self.assertIn(("Héros", 'medium', WHITE), renderer.cache)
+
+    def test_libelles_epingles_du_jeu(self):
+        """Test que le jeu épingle ses libellés fixes"""
+        from roguelike_optimized import OptimizedRoguelike, TEXTES_EPINGLES
+
+        game = OptimizedRoguelike(seed=7)
+        self.assertEqual(game.renderer.cache.stats()['pinned'], len(TEXTES_EPINGLES))
+        hits = game.renderer.cache.hits
+        game.renderer.begin_frame()
+        game.render_state()
+        game.renderer.end_frame()
+        self.assertGreater(game.renderer.cache.hits, hits)
+
+class TestGlyphCache(unittest.TestCase):
+    """Tests de la composition des textes numériques par glyphes"""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.font = pygame.font.Font(None, 24)
+        self.glyphs = GlyphCache()
+
+    def test_nombres_sans_rendu(self):
+        """Test qu'un nombre qui change ne coûte aucun rendu de police"""
+        screen = pygame.Surface((200, 40))
+        self.glyphs.draw(screen, self.font, WHITE, "PV: 100/100", 0, 0)
+        renders = self.glyphs.renders
+        for pv in range(100):
+            self.glyphs.draw(screen, self.font, WHITE, f"PV: {pv}/100", 0, 0)
+        self.assertEqual(self.glyphs.renders, renders)
+
+    def test_composition(self):
+        """Test que le texte composé occupe la place du texte rendu d'un bloc"""
+        screen = pygame.Surface((200, 40))
+        rect = self.glyphs.draw(screen, self.font, WHITE, "Score: 1234", 10, 5)
+        width, height = self.font.size("Score: 1234")
+        self.assertEqual(rect.topleft, (10, 5))
+        self.assertEqual(rect.height, height)
+        self.assertLessEqual(abs(rect.width - width), 3)
+        self.assertEqual(rect.size, self.glyphs.size(self.font, WHITE, "Score: 1234"))
+        # Les pixels dessinés restent dans le rectangle annoncé
+        screen.set_colorkey(BLACK)
+        self.assertTrue(rect.contains(screen.get_bounding_rect()))
+        self.assertGreater(screen.get_bounding_rect().width, 0)
+
+    def test_regions_du_texte_modifie(self):
+        """Test que seul le nombre modifié est repeint"""
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        renderer = OptimizedRenderer(screen)
+        for score in (10, 10, 15):
+            renderer.begin_frame()
+            renderer.draw_text("Héros", 100, 220, 'medium', WHITE)
+            renderer.draw_glyph_text(f"Score: {score}", 50, 50, 'small', WHITE)
+            regions = renderer.end_frame()
+        self.assertTrue(regions)
+        repeint = regions[0].unionall(regions)
+        self.assertEqual(repeint.topleft, (50, 50))
+        self.assertFalse(repeint.colliderect(pygame.Rect(100, 220, 50, 20)))
+        self.assertEqual(renderer.cache.misses, 1)
+
+    def test_barre_de_vie_animee(self):
+        """Test que la barre de vie animée ne rend plus de glyphes"""
+        from roguelike_graphique_avance import HealthBar
+
+        screen = pygame.Surface((300, 60))
+        bar = HealthBar(10, 10, 250, 25, 100)
+        bar.draw(screen)
+        renders = HealthBar.glyphs.renders
+        bar.update_health(20)
+        for _ in range(30):
+            bar.update(16)
+            bar.draw(screen)
+        self.assertLess(bar.current_health, 100)
+        self.assertEqual(HealthBar.glyphs.renders, renders)
+
+class TestBoutonsPreRendus(unittest.TestCase):
+    """Tests des boutons pré-rendus"""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def dessin_direct(self, screen, rect, text, color, font):
+        """Dessin d'un bouton tel qu'il était fait à chaque image"""
+        pygame.draw.rect(screen, color, rect)
+        pygame.draw.rect(screen, WHITE, rect, 2)
+        text_surface = font.render(text, True, WHITE)
+        screen.blit(text_surface, text_surface.get_rect(center=rect.center))
+
+    def test_identique_au_dessin_direct(self):
+        """Test que le sprite reproduit le dessin direct, libellé débordant compris"""
+        for width, text in ((200, "ATTAQUER"), (60, "CONTINUER L'AVENTURE")):
+            direct = pygame.Surface((400, 100))
+            renderer = OptimizedRenderer(pygame.Surface((400, 100)))
+            rect = pygame.Rect(150, 25, width, 50)
+            self.dessin_direct(direct, rect, text, GREEN, renderer.fonts['medium'])
+            renderer.draw_button(rect.x, rect.y, rect.width, rect.height, text, GREEN)
+            self.assertEqual(pygame.image.tobytes(direct, "RGB"),
+                             pygame.image.tobytes(renderer.screen, "RGB"), text)
+
+    def test_sprite_unique(self):
+        """Test qu'un bouton n'est rendu qu'une fois et qu'inchangé il n'est pas redessiné"""
+        renderer = OptimizedRenderer(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+        for _ in range(3):
+            renderer.begin_frame()
+            renderer.draw_button(500, 420, 200, 50, "ATTAQUER", GREEN)
+            regions = renderer.end_frame()
+        self.assertEqual(regions, [])
+        self.assertEqual(len(renderer.button_sprites), 1)
+
+    def test_rectangle_du_libelle_debordant(self):
+        """Test que la région d'un bouton couvre son libellé débordant"""
+        text_surface = pygame.Surface((120, 20))
+        sprite, offset = render_button_sprite((60, 50), GREEN, text_surface)
+        self.assertEqual(sprite.get_size(), (120, 50))
+        self.assertEqual(offset, (-30, 0))
+
+    def test_animation_de_survol(self):
+        """Test que l'animation de survol réutilise un nombre borné de sprites"""
+        from roguelike_graphique_avance import Button
+
+        screen = pygame.Surface((400, 200))
+        button = Button(100, 50, 200, 60, "ATTAQUER", pygame.font.Font(None, 36))
+        for hovered in (True, False, True):
+            button.is_hovered = hovered
+            for _ in range(80):
+                button.draw(screen)
+        self.assertLessEqual(len(button._sprites), 2 * (Button.SCALE_STEPS + 1))
+        # Survol stabilisé: le bouton a grandi de 10%
+        sprite, position = button._sprites[(True, Button.SCALE_STEPS)]
+        self.assertEqual(sprite.get_size(), (220, 66))
+        self.assertEqual(position, (90, 47))
+
+class TestPostProcess(unittest.TestCase):
+    """Tests du post-traitement plein écran"""
+
+    def setUp(self):
+        self.screen = pygame.Surface((200, 100))
+        self.post = PostProcess((200, 100))
+
+    def test_flash_sans_allocation(self):
+        """Test que le flash réutilise la même surface d'une image à l'autre"""
+        self.post.flash(WHITE, 500)
+        self.post.draw(self.screen)
+        surface = self.post._surfaces["flash"][0]
+        for _ in range(5):
+            self.post.update(1000 / FPS)
+            self.post.draw(self.screen)
+            self.assertIs(self.post._surfaces["flash"][0], surface)
+        self.assertEqual(self.screen.get_at((0, 0))[:3], WHITE)
+
+    def test_flash_anime_par_le_temps(self):
+        """Test que le flash s'estompe sur ses dix dernières images puis disparaît"""
+        self.post.flash(WHITE, 20 * 1000 / FPS)
+        self.assertEqual(self.post.alpha("flash"), 255)
+        self.post.update(15 * 1000 / FPS)
+        self.assertEqual(self.post.alpha("flash"), 127)
+        self.post.update(5 * 1000 / FPS)
+        self.assertFalse(self.post.active())
+
+    def test_fondu_au_noir_maintenu(self):
+        """Test que l'écran reste noir après un fondu au noir, jusqu'au fondu inverse"""
+        self.screen.fill(WHITE)
+        self.post.fade_out(100)
+        self.post.update(50)
+        self.assertEqual(self.post.alpha("fade"), 127)
+        self.post.update(500)
+        self.post.draw(self.screen)
+        self.assertEqual(self.screen.get_at((100, 50))[:3], BLACK)
+        self.post.fade_in(100)
+        self.assertEqual(self.post.alpha("fade"), 255)
+        self.post.update(100)
+        self.assertFalse(self.post.active())
+
+    def test_vignette(self):
+        """Test que la vignette colore les bords et laisse le centre intact"""
+        self.post.vignette(RED, 400, 255)
+        self.post.draw(self.screen)
+        self.assertEqual(self.screen.get_at((0, 0))[:3], RED)
+        self.assertEqual(self.screen.get_at((100, 50))[:3], BLACK)
+        surface = self.post._surfaces["vignette"][0]
+        self.post.update(100)
+        self.post.draw(self.screen)
+        self.assertIs(self.post._surfaces["vignette"][0], surface)
+
+    def test_teinte_et_redessin(self):
+        """Test qu'une teinte sans durée reste active et impose un redessin complet"""
+        effect_manager = EffectManager()
+        effect_manager.add_tint(GREEN, 60)
+        effect_manager.update(10000)
+        self.assertTrue(effect_manager.needs_full_redraw())
+        effect_manager.clear_tint()
+        self.assertFalse(effect_manager.needs_full_redraw())
+
+class TestBackBuffer(unittest.TestCase):
+    """Tests du tampon arrière et du tremblement d'écran"""
+
+    def setUp(self):
+        self.display = pygame.Surface((200, 100))
+        self.back_buffer = BackBuffer(self.display)
+        self.back_buffer.surface.fill(BLUE)
+
+    def test_regions_recopiees(self):
+        """Test que seules les régions modifiées sont recopiées sur l'affichage"""
+        region = pygame.Rect(10, 10, 20, 20)
+        self.assertEqual(self.back_buffer.present([region]), [region])
+        self.assertEqual(self.display.get_at((15, 15))[:3], BLUE)
+        self.assertEqual(self.display.get_at((50, 50))[:3], BLACK)
+        self.assertEqual(self.back_buffer.present([]), [])
+
+    def test_tremblement(self):
+        """Test qu'un tremblement décale tout le tampon et remplit les bords"""
+        regions = self.back_buffer.present([], offset=(5, -3))
+        self.assertEqual(regions, [self.display.get_rect()])
+        self.assertEqual(self.display.get_at((2, 50))[:3], BLACK)
+        self.assertEqual(self.display.get_at((100, 98))[:3], BLACK)
+        self.assertEqual(self.display.get_at((100, 50))[:3], BLUE)
+
+        # Fin du tremblement: le tampon est recopié une fois à sa place
+        self.assertEqual(self.back_buffer.present([], offset=(0, 0)), [self.display.get_rect()])
+        self.assertEqual(self.display.get_at((2, 98))[:3], BLUE)
+        self.assertEqual(self.back_buffer.present([]), [])
+
+    def test_tremblement_sans_rendu_complet(self):
+        """Test qu'un tremblement ne demande pas de redessiner la scène"""
+        effect_manager = EffectManager()
+        effect_manager.add_screen_shake(10)
+        self.assertFalse(effect_manager.needs_full_redraw())
+        dx, dy = effect_manager.get_screen_offset()
+        self.assertLessEqual(max(abs(dx), abs(dy)), 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour l'enregistrement et la relecture des sessions
+"""
+
+import unittest
+import contextlib
+import sys
+import os
+import tempfile
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import rng
+from replay import Enregistrement, rejouer, resume, TYPE_ACTION, TYPE_TOUCHE
+from roguelike_optimized import OptimizedRoguelike, GameState
+
+class TestEnregistrement(unittest.TestCase):
+    """Tests pour le format binaire des enregistrements"""
+
+    def test_aller_retour(self):
+        """Test que le décodage redonne exactement les événements"""
+        enregistrement = Enregistrement(2**63 + 5)
+        enregistrement.ajouter_touche(120, "up")
+        enregistrement.ajouter_action(900, "difficulty_3")
+        enregistrement.ajouter_action(900, "attack")
+        enregistrement.ajouter_action(250000, "quit")
+
+        decode = Enregistrement.decoder(enregistrement.encoder())
+        self.assertEqual(decode.seed, enregistrement.seed)
+        self.assertEqual(decode.evenements, enregistrement.evenements)
+
+    def test_compact(self):
+        """Test qu'un clic tient en quelques octets"""
+        enregistrement = Enregistrement(1)
+        taille_vide = len(enregistrement.encoder())
+        for i in range(1, 101):
+            enregistrement.ajouter_action(i * 800, "attack")
+
+        self.assertLessEqual(len(enregistrement.encoder()) - taille_vide, 300)
+
+    def test_instants_croissants(self):
+        """Test qu'un instant antérieur est refusé"""
+        enregistrement = Enregistrement(1)
+        enregistrement.ajouter_action(500, "attack")
+        with self.assertRaises(ValueError):
+            enregistrement.ajouter_action(400, "attack")
+
+    def test_difficulte_hors_limites(self):
+        """Test qu'un niveau de difficulté qui ne tient pas sur 5 bits est refusé"""
+        enregistrement = Enregistrement(1)
+        enregistrement.ajouter_action(0, "difficulty_31")
+        self.assertEqual(Enregistrement.decoder(enregistrement.encoder()).evenements,
+                         enregistrement.evenements)
+        enregistrement.ajouter_action(10, "difficulty_32")
+        with self.assertRaises(ValueError):
+            enregistrement.encoder()
+
+    def test_format_invalide(self):
+        """Test qu'un fichier étranger est refusé"""
+        with self.assertRaises(ValueError):
+            Enregistrement.decoder(b"PNG\x00" + bytes(12))
+
+    def test_fichier(self):
+        """Test de la sauvegarde et du chargement"""
+        enregistrement = Enregistrement(9, [(10, TYPE_TOUCHE, "p"), (20, TYPE_ACTION, "menu")])
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, "replays", "session.rpl")
+            enregistrement.sauvegarder(chemin)
+            self.assertEqual(Enregistrement.charger(chemin).evenements, enregistrement.evenements)
+
+class TestRelecture(unittest.TestCase):
+    """Tests pour la relecture sans affichage"""
+
+    def tearDown(self):
+        """Rend au service partagé une graine aléatoire"""
+        rng.seed()
+
+    def _jouer_session(self, seed: int) -> OptimizedRoguelike:
+        """Joue une session scriptée en enregistrant les actions"""
+        jeu = OptimizedRoguelike(headless=True, seed=seed)
+        jeu.enregistrement = Enregistrement(seed)
+        instant = [0]
+        jeu.horloge = lambda: instant[0]
+
+        with contextlib.redirect_stdout(None):
+            for touche in ["s", "e", "c", "r", "e", "t"]:
+                instant[0] += 150
+                jeu.handle_key(touche)
+            jeu.dispatch_action("difficulty_2")
+            for _ in range(60):
+                instant[0] += 600
+                if jeu.state == GameState.COMBAT:
+                    jeu.dispatch_action("attack")
+                elif jeu.state == GameState.GAME_OVER:
+                    jeu.dispatch_action("replay")
+                else:
+                    jeu.dispatch_action("continue")
+        return jeu
+
+    def test_session_reproduite(self):
+        """Test que la relecture retrouve exactement l'état final"""
+        jeu = self._jouer_session(2024)
+        enregistrement = Enregistrement.decoder(jeu.enregistrement.encoder())
+
+        self.assertEqual(resume(rejouer(enregistrement)), resume(jeu))
+
+    def test_turbo(self):
+        """Test que le mode turbo résout le combat d'un clic et se rejoue"""
+        jeu = OptimizedRoguelike(headless=True, seed=77)
+        jeu.enregistrement = Enregistrement(77)
+        jeu.horloge = lambda: 0
+        with contextlib.redirect_stdout(None):
+            jeu.dispatch_action("difficulty_3")
+            while jeu.state != GameState.COMBAT:
+                jeu.dispatch_action("continue")
+            particules = len(jeu.effect_manager.particles)
+            jeu.dispatch_action("turbo")
+
+        self.assertIn(jeu.state, (GameState.TRANSITION, GameState.GAME_OVER))
+        self.assertTrue(any(message.startswith("⏩") for message in jeu.combat_log))
+        self.assertFalse(any(message.startswith("💬") for message in jeu.combat_log))
+        self.assertEqual(jeu.combo_system.combo_count, 0)
+        # Seuls les effets de fin de combat sont ajoutés, pas ceux de chaque tour
+        self.assertLessEqual(len(jeu.effect_manager.particles) - particules, 50)
+
+        enregistrement = Enregistrement.decoder(jeu.enregistrement.encoder())
+        self.assertEqual(resume(rejouer(enregistrement)), resume(jeu))
+
+    def test_quitter(self):
+        """Test que la relecture s'arrête sur l'action quitter"""
+        enregistrement = Enregistrement(3, [(0, TYPE_ACTION, "difficulty_1"),
+                                            (10, TYPE_ACTION, "quit"),
+                                            (20, TYPE_ACTION, "menu")])
+        jeu = rejouer(enregistrement)
+        self.assertNotEqual(jeu.state, GameState.MENU)
+
+    def test_sans_fenetre(self):
+        """Test que le jeu sans affichage n'enregistre ni n'ouvre de fenêtre"""
+        jeu = OptimizedRoguelike(headless=True, seed=1)
+        self.assertIsNone(jeu.screen)
+        self.assertIsNone(jeu.enregistrement)
+        self.assertIsNone(jeu.sauvegarder_enregistrement())
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le registre partagé des ressources
+"""
+
+import gc
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import resources
+from config import *
+from resources import ResourceRegistry
+
+class Proprietaire:
+    """Objet quelconque qui possède des ressources"""
+
+class TestResourceRegistry(unittest.TestCase):
+    """Tests du chargement paresseux et du comptage des références"""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.font.init()
+
+    def setUp(self):
+        self.registry = ResourceRegistry()
+
+    def test_chargement_paresseux_et_partage(self):
+        """Test qu'une ressource est chargée une fois puis partagée"""
+        a, b = Proprietaire(), Proprietaire()
+        police = self.registry.font(20, owner=a)
+        self.assertIs(self.registry.font(20, owner=b), police)
+        self.assertIsNot(self.registry.font(30, owner=a), police)
+        self.assertEqual(self.registry.loads, 2)
+
+    def test_references_par_proprietaire(self):
+        """Test qu'un propriétaire ne compte qu'une fois et rend sa référence en disparaissant"""
+        a, b = Proprietaire(), Proprietaire()
+        cle = ('font', None, 20)
+        self.registry.font(20, owner=a)
+        self.registry.font(20, owner=a)
+        self.registry.font(20, owner=b)
+        self.assertEqual(self.registry.references(cle), 2)
+
+        del a
+        gc.collect()
+        self.assertEqual(self.registry.references(cle), 1)
+        del b
+        gc.collect()
+        self.assertNotIn(cle, self.registry)
+
+    def test_reference_explicite(self):
+        """Test des références prises et rendues sans propriétaire"""
+        cle = ('surface', 'fond', 10)
+        surface = self.registry.surface(('fond', 10), lambda: pygame.Surface((10, 10)))
+        self.assertEqual(surface.get_size(), (10, 10))
+        self.registry.release(cle)
+        self.assertNotIn(cle, self.registry)
+
+        self.registry.font(20)
+        self.registry.release_font(20)
+        self.assertEqual(self.registry.report(), [])
+
+    def test_rapport(self):
+        """Test de l'introspection des ressources chargées"""
+        a = Proprietaire()
+        self.registry.font(20, owner=a)
+        self.registry.surface(('fond', 10), lambda: pygame.Surface((10, 10)), owner=a)
+        rapport = {entree['kind']: entree for entree in self.registry.report()}
+        self.assertEqual(set(rapport), {'font', 'surface'})
+        self.assertEqual(rapport['font']['key'], (None, 20))
+        self.assertEqual(rapport['font']['references'], 1)
+        self.assertEqual(rapport['surface']['bytes'], 10 * pygame.Surface((10, 10)).get_pitch())
+
+    def test_aucune_police_pendant_une_image(self):
+        """Test que dessiner les éléments du jeu ne crée aucune police"""
+        from renderer import OptimizedRenderer
+        from roguelike_graphique_avance import HealthBar, IconTextSprite
+
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        renderer = OptimizedRenderer(screen)
+        bar = HealthBar(10, 10, 250, 25, 100)
+        sprite = IconTextSprite(10, 60, "Héros", renderer.fonts['medium'], "shield")
+        chargements = resources.resource_registry.loads
+        for _ in range(3):
+            renderer.draw_text("Score: 10", 50, 50, 'small', WHITE)
+            renderer.draw_button(500, 420, 200, 50, "ATTAQUER", GREEN)
+            bar.draw(screen)
+            sprite.draw(screen)
+        self.assertEqual(resources.resource_registry.loads, chargements)
+
+    def test_polices_partagees_entre_rendus(self):
+        """Test que deux rendus partagent les mêmes polices"""
+        from renderer import OptimizedRenderer
+
+        premier = OptimizedRenderer(pygame.Surface((10, 10)))
+        second = OptimizedRenderer(pygame.Surface((10, 10)))
+        self.assertIs(premier.fonts['small'], second.fonts['small'])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
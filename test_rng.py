@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le service de flux aléatoires
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import rng
+from rng import RNGService, ReserveAleatoire, FLUX_COMBAT, FLUX_SALLES, FLUX_EFFETS, FLUX_MESSAGES
+from effects import EffectManager
+from events import FunFeatures
+from simulation import simuler_parties, politique_attaque
+
+class TestRNGService(unittest.TestCase):
+    """Tests pour la distribution des flux"""
+
+    def test_meme_graine_memes_tirages(self):
+        """Test qu'une même graine reproduit chaque flux"""
+        service1 = RNGService(42)
+        service2 = RNGService(42)
+        tirages1 = [service1.flux(FLUX_COMBAT).randint(1, 100) for _ in range(50)]
+        tirages2 = [service2.flux(FLUX_COMBAT).randint(1, 100) for _ in range(50)]
+
+        self.assertEqual(tirages1, tirages2)
+
+    def test_flux_independants(self):
+        """Test que tirer dans un flux ne décale pas les autres"""
+        service1 = RNGService(7)
+        service2 = RNGService(7)
+        for _ in range(100):
+            service2.flux(FLUX_EFFETS).random()
+
+        self.assertEqual(service1.flux(FLUX_SALLES).random(), service2.flux(FLUX_SALLES).random())
+        self.assertNotEqual(service1.flux(FLUX_SALLES).random(), service1.flux(FLUX_COMBAT).random())
+
+    def test_reinitialisation_sur_place(self):
+        """Test que seed() réinitialise les flux déjà distribués"""
+        service = RNGService(1)
+        flux = service.flux(FLUX_COMBAT)
+        premier = flux.random()
+        service.seed(1)
+
+        self.assertIs(service.flux(FLUX_COMBAT), flux)
+        self.assertEqual(flux.random(), premier)
+
+    def test_sous_systemes_injectables(self):
+        """Test que les sous-systèmes acceptent leur propre flux"""
+        service = RNGService(3)
+        fun1 = FunFeatures(service.flux(FLUX_MESSAGES))
+        messages1 = [fun1.get_silly_message() for _ in range(10)]
+        service.seed(3)
+        fun2 = FunFeatures(service.flux(FLUX_MESSAGES))
+
+        self.assertEqual([fun2.get_silly_message() for _ in range(10)], messages1)
+
+class TestReserveAleatoire(unittest.TestCase):
+    """Tests pour les réserves NumPy pré-générées"""
+
+    def test_bornes(self):
+        """Test que les tirages respectent les bornes de random.Random"""
+        reserve = ReserveAleatoire(5, taille=64)
+        entiers = [reserve.randint(2, 5) for _ in range(1000)]
+        flottants = [reserve.uniform(-1.0, 1.0) for _ in range(1000)]
+
+        self.assertEqual(set(entiers), {2, 3, 4, 5})
+        self.assertTrue(all(-1.0 <= f < 1.0 for f in flottants))
+        self.assertIn(reserve.choice("abc"), "abc")
+
+    def test_reproductible(self):
+        """Test qu'une même graine redonne les mêmes tirages, à travers les recharges"""
+        reserve1 = ReserveAleatoire(9, taille=16)
+        reserve2 = ReserveAleatoire(9, taille=16)
+
+        self.assertEqual([reserve1.random() for _ in range(100)],
+                         [reserve2.random() for _ in range(100)])
+
+class TestReproductibilite(unittest.TestCase):
+    """Tests de reproduction des parties simulées"""
+
+    def tearDown(self):
+        """Rend au service partagé une graine aléatoire"""
+        rng.seed()
+
+    def test_partie_identique(self):
+        """Test qu'une même graine reproduit chaque partie à l'identique"""
+        self.assertEqual(simuler_parties(200, 1, seed=11), simuler_parties(200, 1, seed=11))
+
+    def test_effets_sans_influence(self):
+        """Test que les effets cosmétiques ne modifient pas le déroulement"""
+        effets = EffectManager()
+        fun = FunFeatures()
+
+        def politique_bruyante(player, room):
+            effets.add_explosion(0, 0, count=5)
+            fun.get_silly_message()
+            rng.flux(FLUX_MESSAGES).random()
+            return politique_attaque(player, room)
+
+        self.assertEqual(simuler_parties(200, 1, seed=13),
+                         simuler_parties(200, 1, politique_bruyante, seed=13))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
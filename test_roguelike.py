@@ -16,7 +16,7 @@ import pygame
 from roguelike_graphique_avance import (
     Personnage, Joueur, Ennemi, Boss, 
     Salle, SalleEnnemi, SalleBoss, SalleSoin, SalleAmelioration, SallePowerUp,
-    PowerUp, ScoreManager, GenerateurSalles, Jeu,
+    PowerUp, ScoreManager, GenerateurSalles, Jeu, GameState, GradientCache, DEGRADES_ETATS, IconDrawer,
     JOUEUR_PV_MAX, JOUEUR_ATTAQUE, ENNEMI_PV_MAX, ENNEMI_ATTAQUE,
     BOSS_PV_MAX, BOSS_ATTAQUE
 )
@@ -374,6 +374,67 @@ class TestIntegration(unittest.TestCase):
         self.assertEqual(jeu.salle_actuelle, 3)
         self.assertGreater(jeu.joueur.score, 0)
 
+class TestGradientCache(unittest.TestCase):
+    """Tests pour le cache des fonds dégradés"""
+    
+    def setUp(self):
+        """Configuration avant chaque test"""
+        self.cache = GradientCache()
+        self.size = (120, 80)
+    
+    def test_degrade_identique_aux_lignes(self):
+        """Test que le dégradé reproduit le tracé ligne par ligne"""
+        surface = self.cache.get(*DEGRADES_ETATS[GameState.MENU], self.size)
+        self.assertEqual(surface.get_size(), self.size)
+        for y in (0, 1, 40, 79):
+            color_value = int(20 + (y / 80) * 30)
+            self.assertEqual(surface.get_at((0, y))[:3], (color_value, 0, color_value))
+            self.assertEqual(surface.get_at((119, y))[:3], (color_value, 0, color_value))
+    
+    def test_cache(self):
+        """Test que chaque dégradé n'est calculé qu'une fois"""
+        degrade = DEGRADES_ETATS[GameState.COMBAT]
+        surface = self.cache.get(*degrade, self.size)
+        self.assertIs(self.cache.get(*degrade, self.size), surface)
+        self.assertIsNot(self.cache.get(*degrade, (60, 40)), surface)
+        self.assertEqual(len(self.cache.surfaces), 2)
+        self.cache.clear()
+        self.assertEqual(len(self.cache.surfaces), 0)
+    
+    def test_degrade_interpole(self):
+        """Test des dégradés paramétrés quantifiés"""
+        debut = DEGRADES_ETATS[GameState.COMBAT]
+        fin = DEGRADES_ETATS[GameState.GAME_OVER]
+        self.assertIs(self.cache.get_interpolated(debut, fin, 0.0, self.size),
+                      self.cache.get(*debut, self.size))
+        self.assertIs(self.cache.get_interpolated(debut, fin, 2.0, self.size),
+                      self.cache.get(*fin, self.size))
+        # Des paramètres voisins partagent la même surface
+        self.assertIs(self.cache.get_interpolated(debut, fin, 0.5, self.size),
+                      self.cache.get_interpolated(debut, fin, 0.51, self.size))
+        self.assertLessEqual(len(self.cache.surfaces), self.cache.steps + 1)
+
+class TestIconDrawer(unittest.TestCase):
+    """Tests pour les icônes géométriques pré-rendues"""
+    
+    def test_atlas_identique_a_la_geometrie(self):
+        """Test que chaque icône de l'atlas reproduit son tracé direct"""
+        for icon_type in IconDrawer.ICON_TYPES:
+            direct = pygame.Surface((80, 80))
+            IconDrawer.draw_icon_geometry(direct, icon_type, 40, 40, 30, (255, 255, 255))
+            copie = pygame.Surface((80, 80))
+            IconDrawer.draw_icon(copie, icon_type, 40, 40, 30, (255, 255, 255))
+            self.assertEqual(pygame.image.tobytes(direct, "RGB"), pygame.image.tobytes(copie, "RGB"), icon_type)
+    
+    def test_repli(self):
+        """Test que toutes les icônes de repli se dessinent"""
+        IconDrawer.prewarm()
+        screen = pygame.Surface((40, 40))
+        for icon_type in IconDrawer.ICON_TYPES:
+            screen.fill((0, 0, 0))
+            IconDrawer.draw_icon_fallback(screen, 10, 10, icon_type, 20, (255, 255, 0))
+            self.assertNotEqual(screen.get_bounding_rect().width, 0, icon_type)
+
 if __name__ == '__main__':
     # Initialiser Pygame pour les tests
     pygame.init()
@@ -385,7 +446,7 @@ if __name__ == '__main__':
     test_classes = [
         TestPersonnage, TestJoueur, TestEnnemi, TestBoss,
         TestPowerUp, TestSalle, TestScoreManager, 
-        TestGenerateurSalles, TestJeu, TestIntegration
+        TestGenerateurSalles, TestJeu, TestIntegration, TestGradientCache, TestIconDrawer
     ]
     
     for test_class in test_classes:
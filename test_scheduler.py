@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires du cadencement des images
+"""
+
+import time
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from config import *
+from effects import EffectManager
+from scheduler import FrameScheduler
+
+class HorlogeFactice:
+    """Horloge qui retient les cadences demandées"""
+
+    def __init__(self, dt: int = 16):
+        self.dt = dt
+        self.cadences = []
+
+    def tick(self, framerate: int = 0) -> int:
+        self.cadences.append(framerate)
+        return self.dt
+
+class TestFrameScheduler(unittest.TestCase):
+    """Tests du cadencement selon l'activité de l'écran"""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((100, 100))
+
+    def setUp(self):
+        pygame.event.clear()
+        self.horloge = HorlogeFactice()
+        self.scheduler = FrameScheduler(60, idle_wake=20, grace=2, clock=self.horloge)
+
+    def test_pleine_cadence_pendant_les_animations(self):
+        """Test qu'une animation garde la pleine cadence et laisse la file à la boucle"""
+        for _ in range(5):
+            self.assertEqual(self.scheduler.tick(True), (16, None))
+        self.assertEqual(self.horloge.cadences, [60] * 5)
+        self.assertFalse(self.scheduler.idle)
+
+    def test_repos_apres_la_grace(self):
+        """Test que l'écran immobile passe au repos après les images de grâce"""
+        for _ in range(2):
+            self.assertIsNone(self.scheduler.tick(False)[1])
+        debut = time.perf_counter()
+        dt, events = self.scheduler.tick(False)
+        self.assertTrue(self.scheduler.idle)
+        self.assertEqual(events, [])
+        # Réveil périodique sans événement
+        self.assertGreaterEqual(time.perf_counter() - debut, 0.015)
+        self.assertEqual(self.scheduler.idle_wakes, 1)
+
+    def test_reveil_sur_evenement(self):
+        """Test qu'un événement réveille la boucle et lui est rendu, dans l'ordre"""
+        for _ in range(3):
+            self.scheduler.tick(False)
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, numero=1))
+        pygame.event.post(pygame.event.Event(pygame.USEREVENT, numero=2))
+        _, events = self.scheduler.tick(False)
+        self.assertEqual([event.numero for event in events], [1, 2])
+        self.assertEqual(pygame.event.get(pygame.USEREVENT), [])
+
+    def test_dt_borne_au_reveil(self):
+        """Test que l'attente au repos ne compte pas comme du temps d'animation"""
+        self.horloge.dt = 1000
+        for _ in range(3):
+            dt, _ = self.scheduler.tick(False)
+        self.assertEqual(dt, 1000 // 60)
+
+    def test_reprise_de_la_cadence(self):
+        """Test que la pleine cadence reprend dès qu'une animation démarre"""
+        for _ in range(3):
+            self.scheduler.tick(False)
+        self.assertTrue(self.scheduler.idle)
+        self.assertIsNone(self.scheduler.tick(True)[1])
+        self.assertFalse(self.scheduler.idle)
+        self.assertEqual(self.horloge.cadences[-1], 60)
+
+class TestActivite(unittest.TestCase):
+    """Tests de la détection des animations en cours"""
+
+    def test_effets(self):
+        """Test des effets qui animent l'écran, et de ceux qui le laissent immobile"""
+        effets = EffectManager()
+        self.assertFalse(effets.is_animating())
+        effets.add_damage_effect(100, 100)
+        self.assertTrue(effets.is_animating())
+        effets.particles.clear()
+
+        effets.add_fade_out(100)
+        self.assertTrue(effets.is_animating())
+        effets.update(200)
+        # Écran noir maintenu: affiché, mais immobile
+        self.assertTrue(effets.needs_full_redraw())
+        self.assertFalse(effets.is_animating())
+
+        effets.add_tint(GREEN, 60)
+        self.assertFalse(effets.is_animating())
+        effets.add_screen_shake(3)
+        self.assertTrue(effets.is_animating())
+
+    def test_survol_des_boutons(self):
+        """Test que le survol anime un bouton jusqu'à son pas final"""
+        from roguelike_graphique_avance import Button
+
+        pygame.font.init()
+        screen = pygame.Surface((400, 200))
+        button = Button(100, 50, 200, 60, "ATTAQUER", pygame.font.Font(None, 36))
+        self.assertFalse(button.animating())
+        button.is_hovered = True
+        self.assertTrue(button.animating())
+        images = 0
+        while button.animating():
+            button.draw(screen)
+            images += 1
+        self.assertLess(images, 60)
+        self.assertEqual(button._step(button.scale), Button.SCALE_STEPS)
+
+if __name__ == '__main__':
+    unittest.main()
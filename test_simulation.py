@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Tests unitaires pour le moteur de simulation sans affichage
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import config
+from config import DIFFICULTES
+from services import GameService, HeadlessGameFactory, NullSoundManager, NullScoreManager
+from simulation import (
+    simulate, jouer_partie, politique_attaque, parametres_config,
+    ACTION_ATTAQUER, ACTION_CONTINUER, ACTION_QUITTER
+)
+from balance_sweep import (
+    construire_grille, executer_balayage, charger_resultats, intervalle_wilson
+)
+from calibration import (
+    calibrer, divisions_successives, sauvegarder_table, stats_actuelles, tirer_candidat
+)
+from entities import Boss, Enemy, EnemyRoom, charger_stats_calibrees
+from services import RoomGenerator
+import random
+
+class TestHeadlessGameFactory(unittest.TestCase):
+    """Tests pour la factory sans affichage"""
+
+    def test_services_inactifs(self):
+        """Test que la factory ne crée ni audio ni fichier de scores"""
+        factory = HeadlessGameFactory()
+        self.assertIsInstance(factory.create_sound_manager(), NullSoundManager)
+        self.assertIsInstance(factory.create_score_manager(), NullScoreManager)
+        self.assertFalse(factory.create_score_manager().ajouter_score("Test", 10, 1, 1, 0))
+
+class TestSimulation(unittest.TestCase):
+    """Tests pour la simulation de parties complètes"""
+
+    def test_jouer_partie(self):
+        """Test qu'une partie se termine avec un résultat cohérent"""
+        game_service = GameService(HeadlessGameFactory())
+        resultat = jouer_partie(game_service, 1)
+
+        self.assertTrue(game_service.is_game_over())
+        self.assertGreaterEqual(resultat['salles'], 0)
+        self.assertLessEqual(resultat['salles'], DIFFICULTES[1]['salles'])
+        self.assertEqual(resultat['victoire'], game_service.is_victory())
+
+    def test_statistiques(self):
+        """Test des statistiques agrégées"""
+        stats = simulate(200, 1, seed=42)
+
+        self.assertEqual(stats['parties'], 200)
+        self.assertGreaterEqual(stats['taux_victoire'], 0.0)
+        self.assertLessEqual(stats['taux_victoire'], 1.0)
+        self.assertEqual(sum(stats['distribution_scores'].values()), 200)
+        self.assertEqual(sum(stats['salles_traversees']['distribution'].values()), 200)
+        self.assertLessEqual(stats['score']['min'], stats['score']['max'])
+        self.assertGreater(stats['parties_par_seconde'], 0)
+
+    def test_reproductible(self):
+        """Test qu'une même graine donne les mêmes statistiques"""
+        stats1 = simulate(100, 2, seed=7)
+        stats2 = simulate(100, 2, seed=7)
+
+        self.assertEqual(stats1['score'], stats2['score'])
+        self.assertEqual(stats1['victoires'], stats2['victoires'])
+
+    def test_politique_abandon(self):
+        """Test qu'une politique peut abandonner la partie"""
+        stats = simulate(20, 1, policy=lambda player, room: ACTION_QUITTER)
+
+        self.assertEqual(stats['victoires'], 0)
+        self.assertEqual(stats['salles_traversees']['moyenne'], 0)
+
+    def test_action_invalide(self):
+        """Test qu'une action inconnue est refusée"""
+        with self.assertRaises(ValueError):
+            simulate(1, 1, policy=lambda player, room: "danser")
+
+    def test_politique_par_defaut(self):
+        """Test de la politique par défaut"""
+        from entities import EnemyRoom, HealingRoom, Player
+        player = Player()
+        self.assertEqual(politique_attaque(player, EnemyRoom(1)), ACTION_ATTAQUER)
+        self.assertEqual(politique_attaque(player, HealingRoom()), ACTION_CONTINUER)
+
+    def test_combat_automatique(self):
+        """Test qu'une politique enveloppée garde la résolution des combats d'un seul tenant"""
+        import functools
+        decisions = []
+
+        @functools.wraps(politique_attaque)
+        def politique(player, room):
+            decisions.append(room)
+            return politique_attaque(player, room)
+
+        stats = simulate(50, 1, policy=politique, seed=3)
+        self.assertTrue(all(not isinstance(room, EnemyRoom) for room in decisions))
+        self.assertEqual(stats['score'], simulate(50, 1, seed=3)['score'])
+
+        # Sans l'attribut, chaque tour de combat est décidé par la politique
+        decisions.clear()
+        simulate(5, 1, policy=lambda player, room: decisions.append(room) or politique_attaque(player, room))
+        self.assertTrue(any(isinstance(room, EnemyRoom) for room in decisions))
+
+class TestParametresConfig(unittest.TestCase):
+    """Tests pour le remplacement temporaire des constantes"""
+
+    def test_remplacement_et_restauration(self):
+        """Test que les entités lisent la config remplacée puis restaurée"""
+        from entities import Player
+        with parametres_config(JOUEUR_ATTAQUE=42):
+            self.assertEqual(Player().attaque, 42)
+        self.assertEqual(Player().attaque, config.JOUEUR_ATTAQUE)
+
+    def test_nombre_de_salles(self):
+        """Test que le nombre de salles suit DIFFICULTES"""
+        difficultes = {1: dict(DIFFICULTES[1], salles=2)}
+        with parametres_config(DIFFICULTES=difficultes):
+            stats = simulate(50, 1, seed=1)
+        self.assertLessEqual(max(stats['salles_traversees']['distribution']), 2)
+
+    def test_parametre_inconnu(self):
+        """Test qu'un paramètre absent de config.py est refusé"""
+        with self.assertRaises(ValueError):
+            with parametres_config(PARAMETRE_INEXISTANT=1):
+                pass
+
+class TestBalayage(unittest.TestCase):
+    """Tests pour le balayage d'équilibrage"""
+
+    def setUp(self):
+        """Fichier de résultats temporaire"""
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "balayage.jsonl")
+
+    def tearDown(self):
+        """Suppression du fichier de résultats"""
+        self.dossier.cleanup()
+
+    def test_grille(self):
+        """Test du produit cartésien des axes"""
+        grille = construire_grille({"JOUEUR_ATTAQUE": [15, 20], "SALLES": [3, 5, 7]})
+        self.assertEqual(len(grille), 6)
+        self.assertTrue(all(cellule['difficulte'] == 1 for cellule in grille))
+
+    def test_balayage_et_reprise(self):
+        """Test qu'un balayage interrompu reprend sans rejouer les lots faits"""
+        axes = {"JOUEUR_ATTAQUE": [15, 30]}
+        table = executer_balayage(axes, self.chemin, parties=60, taille_lot=20, workers=1)
+
+        self.assertEqual(len(table), 2)
+        self.assertTrue(all(ligne['parties'] == 60 for ligne in table))
+        faible, fort = table
+        self.assertLessEqual(faible['ic_victoire'][0], faible['taux_victoire'])
+        self.assertGreaterEqual(faible['ic_victoire'][1], faible['taux_victoire'])
+
+        # Simuler une interruption: retirer le dernier lot du fichier
+        with open(self.chemin, 'r', encoding='utf-8') as f:
+            lignes = f.readlines()
+        with open(self.chemin, 'w', encoding='utf-8') as f:
+            f.writelines(lignes[:-1])
+
+        executes = []
+        reprise = executer_balayage(axes, self.chemin, parties=60, taille_lot=20, workers=1,
+                                    progression=lambda fait, total: executes.append(total))
+        self.assertEqual(executes, [1])
+        self.assertEqual(len(charger_resultats(self.chemin)), 6)
+        self.assertEqual(reprise, table)
+
+    def test_reprise_avec_autres_parametres(self):
+        """Test qu'une reprise avec une autre graine ou d'autres lots ne fusionne pas les anciens lots"""
+        axes = {"JOUEUR_ATTAQUE": [20]}
+        executer_balayage(axes, self.chemin, parties=40, taille_lot=20, seed=1, workers=1)
+
+        executes = []
+        table = executer_balayage(axes, self.chemin, parties=40, taille_lot=20, seed=2, workers=1,
+                                  progression=lambda fait, total: executes.append(total))
+        self.assertEqual(executes, [2, 2])
+        self.assertEqual(table[0]['parties'], 40)
+        self.assertEqual(table[0]['lots'], 2)
+
+        # Lots de 10: les lots de 20 déjà faits ne sont pas comptés
+        table = executer_balayage(axes, self.chemin, parties=40, taille_lot=10, seed=2, workers=1)
+        self.assertEqual((table[0]['parties'], table[0]['lots']), (40, 4))
+
+        # La première graine retrouve ses propres lots sans rien rejouer
+        executes.clear()
+        table = executer_balayage(axes, self.chemin, parties=40, taille_lot=20, seed=1, workers=1,
+                                  progression=lambda fait, total: executes.append(total))
+        self.assertEqual(executes, [])
+        self.assertEqual(table[0]['parties'], 40)
+
+    def test_axe_invalide(self):
+        """Test qu'un axe inconnu est refusé avant de lancer les processus"""
+        with self.assertRaises(ValueError):
+            executer_balayage({"INCONNU": [1]}, self.chemin, parties=10, taille_lot=10, workers=1)
+
+    def test_intervalle_wilson(self):
+        """Test de l'intervalle de confiance de Wilson"""
+        bas, haut = intervalle_wilson(50, 100)
+        self.assertLess(bas, 0.5)
+        self.assertGreater(haut, 0.5)
+        self.assertEqual(intervalle_wilson(0, 10)[0], 0.0)
+
+class TestCalibration(unittest.TestCase):
+    """Tests pour la calibration de la difficulté"""
+
+    def setUp(self):
+        """Table calibrée vide et fichier temporaire"""
+        self.table_initiale = config.STATS_CALIBREES
+        config.STATS_CALIBREES = {}
+        self.dossier = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.dossier.name, "stats_calibrees.json")
+
+    def tearDown(self):
+        """Restauration de la table calibrée"""
+        config.STATS_CALIBREES = self.table_initiale
+        self.dossier.cleanup()
+
+    def test_divisions_successives(self):
+        """Test que les divisions successives retiennent le candidat le plus proche"""
+        candidats = [{'taux': t / 10} for t in range(10)]
+        parties_jouees = []
+
+        def jouer(candidat, parties, graine):
+            parties_jouees.append(parties)
+            return round(candidat['taux'] * parties)
+
+        resultat = divisions_successives(candidats, jouer, lambda c, taux: abs(taux - 0.42),
+                                         budget_initial=10, eta=3)
+        self.assertEqual(len(resultat), 1)
+        self.assertEqual(resultat[0]['candidat']['taux'], 0.4)
+        # 10 candidats, puis 3, puis 1: les parties s'accumulent sur les survivants
+        self.assertEqual(resultat[0]['parties'], 10 + 30 + 90)
+        self.assertEqual(len(parties_jouees), 10 + 3 + 1)
+
+        with self.assertRaises(ValueError):
+            divisions_successives([], jouer, lambda c, taux: 0.0, budget_initial=10)
+
+    def test_tirer_candidat(self):
+        """Test que les candidats restent dans les bornes et gardent la part des combats"""
+        reference = stats_actuelles(2)
+        aleatoire = random.Random(0)
+        for _ in range(50):
+            candidat = tirer_candidat(reference, 3.0, aleatoire)
+            self.assertGreaterEqual(candidat['ennemi']['pv'], 1)
+            self.assertLessEqual(candidat['boss']['attaque'], reference['boss']['attaque'] * 3 + 1)
+            probabilites = candidat['probabilites']
+            self.assertAlmostEqual(probabilites['ennemi'] + probabilites['boss'], 0.7, places=2)
+            self.assertEqual(probabilites['soin'], reference['probabilites']['soin'])
+
+    def test_table_chargee(self):
+        """Test que la table écrite est lue par Enemy, Boss et RoomGenerator"""
+        self.assertFalse(charger_stats_calibrees(self.chemin))
+        self.assertEqual(Enemy.stats(1), (config.ENNEMI_PV_MAX, config.ENNEMI_ATTAQUE))
+
+        stats = stats_actuelles(1)
+        stats['ennemi'] = {'pv': 12, 'attaque': 3}
+        stats['boss'] = {'pv': 80, 'attaque': 9}
+        stats['probabilites'] = {'ennemi': 1.0}
+        sauvegarder_table({1: {'stats': stats}}, self.chemin)
+
+        self.assertTrue(charger_stats_calibrees(self.chemin))
+        self.assertEqual(Enemy.stats(1), (12, 3))
+        self.assertEqual(Boss.stats(1), (80, 9))
+        self.assertEqual(Enemy(difficulty=1).pv_max, 12)
+        # Une difficulté absente de la table garde les facteurs par défaut
+        self.assertEqual(Enemy.stats(2), (int(config.ENNEMI_PV_MAX * 1.5), int(config.ENNEMI_ATTAQUE * 1.3)))
+        generateur = RoomGenerator(1)
+        self.assertTrue(all(isinstance(generateur.generer_salle(), EnemyRoom) for _ in range(20)))
+
+    def test_calibrer(self):
+        """Test d'une calibration réduite vers une cible facile à atteindre"""
+        resultat = calibrer(1, 0.5, candidats=6, budget_initial=20, iterations=1, seed=3)
+        self.assertEqual(resultat['cible'], 0.5)
+        self.assertGreater(resultat['parties'], 20)
+        self.assertIn('probabilites', resultat['stats'])
+        self.assertEqual(config.STATS_CALIBREES, {})
+
+        with self.assertRaises(ValueError):
+            calibrer(1, 1.5)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
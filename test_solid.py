@@ -292,6 +292,28 @@ class TestCombatSystem(unittest.TestCase):
         self.player._pv_actuels = 100
         self.enemy._pv_actuels = 0
         self.assertTrue(self.combat_system.is_combat_over(self.player, self.enemy))
+    
+    def test_resoudre_combat(self):
+        """Test de la résolution d'un combat complet en un appel"""
+        tours = self.combat_system.resoudre_combat(self.player, self.enemy)
+        
+        self.assertTrue(self.combat_system.is_combat_over(self.player, self.enemy))
+        self.assertEqual(max(0, self.enemy.pv_max - sum(degats for degats, _, _, _ in tours)),
+                         self.enemy.pv_actuels)
+        self.assertEqual(max(0, self.player.pv_max - sum(riposte for _, riposte, _, _ in tours)),
+                         self.player.pv_actuels)
+        self.assertEqual(tours[-1][2:], (self.player.pv_actuels, self.enemy.pv_actuels))
+        # Une riposte par tour où l'ennemi survit, chacune rapporte un tour de survie
+        ripostes = sum(1 for _, riposte, _, _ in tours if riposte)
+        self.assertEqual(self.player.score, ripostes * 10)
+    
+    def test_resoudre_tours_max(self):
+        """Test de la résolution limitée à quelques tours"""
+        boss = Boss(3)
+        tours = self.combat_system.resoudre_combat(self.player, boss, tours_max=2)
+        self.assertEqual(len(tours), 2)
+        self.assertFalse(self.combat_system.is_combat_over(self.player, boss))
+        self.assertEqual(self.combat_system.resoudre_combat(self.player, Enemy(1), tours_max=0), [])
 
 class TestGameService(unittest.TestCase):
     """Tests pour le service principal du jeu"""
@@ -317,6 +339,16 @@ class TestGameService(unittest.TestCase):
         self.assertIsInstance(room, IRoom)
         self.assertIsNotNone(room)
     
+    def test_salle_actuelle(self):
+        """Test des accesseurs de la partie en cours"""
+        self.assertFalse(self.game_service.is_started())
+        self.game_service.start_game(1)
+        self.assertTrue(self.game_service.is_started())
+        self.assertEqual(self.game_service.get_difficulty(), 1)
+        self.assertEqual(self.game_service.get_salle_actuelle(), 0)
+        self.game_service.generate_next_room()
+        self.assertEqual(self.game_service.get_salle_actuelle(), 1)
+    
     def test_game_over_conditions(self):
         """Test des conditions de fin de jeu"""
         self.game_service.start_game(1)